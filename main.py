@@ -17,6 +17,12 @@ PerPanel = 1
 Revision = 3
 # Unit Serial Number
 Sernum = A2208150001
+# Directory for timing telemetry traces (blank to disable)
+Telemetry =
+# Directory for profiler collapsed stack files (blank to disable)
+Profile =
+# Database file for trends of readings (blank to disable)
+Trend =
 
 """
 
@@ -34,6 +40,7 @@ import tester
 from pydispatch import dispatcher
 
 import programs
+import share
 
 
 @define
@@ -57,6 +64,9 @@ class Config:
     parameter = field(init=False)
     uut = field(init=False)
     revision = field(init=False)
+    telemetry = field(init=False)
+    profile = field(init=False)
+    trend = field(init=False)
 
     def read(self):
         """Read the config file."""
@@ -70,6 +80,9 @@ class Config:
         self.per_panel = section.getint("PerPanel", 1)
         self.parameter = section.get("Parameter", "")
         self.revision = section.get("Revision", "")
+        self.telemetry = section.get("Telemetry", "") or None
+        self.profile = section.get("Profile", "") or None
+        self.trend = section.get("Trend", "") or None
         sernum = section.get("Sernum", "A0000000001")
         self.uut = libtester.UUT.from_sernum(sernum)
         self.uut.lot.item = libtester.Item(
@@ -129,6 +142,9 @@ class Worker:
     def run(self):
         """Run the Test Program."""
         self._logger.info('Running "%s" Tester', self.config.tester_type)
+        share.telemetry.Telemetry.enable(self.config.telemetry)
+        share.profiler.Profiler.enable(self.config.profile)
+        share.trend.TrendStore.enable(self.config.trend)
         try:
             self.tst.start(self.config.tester_type, programs.PROGRAMS)
             self._logger.info('Open Program "%s"', self.config.test_program)
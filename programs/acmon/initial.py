@@ -26,6 +26,8 @@ class Initial(share.TestSequence):
         libtester.LimitPercent("Frequency", 50, 5.0, doc="AC frequency reading"),
         libtester.LimitPercent("AcCurrent", 25.0, 20.0, doc="AC current reading"),
         libtester.LimitInteger("Phase", 2, doc="AC phase reading"),
+        # ACSTATUS1 is sent every 50ms when L1+L2 current > 10A
+        libtester.LimitPercent("StatusRate", 20.0, 25.0, doc="ACSTATUS1 rate"),
     )
 
     def open(self):
@@ -55,7 +57,7 @@ class Initial(share.TestSequence):
         """Run the unit and monitor CAN packets."""
         dev["acs"].output(self.vac_set, output=True)
         self.measure(("dmm_vac1", "dmm_vac2"), timeout=5)
-        with dev["canreader"]:
+        with dev["canreader"], dev["canindex"]:
             self.measure(
                 (
                     "current1",
@@ -64,6 +66,7 @@ class Initial(share.TestSequence):
                     "frequency2",
                     "phase1",
                     "phase2",
+                    "status1_rate",
                 ),
                 timeout=5,
             )
@@ -83,9 +86,22 @@ class Devices(share.Devices):
             self[name] = devtype(self.physical_devices[phydevname])
         self["can"] = self.physical_devices["CAN"]
         self["canreader"] = tester.CANReader(self["can"])
-        self["decoder"] = share.can.PacketPropertyReader(
-            canreader=self["canreader"], decoder=share.can.ACMONStatusDecoder()
+        self["cancapture"] = share.can.PacketCapture()
+        self["canindex"] = share.can.PacketIndex(
+            self["canreader"], capture=self["cancapture"]
         )
+        self["status1_timing"] = share.can.PacketRateReader(
+            self["cancapture"], share.can.setec_rvc.DGN.ACSTATUS1.value, window=1.0
+        )
+        # Both status readers merge their packets into one decoder
+        decoder = share.can.ACMONStatusDecoder()
+        for name, dgn in (
+            ("status1", share.can.setec_rvc.DGN.ACSTATUS1),
+            ("status3", share.can.setec_rvc.DGN.ACSTATUS3),
+        ):
+            self[name] = share.can.IndexedPropertyReader(
+                self["canindex"], decoder, dgn.value, max_age=2.0
+            )
 
     def run(self):
         """Test run is starting."""
@@ -123,13 +139,16 @@ class Sensors(share.Sensors):
             share.programmer.JFlashProject.projectfile("r7fa2l1a9"),
             pathlib.Path(__file__).parent / self.sw_image,
         )
-        dec = self.devices["decoder"]
-        self["current1"] = sensor.Keyed(dec, "S1L1_current")
-        self["current2"] = sensor.Keyed(dec, "S1L2_current")
-        self["frequency1"] = sensor.Keyed(dec, "S1L1_frequency")
-        self["frequency2"] = sensor.Keyed(dec, "S1L2_frequency")
-        self["phase1"] = sensor.Keyed(dec, "S3L1_phase")
-        self["phase2"] = sensor.Keyed(dec, "S3L2_phase")
+        status1 = self.devices["status1"]
+        status3 = self.devices["status3"]
+        self["current1"] = sensor.Keyed(status1, "S1L1_current")
+        self["current2"] = sensor.Keyed(status1, "S1L2_current")
+        self["frequency1"] = sensor.Keyed(status1, "S1L1_frequency")
+        self["frequency2"] = sensor.Keyed(status1, "S1L2_frequency")
+        self["phase1"] = sensor.Keyed(status3, "S3L1_phase")
+        self["phase2"] = sensor.Keyed(status3, "S3L2_phase")
+        self["status1_rate"] = sensor.Keyed(self.devices["status1_timing"], "rate")
+        self["status1_rate"].doc = "ACSTATUS1 packets per second"
 
 
 class Measurements(share.Measurements):
@@ -151,5 +170,6 @@ class Measurements(share.Measurements):
                 ("frequency2", "Frequency", "frequency2", "Phase 2 frequency"),
                 ("phase1", "Phase", "phase1", "Phase 1"),
                 ("phase2", "Phase", "phase2", "Phase 2"),
+                ("status1_rate", "StatusRate", "status1_rate", "ACSTATUS1 rate"),
             )
         )
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd
+"""MSP430 Bootstrap Loader programming session."""
+
+import io
+import logging
+import pathlib
+
+from attrs import define, field
+
+from . import tosbsl
+
+
+@define
+class BSL:
+    """Program a MSP430 in one Bootstrap Loader session.
+
+    The oscillator calibration data is read, the Flash is mass erased,
+    then the calibration data and the firmware image are programmed and
+    verified, all without closing the serial port.
+
+    """
+
+    port = field()  # Serial port name
+    image = field(converter=pathlib.Path)  # TI Text format firmware image
+    # TI Text format password (the top 32 bytes of Flash), or None for an
+    # unprogrammed device
+    password = field(default=None)
+    # Baud rate to use after BSL startup (the fastest in the BSL tables)
+    baudrate = field(default=38400)
+    # Bytes per BSL frame (the largest multiple of 16 in a frame)
+    block_size = field(default=240)
+    # Oscillator calibration data in Information Flash
+    calibration_address = 0x10C0
+    calibration_size = 64
+    # Baud rate of the ROM BSL after a reset
+    rom_baudrate = 9600
+    _logger = field(init=False)
+
+    @_logger.default
+    def _logger_default(self):
+        return logging.getLogger(".".join((__name__, self.__class__.__name__)))
+
+    def program(self):
+        """Program the device.
+
+        @return Calibration data (bytes)
+
+        """
+        firmware = tosbsl.Memory()
+        with self.image.open("rb") as fin:
+            firmware.loadTIText(fin)
+        bsl = tosbsl.BootStrapLoader()
+        bsl.slowmode = 1
+        bsl.MAXDATA = bsl.maxData = self.block_size
+        if self.password:
+            bsl.passwd = _memory(self.password).getMemrange(0xFFE0, 0xFFFF)
+        bsl.comInit(self.port)
+        try:
+            self._start(bsl, reset=True)
+            calibration = bytes(
+                bsl.uploadData(self.calibration_address, self.calibration_size)
+            )
+            self._logger.info(
+                "Calibration @%04x: %s", self.calibration_address, calibration.hex()
+            )
+            # Mass erase resets the device back into the ROM BSL
+            bsl.serialport.baudrate = self.rom_baudrate
+            bsl.actionMassErase()
+            self._start(bsl, reset=False)
+            segments = [
+                tosbsl.Segment(self.calibration_address, calibration.decode("latin-1"))
+            ] + firmware.segments
+            bsl.programData(segments, bsl.ACTION_PROGRAM)
+            self._verify(bsl, segments)
+        finally:
+            bsl.comDone()
+        return calibration
+
+    def _start(self, bsl, reset):
+        """Start the BSL, and change to the fast baud rate.
+
+        @param bsl tosbsl.BootStrapLoader instance
+        @param reset True to reset the device into the BSL first
+
+        """
+        bsl.actionStartBSL(
+            usepatch=1, mayuseBSL=1, speed=self.baudrate, bslreset=int(reset)
+        )
+
+    def _verify(self, bsl, segments):
+        """Read back and compare programmed data.
+
+        @param bsl tosbsl.BootStrapLoader instance
+        @param segments List of tosbsl.Segment
+
+        """
+        for seg in segments:
+            wanted = tosbsl.asBinary(seg.data)
+            actual = bsl.uploadData(seg.startaddress, len(wanted))[: len(wanted)]
+            if actual != wanted:
+                offset = next(
+                    (i for i, (a, b) in enumerate(zip(actual, wanted)) if a != b),
+                    min(len(actual), len(wanted)),
+                )
+                raise tosbsl.BSLException(
+                    "Verification failed at 0x{0:04x}".format(seg.startaddress + offset)
+                )
+
+
+def _memory(text):
+    """Parse TI Text format data.
+
+    @param text TI Text format string
+    @return tosbsl.Memory instance
+
+    """
+    memory = tosbsl.Memory()
+    memory.loadTIText(io.BytesIO(text.encode()))
+    return memory
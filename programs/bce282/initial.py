@@ -2,9 +2,7 @@
 # Copyright 2017 SETEC Pty Ltd
 """BCE282-12/24 Initial Test Program."""
 
-import os
 import pathlib
-import sys
 import time
 
 import libtester
@@ -12,27 +10,12 @@ import serial
 import tester
 
 import share
-from . import console
-from . import tosbsl
+from . import bsl, console, tosbsl
 
 
 class Initial(share.TestSequence):
     """BCE282-12/24 Initial Test Program."""
 
-    # Calibration data save file (TI Text format)
-    msp_savefile = pathlib.Path(
-        {  # Must be writable by the tester login
-            "posix": "/home/setec/testdata/bslsavedata.txt",
-            "nt": "C:/TestGear/TestData/bslsavedata.txt",
-        }[os.name]
-    )
-    # Password data save file
-    msp_password = pathlib.Path(
-        {  # Must be writable by the tester login
-            "posix": "/home/setec/testdata/bslpassword.txt",
-            "nt": "C:/TestGear/TestData/bslpassword.txt",
-        }[os.name]
-    )
     # TI Text format firmware image
     _hexfile = "bce282_4a.txt"
     # Factor to tighten the calibration check
@@ -147,66 +130,22 @@ class Initial(share.TestSequence):
         is essential that these values be saved and restored.
 
         """
-        # Get any existing password & write to MSP_PASSWORD file
+        # Get any existing password
         with dev["msp"] as msp:
             msp.measurement_fail_on_error = False
             password = None
             try:  # Fails if device has never been programmed
                 password = "@ffe0\n{0}\nq\n".format(msp["PASSWD"])
-                with self.msp_password.open("w") as fout:
-                    fout.write(password)
             except share.console.Error:
                 pass
             finally:
                 msp.measurement_fail_on_error = True
         with dev["rla_prog"]:
-            # BSL serial port for programming MSP430
-            bsl_port = self.port("BSL")
-            # STEP 1 - SAVE INTERNAL CALIBRATION
-            sys.argv = (
-                [
-                    "",
-                    "--comport={0}".format(bsl_port),
-                    "--slow",
-                ]
-                + (
-                    [
-                        "-P",
-                        str(self.msp_password),
-                    ]
-                    if password
-                    else []
-                )
-                + [
-                    "--upload=0x10C0",
-                    "--size=64",
-                    "--ti",
-                ]
-            )
-            tosbsl.main()
-            # Write TI Text format calibration data to a file for use later
-            with self.msp_savefile.open("w") as fout:
-                for aline in tosbsl.SAVEDATA:
-                    fout.write(aline + "\n")
-            # STEP 2 - ERASE & RESTORE INTERNAL CALIBRATION
-            sys.argv = [
-                "",
-                "--comport={0}".format(bsl_port),
-                "--slow",
-                "--masserase",
-                "--program",
-                str(self.msp_savefile),
-            ]
-            tosbsl.main()
-            # STEP 3 - PROGRAM
-            sys.argv = [
-                "",
-                "--comport={0}".format(bsl_port),
-                "--slow",
-                "--program",
-                str(pathlib.Path(__file__).parent / self._hexfile),
-            ]
-            tosbsl.main()
+            bsl.BSL(
+                self.port("BSL"),
+                pathlib.Path(__file__).parent / self._hexfile,
+                password,
+            ).program()
 
     @share.teststep
     def _step_power_up(self, dev, mes):
@@ -1540,7 +1540,10 @@ class BootStrapLoader(LowLevel):
             self.BSL_CHANGEBAUD, a, l  # Command: change baudrate
         )  # args are coded in adr and len
         time.sleep(0.010)  # recomended delay
-        self.serialport.setBaudrate(baudrate)
+        # Start SETEC modification
+        #   pyserial 3 has no setBaudrate()
+        self.serialport.baudrate = baudrate
+        # End SETEC modification
 
     def actionReadBSLVersion(self):
         """informational output of BSL version number.
@@ -103,6 +103,16 @@ class Final(share.TestSequence):
 class Devices(share.Devices):
     """Devices."""
 
+    safe_state = (
+        (("acsource", "reset"), ("dcs_10Vfixture", "output", 0.0, False)),
+        # Discharge the unit
+        (
+            ("dcl_Vout", "output", 5.0, {"delay": 0.5}),
+            ("dcl_Vout", "output", 0.0, False),
+        ),
+        (("dcl_Vbat", "output", 0.0, False),),
+    )
+
     def open(self):
         """Create all Instruments."""
         # Physical Instrument based devices
@@ -115,14 +125,6 @@ class Devices(share.Devices):
         ):
             self[name] = devtype(self.physical_devices[phydevname])
 
-    def reset(self):
-        """Reset instruments."""
-        self["acsource"].reset()
-        self["dcs_10Vfixture"].output(0.0, output=False)
-        self["dcl_Vout"].output(5.0, delay=0.5)
-        for dcl in ("dcl_Vout", "dcl_Vbat"):
-            self[dcl].output(0.0, False)
-
 
 class Sensors(share.Sensors):
     """Sensors."""
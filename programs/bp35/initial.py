@@ -334,6 +334,7 @@ class Devices(share.Devices):
     """Devices."""
 
     arm_image = None  # ARM software image
+    cache_state = True
 
     def open(self):
         """Create all Instruments."""
@@ -394,6 +395,7 @@ class Devices(share.Devices):
 
     def reset(self):
         """Reset instruments."""
+        super().reset()  # Forget the cached instrument state
         self["bp35"].close()
         self["bp35tunnel"].close()
         self["PmTimer"].stop()
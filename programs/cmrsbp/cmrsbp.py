@@ -28,17 +28,20 @@ Here is a sample CMR transmission from CMR-SBP-8-D-NiMH:
 
 """
 
-import sys
-import re
-import threading
-import queue
 import logging
-
-import share
+import threading
+import time
 
 
 class CmrSbp:
-    """CMR Monitor."""
+    """CMR Monitor.
+
+    A worker thread splits the serial data into lines, and parses each
+    "#NAME,VALUE" line into the data block being received.
+    Each complete block (BATTERY MODE to SERIAL NUMBER) replaces the
+    snapshot of data given by read().
+
+    """
 
     _datamap = {
         "BATTERY MODE": (0, int),
@@ -61,9 +64,15 @@ class CmrSbp:
         "ROTARY SWITCH READING": (0, int),
         "SERIAL NUMBER": (0, int),
     }
-
-    # RegExp object to match the CMR data lines
-    _regexp = re.compile(r"^#([A-Z ]+),([0-9\.\-]+)$")
+    # Line parsers {b"NAME": (key, datatype)}
+    _parsers = {
+        name.encode(): (name, datatype) for name, (_, datatype) in _datamap.items()
+    }
+    # Names of the first and last lines of a data block
+    _block_first = b"BATTERY MODE"
+    _block_last = b"SERIAL NUMBER"
+    # Maximum time for read() to wait for a new data block
+    read_timeout = 20.0
 
     def __init__(self, port, data_timeout=1.0):
         """Define our data, and start the worker.
@@ -74,118 +83,118 @@ class CmrSbp:
         """
         self._logger = logging.getLogger(".".join((__name__, self.__class__.__name__)))
         self.port = port
-        self.resultq = queue.Queue()
-        self._evt_read = threading.Event()
-        self._evt_close = threading.Event()
-        self._worker = threading.Thread(
-            target=self.worker, name="ListenerThread", args=(data_timeout,)
-        )
+        self.data_timeout = data_timeout
+        self._template = {key: value[0] for key, value in self._datamap.items()}
+        self._cond = threading.Condition()
+        self._snapshot = {}  # Data of the last complete block
+        self._snapshot_time = 0.0  # time.monotonic() of the last block
+        self._snapshot_start = 0  # Value of _starts for the last block
+        self._starts = 0  # Number of blocks started
+        self._closing = False
+        self._worker = threading.Thread(target=self.worker, name="ListenerThread")
         self._worker.start()
 
-    def _scan_line(self, line, tdata):
+    def _scan_line(self, buf, view, start, end, block):
         """Scan a line, looking for data.
 
-        @return Key, if found, or None
+        @param buf bytearray of received data
+        @param view memoryview of buf
+        @param start Index of the start of the line
+        @param end Index of the end of the line
+        @param block Dictionary of the data block being received, or None
+        @return Dictionary of the data block being received, or None
 
         """
-        self._logger.debug("Line %s", line)
-        match = self._regexp.match(line)
-        if match:
-            key, val = match.groups()
-            datatype = self._datamap[key][1]
-            tdata[key] = datatype(val)
-        else:
-            key = None
-        return key
-
-    def worker(self, data_timeout):
+        if end > start and buf[end - 1] == 0x0D:  # Drop a trailing '\r'
+            end -= 1
+        comma = buf.find(b",", start, end)
+        if comma < 0 or not buf.startswith(b"#", start, end):
+            return block
+        name = bytes(view[start + 1 : comma])
+        parser = self._parsers.get(name)
+        if not parser:
+            return block
+        key, datatype = parser
+        try:
+            value = datatype(view[comma + 1 : end])
+        except ValueError:
+            return block
+        self._logger.debug("Line %s,%s", key, value)
+        if name == self._block_first:
+            self._logger.debug("Start data block")
+            block = {}
+            with self._cond:
+                self._starts += 1
+        if block is not None:
+            block[key] = value
+            if name == self._block_last:
+                self._logger.debug("End data block")
+                with self._cond:
+                    self._snapshot = {**self._template, **block}
+                    self._snapshot_time = time.monotonic()
+                    self._snapshot_start = self._starts
+                    self._cond.notify_all()
+                block = None
+        return block
+
+    def worker(self):
         """Worker to listen to a CMR."""
         self._logger.info("Started")
-        err = ""
-        run = False
         try:
             self.port.reset_input_buffer()
-            data_template = {}
-            for parameter in iter(self._datamap):
-                data_template[parameter] = self._datamap[parameter][0]
-            tdata = share.TimedStore(data_template, data_timeout)
-            tdata.start()
-            run = True
-        except Exception:
-            err = " ".join(
-                ("_cmr Error:", str(sys.exc_info()[0]), str(sys.exc_info()[1]))
-            )
-            self._logger.warning(err)
-        buf = ""
-        state = 0
-        # Data reader states:
-        #  0 = idle
-        #  3 = waiting for data start
-        #  2 = waiting for data end
-        #  1 = data ready
-        timeup = threading.Event()
-        while run:
-            rawdata = self.port.read(512).decode(errors="ignore")
-            buf += rawdata.replace("\r", "")
-            pos = buf.find("\n")
-            while pos >= 0:
-                line, buf = buf[:pos], buf[pos + 1 :]
-                if len(line) > 0:
-                    key = self._scan_line(line, tdata)
-                    if state == 3 and key == "BATTERY MODE":
-                        self._logger.debug("Start data block")
-                        state = 2
-                    if state == 2 and key == "SERIAL NUMBER":
-                        self._logger.debug("End data block")
-                        state = 1
-                pos = buf.find("\n")
-            if self._evt_read.is_set():
-                self._evt_read.clear()
-                self._logger.debug("Starting data read")
-                state = 3
-                timeup.clear()
-                tmr = threading.Timer(20.0, timeup.set)
-                tmr.start()
-            if self._evt_close.is_set():
-                run = False
-                if state > 0:
-                    tmr.cancel()
-                    tmr.join()
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.warning("_cmr Error: %s", exc)
+            return
+        buf = bytearray()
+        block = None
+        while not self._closing:
+            rawdata = self.port.read(512)
+            if not rawdata:
                 continue
-            if state == 1:
-                tmr.cancel()
-                state = 0
-                self._logger.debug("Data read completed")
-                self.resultq.put(tdata.data)  # this will be valid data
-            if state > 0 and timeup.is_set():
-                state = 0
-                self._logger.debug("Data read timeout")
-                self.resultq.put(tdata.data)  # this will be empty data
-        try:
-            tdata.stop()
-        except Exception:
-            pass
+            buf += rawdata
+            start = 0
+            with memoryview(buf) as view:
+                end = buf.find(b"\n")
+                while end >= 0:
+                    block = self._scan_line(buf, view, start, end, block)
+                    start = end + 1
+                    end = buf.find(b"\n", start)
+            del buf[:start]  # Keep any partial line
         self._logger.info("Finished!")
 
     def read(self):
         """Return status data.
 
-        The worker thread will send data in response to a 'READ' event.
+        Wait for a data block that starts after this call.
+        Upon timeout, the last block is used if it is less than
+        'data_timeout' old, otherwise default values are used.
+
+        @return Dictionary of data
 
         """
         self._logger.debug("Read")
-        self._evt_read.set()
-        data = self.resultq.get()
-        self.resultq.task_done()
-        return data
+        with self._cond:
+            target = self._starts + 1
+            done = self._cond.wait_for(
+                lambda: self._snapshot_start >= target or self._closing,
+                self.read_timeout,
+            )
+            if done and not self._closing:
+                self._logger.debug("Data read completed")
+                return dict(self._snapshot)
+            self._logger.debug("Data read timeout")
+            if (
+                self._snapshot
+                and time.monotonic() - self._snapshot_time < self.data_timeout
+            ):
+                return dict(self._snapshot)
+            return dict(self._template)
 
     def close(self):
-        """Signal the worker thread to shutdown.
-
-        The worker thread will shut down in response to a 'CLOSE' event.
-
-        """
+        """Signal the worker thread to shutdown."""
         self._logger.debug("Close")
-        self._evt_close.set()
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
         self._worker.join()
         self.port.close()
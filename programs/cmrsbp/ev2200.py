@@ -10,6 +10,8 @@ Refer to EV2200 Evaluation Board data.
 
 """
 
+import ast
+import functools
 import logging
 import struct
 import string
@@ -24,12 +26,22 @@ class EV2200:
     # BQ2060A ADC reading cycle time
     # "2.0-2.5s, with an occasional extra 0.5s delay"
     adc_delay = 3.0
+    # Poll interval while waiting for a BQ2060A ADC conversion
+    adc_poll = 0.1
+    # BQ2060A RAM registers updated by each ADC conversion
+    adc_registers = ("Voltage", "Current", "InvOffset[MSB]")
     # Time for EEPROM power-up by BQ2060A "900ms"
     ee_powerup_delay = 0.9
     # Manufacturer code to connect SMBus through to I2C
     ee_access_code = 0x606
     # Time to wait after write to EEPROM "10ms"
     ee_write_delay = 0.01
+    # EEPROM size in bytes
+    ee_size = 128
+    # Number of times to retry EEPROM writes that fail to verify
+    ee_write_retries = 2
+    # Maximum number of command blocks sent back-to-back
+    cmd_chunk = 8
     # Max time to wait for  'Monitor' change, units of about 10ms
     cali_maxreads = 500
     # Number of VFC 'Monitor' changes to use
@@ -115,13 +127,19 @@ class EV2200:
         self._logger = logging.getLogger(".".join((__name__, self.__class__.__name__)))
         self._logger.info("Started")
         self.port = serport
+        self.adc_intervals = []  # ADC conversion intervals seen (sec)
+        self._adc_time = None  # time.monotonic() of the last ADC conversion
+        # Known EEPROM contents of the connected unit {address: word}
+        self._ee_image = {}
 
     def open(self):
         """Open my port."""
+        self._ee_image.clear()
         self.port.open()
 
     def close(self):
         """Close my port."""
+        self._ee_image.clear()
         self.port.close()
 
     def read_vit(self):
@@ -157,28 +175,29 @@ class EV2200:
         @return Dictionary of readings:
                     'PreVoltage',  'PreFSV',  'PreOff'
                     'PostVoltage', 'PostFSV', 'PostOff'
+                    'AdcIntervals'
 
         """
         self._logger.debug("Voltage = %s", voltage)
         voltage *= 1000  # convert to mVolt
         self._ee_dump()
+        self._adc_reset()
         # Dictionary of readings to return
         readings = {}
-        # Read LLE and save the MSB
-        lle = self._ram_read("LightLoadEst[MSB]")
+        # Read LLE, ADC Offset & ADC Voltage Gain Factor
+        lle, adc_off, fsv = self._ram_read_many(
+            ("LightLoadEst[MSB]", "AdcOffset[LSB]", "AdcVoltGain")
+        )
+        # Save the LLE MSB
         lle_msb = lle & 0xFF00
         self._logger.debug("lle_msb = %s", lle_msb)
         # Write back LLE with MSB zeroed
         self._ram_write("LightLoadEst[MSB]", lle & 0xFF)
-        # Read ADC Offset
-        adc_off = self._ram_read("AdcOffset[LSB]")
         adc_off_msb = adc_off & 0xFF00
         self._logger.debug("adc_off_msb = %s", adc_off_msb)
         adc_off_lsb = adc_off & 0xFF
         adc_off_lsb = self._signed8bit(adc_off_lsb)
         self._logger.debug("adc_off_lsb = %s", adc_off_lsb)
-        # Read ADC Voltage Gain Factor
-        fsv = self._ram_read("AdcVoltGain")
         readings["PreFSV"] = fsv
         self._logger.debug("fsv = %s", fsv)
         # Sanity check the calibration values
@@ -189,18 +208,18 @@ class EV2200:
             or (adc_off_lsb > self.voff_max)
         ):
             raise Ev2200Error("Voltage calibration out of range")
-        # Read and average some samples,
-        #   self.adc_delays apart (Voltage, Offset)
+        # Read and average some samples from successive ADC conversions
         volt = inv_off = 0
         samples = 3
+        adc = self._adc_read()
         for num in range(samples):
-            volt_raw = self._ram_read("Voltage")
+            if num:
+                adc = self._adc_wait(adc)
+            volt_raw = adc["Voltage"]
             volt += volt_raw
             self._logger.debug("Voltage sample = %s", float(volt_raw) / 1000)
-            i = (self._ram_read("InvOffset[MSB]") & 0xFF00) >> 8
+            i = (adc["InvOffset[MSB]"] & 0xFF00) >> 8
             inv_off += self._signed8bit(i)
-            if num < (samples - 1):
-                time.sleep(self.adc_delay)
         volt /= samples  # mVolt
         readings["PreVoltage"] = float(volt) / 1000  # Volt
         self._logger.debug("Voltage = %s", float(volt) / 1000)
@@ -218,26 +237,25 @@ class EV2200:
         # Read & Restore LLE MSB
         lle = self._ram_read("LightLoadEst[MSB]")
         lle = (lle & 0xFF) | lle_msb
-        # Write back LLE with MSB restored
-        self._ram_write("LightLoadEst[MSB]", lle)
-        # Write Calibration to RAM
-        self._ram_write("AdcOffset[LSB]", new_off)
-        self._ram_write("AdcVoltGain", new_fsv)
+        # Write back LLE with MSB restored, and Calibration to RAM
+        self._ram_write_many(
+            (
+                ("LightLoadEst[MSB]", lle),
+                ("AdcOffset[LSB]", new_off),
+                ("AdcVoltGain", new_fsv),
+            )
+        )
         if self.write_ee_at_cal:
             # Write Calibration to EEPROM
             self._ee_write(
                 (("EE-AdcOffset[LSB]", new_off), ("EE-AdcVoltGain", new_fsv))
             )
-        # Allow time for the new values to take effect
-        time.sleep(self.adc_delay)
-        # The BQ2060 seems to need about 1sec after the 1st read
-        # for the read voltage to change
-        # Here we do a dummy read...
-        self._ram_read("Voltage")
-        time.sleep(self.adc_delay)
-        # Read Post-Calibration voltage reading
-        readings["PostVoltage"] = float(self._ram_read("Voltage")) / 1000  # Volt
+        # The new values take effect from the 2nd ADC conversion
+        adc = self._adc_wait(count=2)
+        # Post-Calibration voltage reading
+        readings["PostVoltage"] = float(adc["Voltage"]) / 1000  # Volt
         self._logger.debug("Voltage = %s", readings["PostVoltage"])
+        readings["AdcIntervals"] = tuple(self.adc_intervals)
         return readings
 
     def cal_i(self, current):
@@ -246,33 +264,35 @@ class EV2200:
         @param current Actual current measured externally (Amp)
 
         @return Dictionary of readings:
-                    'PreCurrent',  'PostCurrent', 'Elapsed'
+                    'PreCurrent',  'PostCurrent', 'Elapsed', 'AdcIntervals'
 
         """
         self._logger.debug("Actual Current = %s", current)
         current *= 1000  # convert to mAmp
         self._board_status()
+        self._adc_reset()
         # Dictionary of readings to return
         readings = {}
         # Prepare
         self._ram_write("RemCapacity", 1000)
-        adc_srg = self._ram_read("AdcResGain")
+        adc_srg, vfc_srg = self._ram_read_many(("AdcResGain", "VfcResGain"))
         self._logger.debug("adc_srg = %s", adc_srg)
-        vfc_srg = self._signed16bit(self._ram_read("VfcResGain"))
+        vfc_srg = self._signed16bit(vfc_srg)
         self._logger.debug("vfc_srg = %s", vfc_srg)
-        # Read and average some samples, self.adc_delays apart (Current)
+        # Read and average some samples from successive ADC conversions
         curr = 0
         samples = 3
+        adc = self._adc_read()
         for _ in range(samples):
-            time.sleep(self.adc_delay)
-            curr += self._ram_read("Current")
+            adc = self._adc_wait(adc)
+            curr += adc["Current"]
         curr /= samples  # mAmp
         curr = self._signed16bit(int(curr))
         readings["PreCurrent"] = float(curr) / 1000  # Amp
         self._logger.debug("BQ Current = %s", readings["PreCurrent"])
         # SRG Init
         self._ram_write("VfcResGain", 1)
-        time.sleep(self.adc_delay)
+        self._adc_wait()
         # Read monitor value and wait for it to change
         mon = self._ram_read("Monitor")
         nextmon = mon
@@ -318,23 +338,18 @@ class EV2200:
         ):
             raise Ev2200Error("Current/VFC calibration out of range")
         # Write Calibration to RAM
-        self._ram_write("AdcResGain", new_adc_srg)
-        self._ram_write("VfcResGain", new_vfc_srg)
+        self._ram_write_many((("AdcResGain", new_adc_srg), ("VfcResGain", new_vfc_srg)))
         if self.write_ee_at_cal:  # Write Calibration to EEPROM
             self._ee_write(
                 (("EE-AdcResGain", new_adc_srg), ("EE-VfcResGain", new_vfc_srg))
             )
-        # Allow time for the new values to take effect
-        time.sleep(self.adc_delay)
-        # The BQ2060 seems to need about 1sec after the 1st read for the
-        # read voltage to change. Here we do a dummy read...
-        self._ram_read("Current")
-        time.sleep(self.adc_delay)
-        # Read Post-Calibration current reading
-        curr = self._ram_read("Current")
-        curr = self._signed16bit(curr)
+        # The new values take effect from the 2nd ADC conversion
+        adc = self._adc_wait(count=2)
+        # Post-Calibration current reading
+        curr = self._signed16bit(adc["Current"])
         readings["PostCurrent"] = float(curr) / 1000  # Amp
         self._logger.debug("Current = %s", readings["PostCurrent"])
+        readings["AdcIntervals"] = tuple(self.adc_intervals)
         return readings
 
     def sn_date(self, datecode, serialno):
@@ -369,8 +384,8 @@ class EV2200:
         self._ram_write("ManufDate", dcword)
         self._ram_write("SerialNo", sncode)
         # Write Calibration to EEPROM
-        self._ee_write((("EE-ManufDate", dcword), ("EE-SerialNo", sncode)))
-        return {"Retries": 0}
+        retries = self._ee_write((("EE-ManufDate", dcword), ("EE-SerialNo", sncode)))
+        return {"Retries": retries}
 
     def _ee_dump(self):
         """Dump all values from EEPROM.
@@ -381,19 +396,13 @@ class EV2200:
 
         """
         self._board_status()
-        # Select the EEPROM
         self._logger.debug("Dumping EEPROM")
-        self._ev_cmd("WrSMBusWordPEC", "ManufAccess", self.ee_access_code)
-        time.sleep(self.ee_powerup_delay)
-        self._ev_cmd("SetSMBusSlave", "SetEE")
-        # Read EEPROM value(s)
+        self._ee_select()
+        words = self._ee_read_words(range(0, self.ee_size, 2))
+        self._ee_deselect()
         vals = ()
-        for ptr in range(0, 128, 2):
-            val = self._ev_cmd("RdSMBusWord", bytes((ptr,)))
-            vals += (val[1],)
-            vals += (val[2],)
-        # Select BQ2060
-        self._ev_cmd("SetSMBusSlave", "SetBQ")
+        for word in words:
+            vals += (word & 0xFF, word >> 8)
         self._board_status()
         # Show a pretty display on the console
         for i in range(8):
@@ -428,21 +437,18 @@ class EV2200:
     def _ee_wipe(self):
         """Wipe the entire EEPROM by writing to 0xFF."""
         self._logger.debug("Erasing EEPROM")
-        self._ev_cmd("WrSMBusWordPEC", "ManufAccess", self.ee_access_code)
-        time.sleep(self.ee_powerup_delay)
-        self._ev_cmd("SetSMBusSlave", "SetEE")
-        for ptr in range(0, 128, 2):
-            adr = bytes((ptr,))
-            self._ev_cmd("WrSMBusWord", adr, 0xFFFF)
+        self._ee_select()
+        for ptr in range(0, self.ee_size, 2):
+            self._ev_cmd("WrSMBusWord", bytes((ptr,)), 0xFFFF)
+            self._ee_image.pop(ptr, None)
             # Only delay at the end of each 8-byte page
             if (ptr > 0) and ((ptr + 2) % 8) == 0:
                 time.sleep(self.ee_write_delay)
-            check = self._ev_cmd("RdSMBusWord", adr)
-            check = (check[2] << 8) | check[1]
+        addresses = range(0, self.ee_size, 2)
+        for ptr, check in zip(addresses, self._ee_read_words(addresses)):
             if check != 0xFFFF:
-                print("Verify error at", str(adr), str(check))
-        # Select BQ2060
-        self._ev_cmd("SetSMBusSlave", "SetBQ")
+                print("Verify error at", str(bytes((ptr,))), str(check))
+        self._ee_deselect()
 
     def _board_status(self):
         """Use EV2200 Echo command to detect EV2200.
@@ -469,6 +475,69 @@ class EV2200:
         data = (val[2] << 8) | val[1]
         return data
 
+    def _ram_read_many(self, subcmds):
+        """Read values from BQ2060 RAM using back-to-back commands.
+
+        @param subcmds Iterable of addresses
+
+        @return Tuple of 16-bit integer values
+
+        """
+        return tuple(
+            (val[2] << 8) | val[1]
+            for val in self._ev_cmds(
+                ("RdSMBusWordPEC", subcmd, 0) for subcmd in subcmds
+            )
+        )
+
+    def _adc_reset(self):
+        """Forget the ADC conversions seen."""
+        self.adc_intervals = []
+        self._adc_time = None
+
+    def _adc_read(self):
+        """Read the BQ2060 ADC result registers.
+
+        @return Dictionary of 16-bit integer values by register name
+
+        """
+        return dict(zip(self.adc_registers, self._ram_read_many(self.adc_registers)))
+
+    def _adc_wait(self, adc=None, count=1):
+        """Wait for fresh BQ2060 ADC conversions.
+
+        The ADC result registers ('adc_registers') are polled until any of
+        them change. If nothing changes within 'adc_delay', the conversion
+        is assumed to have given the same results.
+        With a steady supply & no load current a conversion often gives
+        the same results, so the wait is then 'adc_delay', not the 2.0-2.5s
+        conversion time, and that interval is saved as 'adc_delay'.
+        The intervals between conversions are saved in 'adc_intervals'.
+
+        @param adc Dictionary of ADC register values to compare with,
+            or None to read them now
+        @param count Number of conversions to wait for
+
+        @return Dictionary of ADC register values after the last conversion
+
+        """
+        if adc is None:
+            adc = self._adc_read()
+        for _ in range(count):
+            deadline = time.monotonic() + self.adc_delay
+            while True:
+                time.sleep(self.adc_poll)
+                latest = self._adc_read()
+                now = time.monotonic()
+                if latest != adc or now >= deadline:
+                    break
+            adc = latest
+            if self._adc_time is not None:
+                self.adc_intervals.append(now - self._adc_time)
+                self._logger.debug("ADC interval = %.2f", now - self._adc_time)
+            self._adc_time = now
+        return adc
+
     def _ee_read(self, rdparam):
         """Read value from EEPROM.
 
@@ -477,18 +546,9 @@ class EV2200:
         @return Tuple of 16-bit integer values
 
         """
-        # Select the EEPROM
-        self._ev_cmd("WrSMBusWordPEC", "ManufAccess", self.ee_access_code)
-        time.sleep(self.ee_powerup_delay)
-        self._ev_cmd("SetSMBusSlave", "SetEE")
-        # Read EEPROM value(s)
-        vals = ()
-        for ptr in rdparam:
-            subcmd = ptr
-            val = self._ev_cmd("RdSMBusWord", subcmd)
-            vals += ((val[2] << 8) | val[1],)
-        # Select BQ2060
-        self._ev_cmd("SetSMBusSlave", "SetBQ")
+        self._ee_select()
+        vals = self._ee_read_words(self._ee_address(ptr) for ptr in rdparam)
+        self._ee_deselect()
         return vals
 
     def _ram_write(self, subcmd, val):
@@ -500,25 +560,90 @@ class EV2200:
         """
         self._ev_cmd("WrSMBusWordPEC", subcmd, val)
 
+    def _ram_write_many(self, wrparam):
+        """Write values to BQ2060 RAM using back-to-back commands.
+
+        @param wrparam Iterable of (EV2200 Sub Command, value)
+
+        """
+        self._ev_cmds(("WrSMBusWordPEC", subcmd, val) for subcmd, val in wrparam)
+
     def _ee_write(self, wrparam):
         """Write value to EEPROM.
 
+        Only words that differ from the EEPROM contents are written.
+        Written words are read back, and written again if they differ.
+
         @param wrparam Tuple of tuples of (address, value)
 
+        @return Number of write retries
+
         """
-        # Select the EEPROM
+        wanted = {self._ee_address(ptr): val for ptr, val in wrparam}
+        self._ee_select()
+        unknown = [adr for adr in wanted if adr not in self._ee_image]
+        if unknown:
+            self._ee_read_words(unknown)
+        attempts = 0
+        while True:
+            changed = [adr for adr, val in wanted.items() if self._ee_image[adr] != val]
+            if not changed:
+                break
+            if attempts > self.ee_write_retries:
+                self._ee_deselect()
+                raise Ev2200Error("EEPROM verify error")
+            if attempts:
+                self._logger.warning("EEPROM write retry at %s", changed)
+            self._logger.debug("EEPROM write %s", changed)
+            for adr in changed:
+                self._ev_cmd("WrSMBusWord", bytes((adr,)), wanted[adr])
+                time.sleep(self.ee_write_delay)
+            self._ee_read_words(changed)  # Verify
+            attempts += 1
+        self._ee_deselect()
+        return max(attempts - 1, 0)
+
+    def _ee_select(self):
+        """Connect the SMBus through to the EEPROM."""
         self._ev_cmd("WrSMBusWordPEC", "ManufAccess", self.ee_access_code)
         time.sleep(self.ee_powerup_delay)
         self._ev_cmd("SetSMBusSlave", "SetEE")
-        # Write value(s) to EEPROM
-        for ptr in wrparam:
-            subcmd = ptr[0]
-            val = ptr[1]
-            self._ev_cmd("WrSMBusWord", subcmd, val)
-            time.sleep(self.ee_write_delay)
-        # Select BQ2060
+
+    def _ee_deselect(self):
+        """Connect the SMBus back to the BQ2060."""
         self._ev_cmd("SetSMBusSlave", "SetBQ")
 
+    def _ee_address(self, subcmd):
+        """EEPROM address of a Sub Command.
+
+        @param subcmd EV2200 Sub Command name (or address number)
+
+        @return Address number
+
+        """
+        scmd = self.subcmd[subcmd] if subcmd in self.subcmd else subcmd
+        return scmd[0] if isinstance(scmd, bytes) else scmd
+
+    def _ee_read_words(self, addresses):
+        """Read words from the selected EEPROM using back-to-back commands.
+
+        The values read are saved as the known EEPROM contents.
+
+        @param addresses Iterable of address numbers
+
+        @return Tuple of 16-bit integer values
+
+        """
+        addresses = list(addresses)
+        vals = tuple(
+            (val[2] << 8) | val[1]
+            for val in self._ev_cmds(
+                ("RdSMBusWord", bytes((adr,)), 0) for adr in addresses
+            )
+        )
+        self._ee_image.update(zip(addresses, vals))
+        return vals
+
     def _ev_cmd(self, cmd, subcmd, val=0):
         """Send a command block.
 
@@ -529,32 +654,79 @@ class EV2200:
         @return 3-byte return string
 
         """
-        # Check the subcmd. If its not in the SubCmd dictionary,
-        # treat it as an address number
-        scmd = self.subcmd[subcmd] if subcmd in self.subcmd else subcmd
-        # Build the 5-byte command packet
-        cmd_blk = b"\xAA" + self.cmd[cmd] + scmd + bytes((val & 255, (val >> 8) & 255))
+        return self._ev_cmds(((cmd, subcmd, val),))[0]
+
+    def _ev_cmds(self, commands):
+        """Send command blocks back-to-back, then read all the responses.
+
+        Blocks are sent in chunks of up to 'cmd_chunk', so the responses of
+        a chunk arrive well within the serial port timeout.
+        If the responses of a chunk are short, its blocks are sent again one
+        at a time. This repeats the commands, so only commands that can be
+        repeated (reads & writes of a fixed value) are sent this way.
+
+        @param commands Iterable of (Command name, Sub-Command name, value)
+
+        @return List of 3-byte return strings
+
+        """
+        blocks = []
+        for cmd, subcmd, val in commands:
+            # Check the subcmd. If its not in the SubCmd dictionary,
+            # treat it as an address number
+            scmd = self.subcmd[subcmd] if subcmd in self.subcmd else subcmd
+            # Build the 5-byte command packet
+            cmd_blk = (
+                b"\xAA" + self.cmd[cmd] + scmd + bytes((val & 255, (val >> 8) & 255))
+            )
+            blocks.append((cmd_blk, subcmd, scmd))
+        response = b""
+        for start in range(0, len(blocks), self.cmd_chunk):
+            chunk = blocks[start : start + self.cmd_chunk]
+            try:
+                response += self._ev_write_read(blk[0] for blk in chunk)
+            except Ev2200Error:
+                if len(chunk) == 1:
+                    raise
+                self._logger.warning("Short response, sending one at a time")
+                for blk in chunk:
+                    response += self._ev_write_read((blk[0],))
+        results = []
+        for pos, (cmd_blk, subcmd, scmd) in enumerate(blocks):
+            res_blk = response[5 * pos : 5 * pos + 5]
+            # The 1st 2 bytes should always be what we sent
+            if cmd_blk[:1] != res_blk[:1]:
+                raise Ev2200Error("Reply != Command")
+            lsb = res_blk[2]
+            msb = res_blk[3]
+            if (
+                subcmd == "WrSMBusWord"
+                or subcmd == "WrSMBusWordPEC"
+                or subcmd == "BoardStatus"
+            ):
+                self._ev_cmd_err(lsb, msb)
+            elif subcmd == "RdSMBusWord" or subcmd == "RdSMBusWordPEC":
+                if lsb != scmd:
+                    self._ev_cmd_err(lsb, msb)
+            results.append(res_blk[2:])
+        return results
+
+    def _ev_write_read(self, cmd_blks):
+        """Write command blocks, then read their responses.
+
+        @param cmd_blks Iterable of 5-byte command blocks
+
+        @return Response bytes, 5 per command block
+
+        """
+        data = b"".join(cmd_blks)
         self.port.reset_input_buffer()
-        self.port.write(cmd_blk)
-        res_blk = self.port.read(5)  # this has a timeout
-        # We should have got 5 bytes back
-        if len(res_blk) != 5:
+        self.port.write(data)
+        response = self.port.read(len(data))  # this has a timeout
+        # We should have got 5 bytes back per command
+        if len(response) != len(data):
             raise Ev2200Error("Response timeout")
-        # The 1st 2 bytes should always be what we sent
-        if cmd_blk[:1] != res_blk[:1]:
-            raise Ev2200Error("Reply != Command")
-        lsb = res_blk[2]
-        msb = res_blk[3]
-        if (
-            subcmd == "WrSMBusWord"
-            or subcmd == "WrSMBusWordPEC"
-            or subcmd == "BoardStatus"
-        ):
-            self._ev_cmd_err(lsb, msb)
-        elif subcmd == "RdSMBusWord" or subcmd == "RdSMBusWordPEC":
-            if lsb != scmd:
-                self._ev_cmd_err(lsb, msb)
-        return res_blk[2:]
+        return response
 
     @staticmethod
     def _signed8bit(number):
@@ -627,29 +799,9 @@ class EV2200:
             raise Ev2200Error(err1)
 
 
-def _dumper(raw_data):
-    """Data Validity Checker."""
-    # programs.cmrsbp.ev2200.EV2200:MainThread:DEBUG:Dumping EEPROM
-    # 0000: 7F 3C 0A 00 14 05 00 00  00 00 80 3E 80 00 00 00   .<...... ...>....
-    # 0010: 00 00 E0 2E 31 00 00 00  00 00 A0 0F 8A 02 8A 02   ....1... ........
-    # 0020: 0A 20 53 45 54 45 43 20  50 2F 4C 00 00 00 C0 FE   . SETEC  P/L.....
-    # 0030: 07 43 4D 52 2D 53 42 50  D4 30 C8 32 60 D7 00 A0   .CMR-SBP .0.2`...
-    # 0040: 04 4E 69 4D 68 C0 40 1F  0A 20 00 9C A1 FF 07 07   .NiMh.@. . ......
-    # 0050: 07 35 2D BE 12 FF 00 00  00 00 00 00 00 00 00 00   .5-..... ........
-    # 0060: 00 00 00 20 A0 50 20 4E  12 7A 00 50 14 D3 2C CF   ... .P N .z.P..,.
-    # 0070: 44 CB 04 29 30 2A 00 00  F8 2A 00 00 00 00 5A A5   D..)0*.. .*....Z.
-
-    # SAMPLE_DATA = (
-    #    b'\x7F\x3C\x0A\x00\x14\x05\x00\x00\x00\x00\x80\x3E\x80\x00\x00\x00'
-    #    b'\x00\x00\xE0\x2E\x31\x00\x00\x00\x00\x00\xA0\x0F\x8A\x02\x8A\x02'
-    #    b'\x0A\x20\x53\x45\x54\x45\x43\x20\x50\x2F\x4C\x00\x00\x00\xC0\xFE'
-    #    b'\x07\x43\x4D\x52\x2D\x53\x42\x50\xD4\x30\xC8\x32\x60\xD7\x00\xA0'
-    #    b'\x04\x4E\x69\x4D\x68\xC0\x40\x1F\x0A\x20\x00\x9C\xA1\xFF\x07\x07'
-    #    b'\x07\x35\x2D\xBE\x12\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
-    #    b'\x00\x00\x00\x20\xA0\x50\x20\x4E\x12\x7A\x00\x50\x14\xD3\x2C\xCF'
-    #    b'\x44\xCB\x04\x29\x30\x2A\x00\x00\xF8\x2A\x00\x00\x00\x00\x5A\xA5'
-    #    )
-    field_list = """\
+# EEPROM data layout for _dumper: "format description [expected value]"
+# Expected value '-' is a calibration value.
+_EE_FIELDS = """\
         H Check Word 1 [0x3c7f]
         H Remaining Time Alarm (minutes) [10]
         H Remaining Capacity Alarm (mAh) [1300]
@@ -720,37 +872,67 @@ def _dumper(raw_data):
         H EDV R1 Factor [0]
         H Check Word 2 [0xa55a]
 """
+
+
+@functools.lru_cache(maxsize=None)
+def _ee_layout():
+    """Compile the EEPROM data layout.
+
+    @return Tuple(List of (offset, description, expected value), struct.Struct)
+
+    """
     offset = 0
     fields = []
-    for fstr in field_list.splitlines():
+    for fstr in _EE_FIELDS.splitlines():
         fieldspec, desc = fstr.strip().split(None, 1)
-        dlen = struct.calcsize(fieldspec)
         checkval = None
         if desc.endswith("]"):
             desc, checkval = desc.rsplit("[", 1)
             checkval = checkval[:-1]
-        #        print('%02x' % offset, fieldspec, desc, checkval)
-        fields.append([fieldspec, offset, desc, checkval])
-        offset += dlen
+            if checkval != "-":
+                checkval = ast.literal_eval(checkval)
+        fields.append((fieldspec, offset, desc, checkval))
+        offset += struct.calcsize(fieldspec)
+    layout = struct.Struct("<" + "".join(field[0] for field in fields))
+    assert layout.size == 0x80
+    return [field[1:] for field in fields], layout
 
-    structdef = "<" + "".join([x[0] for x in fields])
-    assert struct.calcsize(structdef) == 0x80
 
+def _dumper(raw_data):
+    """Data Validity Checker."""
+    # programs.cmrsbp.ev2200.EV2200:MainThread:DEBUG:Dumping EEPROM
+    # 0000: 7F 3C 0A 00 14 05 00 00  00 00 80 3E 80 00 00 00   .<...... ...>....
+    # 0010: 00 00 E0 2E 31 00 00 00  00 00 A0 0F 8A 02 8A 02   ....1... ........
+    # 0020: 0A 20 53 45 54 45 43 20  50 2F 4C 00 00 00 C0 FE   . SETEC  P/L.....
+    # 0030: 07 43 4D 52 2D 53 42 50  D4 30 C8 32 60 D7 00 A0   .CMR-SBP .0.2`...
+    # 0040: 04 4E 69 4D 68 C0 40 1F  0A 20 00 9C A1 FF 07 07   .NiMh.@. . ......
+    # 0050: 07 35 2D BE 12 FF 00 00  00 00 00 00 00 00 00 00   .5-..... ........
+    # 0060: 00 00 00 20 A0 50 20 4E  12 7A 00 50 14 D3 2C CF   ... .P N .z.P..,.
+    # 0070: 44 CB 04 29 30 2A 00 00  F8 2A 00 00 00 00 5A A5   D..)0*.. .*....Z.
+
+    # SAMPLE_DATA = (
+    #    b'\x7F\x3C\x0A\x00\x14\x05\x00\x00\x00\x00\x80\x3E\x80\x00\x00\x00'
+    #    b'\x00\x00\xE0\x2E\x31\x00\x00\x00\x00\x00\xA0\x0F\x8A\x02\x8A\x02'
+    #    b'\x0A\x20\x53\x45\x54\x45\x43\x20\x50\x2F\x4C\x00\x00\x00\xC0\xFE'
+    #    b'\x07\x43\x4D\x52\x2D\x53\x42\x50\xD4\x30\xC8\x32\x60\xD7\x00\xA0'
+    #    b'\x04\x4E\x69\x4D\x68\xC0\x40\x1F\x0A\x20\x00\x9C\xA1\xFF\x07\x07'
+    #    b'\x07\x35\x2D\xBE\x12\xFF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    #    b'\x00\x00\x00\x20\xA0\x50\x20\x4E\x12\x7A\x00\x50\x14\xD3\x2C\xCF'
+    #    b'\x44\xCB\x04\x29\x30\x2A\x00\x00\xF8\x2A\x00\x00\x00\x00\x5A\xA5'
+    #    )
     dump_ok = 0
-    vals = struct.unpack(structdef, raw_data)
-    for i in zip(fields, vals):
-        checkval = i[0][3]
+    fields, layout = _ee_layout()
+    for (offset, desc, checkval), val in zip(fields, layout.unpack(raw_data)):
         explain = "OK"
         if checkval == "-":
             explain = "OK: calibration value"
         elif checkval is not None:
-            checkval = eval(checkval)
-            if checkval != i[1]:
+            if checkval != val:
                 explain = " Error, expected %s" % checkval
         else:
             explain = "!!! NOT CHECKED !!!"
         if not explain.startswith("OK") or dump_ok:
-            print("0x%02x = %s (%s) %s" % (i[0][1], i[1], i[0][2], explain))
+            print("0x%02x = %s (%s) %s" % (offset, val, desc, explain))
 
 
 class Ev2200Error(Exception):
@@ -96,6 +96,7 @@ class Devices(share.Devices):
     """Devices."""
 
     sw_image = None
+    cache_state = True
 
     def open(self):
         """Create all Instruments."""
@@ -128,6 +129,7 @@ class Devices(share.Devices):
 
     def reset(self):
         """Reset instruments."""
+        super().reset()  # Forget the cached instrument state
         self["con"].close()
         for dev in ("dcs_vbat", "dcl_out", "dcl_bat"):
             self[dev].output(0.0, False)
@@ -232,6 +232,22 @@ class Devices(share.Devices):
     """Devices."""
 
     sw_version = None
+    safe_state = (
+        # Switch off AC Source & discharge the unit
+        (("j35", "close"), ("acsource", "reset")),
+        (("dcl_out", "output", 2.0, {"delay": 1}),),
+        (("discharge", "pulse"),),
+        (
+            ("dcs_vbat", "output", 0.0, False),
+            ("dcs_vaux", "output", 0.0, False),
+            ("dcs_solar", "output", 0.0, False),
+            ("dcl_out", "output", 0.0, False),
+            ("dcl_bat", "output", 0.0, False),
+            ("rla_reset", "set_off"),
+            ("rla_boot", "set_off"),
+            ("rla_loadsw", "set_off"),
+        ),
+    )
 
     def open(self):
         """Create all Instruments."""
@@ -276,18 +292,6 @@ class Devices(share.Devices):
         self["dcs_vcom"].output(22.0, output=True, delay=2)
         self.add_closer(lambda: self["dcs_vcom"].output(0, False))
 
-    def reset(self):
-        """Reset instruments."""
-        self["j35"].close()
-        # Switch off AC Source & discharge the unit
-        self["acsource"].reset()
-        self["dcl_out"].output(2.0, delay=1)
-        self["discharge"].pulse()
-        for dev in ("dcs_vbat", "dcs_vaux", "dcs_solar", "dcl_out", "dcl_bat"):
-            self[dev].output(0.0, False)
-        for rla in ("rla_reset", "rla_boot", "rla_loadsw"):
-            self[rla].set_off()
-
 
 class Sensors(share.Sensors):
     """Sensors."""
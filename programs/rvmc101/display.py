@@ -2,6 +2,7 @@
 # Copyright 2021 SETEC Pty Ltd
 """RVMC101 LED Helper."""
 
+import itertools
 import threading
 
 from attrs import define, field
@@ -17,6 +18,8 @@ class LEDControl:
     _worker = field(init=False, default=None)
     _evt = field(init=False, factory=threading.Event)
     inter_packet_gap = 0.5  # Wait between CAN packets
+    # Moving segment patterns shown on the display
+    patterns = (0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40)
 
     def __enter__(self):
         """Context Manager entry handler - Override LCD & Backlight.
@@ -37,11 +40,12 @@ class LEDControl:
     def worker(self):
         """Thread to send a stream of LED_DISPLAY CAN packets."""
         builder = share.can.RVMC101ControlLEDBuilder()
-        pattern = 0x01
-        while not self._evt.wait(self.inter_packet_gap):
-            # Show moving segment on the display
-            # The 1st packet we send is ignored due to no previous sequence
-            # number. The 2nd+ packets WILL be acted upon.
-            builder.pattern = pattern
-            self.candev.send(builder.packet)
-            pattern = 0x01 if pattern == 0x40 else pattern << 1
+        # Show moving segment on the display
+        # The 1st packet we send is ignored due to no previous sequence
+        # number. The 2nd+ packets WILL be acted upon.
+        builder.burst(
+            self.candev,
+            itertools.cycle(self.patterns),
+            self.inter_packet_gap,
+            stop=self._evt,
+        )
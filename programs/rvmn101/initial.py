@@ -84,9 +84,9 @@ class Initial(share.TestSequence):
             time.sleep(2)
             self.measure(("Serial", "ProdRev"))
 
-        # Save SerialNumber & MAC on a remote server.
+        # Save SerialNumber & MAC on a remote server (in the background).
         mac = share.MAC.loads(mes["ble_mac"]().value1)
-        dev["BLE"].mac = mac.dumps(separator="")
+        dev["blemac"].put(sernum, mac.dumps(separator=""))
 
     @share.teststep
     def _step_input(self, dev, mes):
@@ -149,6 +149,9 @@ class Devices(share.Devices):
     """Devices."""
 
     reversed_outputs = None  # Outputs with reversed operation
+    # Journal of Serial Number to MAC registrations not yet on the server
+    blemac_journal = pathlib.Path.home() / "setec_blemac.journal"
+    blemac_timeout = 5.0  # Wait for registrations at the end of a test run
 
     def open(self):
         """Create all Instruments."""
@@ -187,6 +190,12 @@ class Devices(share.Devices):
         self["can"] = self.physical_devices["CAN"]
         self["canreader"] = tester.CANReader(self["can"])
         self["candetector"] = share.can.PacketDetector(self["canreader"])
+        # Serial Number to MAC registration, using the tester's MAC server
+        self["blemac"] = share.bluetooth.RegistrationQueue(
+            self.blemac_journal, self.physical_devices["MAC"]
+        )
+        self["blemac"].start()
+        self.add_closer(self["blemac"].stop)
 
     def run(self):
         """Test run is starting."""
@@ -201,6 +210,8 @@ class Devices(share.Devices):
         self["dcs_vbatt"].output(0.0, False)
         for rla in ("rla_pullup", "rla_link"):
             self[rla].set_off()
+        # Any registrations not yet sent stay in the journal
+        self["blemac"].barrier(self.blemac_timeout)
 
 
 class Sensors(share.Sensors):
@@ -44,41 +44,73 @@ class Initial(share.TestSequence):
         Get the MAC address.
         Test the Bluetooth interface.
 
+        The panel is run one stage at a time across all positions, so the
+        Fixture swaps between program and button modes only once per panel.
+        Positions that fail a stage are skipped by the later stages.
+
         """
         # Open console serial connection
         dev["rvswt101"].open()
-        for pos in range(self.per_panel):
-            mypos = pos + 1
-            if tester.Measurement.position_enabled(mypos):
-                # Set sensor positions
-                for sen in (
-                    mes["JLink"].sensor,
-                    mes["ble_mac"].sensor,
-                ):
-                    sen.position = mypos
-                dev["fixture"].connect(mypos)
-                mes["JLink"]()
-                if not tester.Measurement.position_enabled(mypos):
-                    continue
-                # Get the MAC address from the console.
-                dev["dcs_vin"].output(0.0, delay=0.5)
-                dev["rvswt101"].port.reset_input_buffer()
-                dev["dcs_vin"].output(3.3, delay=0.1)
-                mac = dev["rvswt101"].get_mac()
-                mes["ble_mac"].sensor.store(mac)
-                mes["ble_mac"]()
-                if not tester.Measurement.position_enabled(mypos):
-                    continue
-                # Save SerialNumber & MAC on a remote server.
-                dev["BLE"].uut = self.uuts[pos]
-                dev["BLE"].mac = mac
-                # Press Button2 to broadcast on bluetooth
-                try:
-                    dev["fixture"].press(mypos)
-                    mes["rssi"]()
-                except Exception:
-                    dev["fixture"].release()
-                    raise
+        macs = {}
+        for stage in (self._stage_program, self._stage_mac, self._stage_bluetooth):
+            for pos in range(self.per_panel):
+                mypos = pos + 1
+                if tester.Measurement.position_enabled(mypos):
+                    stage(dev, mes, pos, macs)
+
+    def _stage_program(self, dev, mes, pos, macs):
+        """Program a position.
+
+        @param dev Devices
+        @param mes Measurements
+        @param pos Position index (0-N)
+        @param macs Dictionary of MAC address per position index
+
+        """
+        mes["JLink"].sensor.position = pos + 1
+        dev["fixture"].connect(pos + 1)
+        mes["JLink"]()
+
+    def _stage_mac(self, dev, mes, pos, macs):
+        """Get the MAC address of a position from the console.
+
+        @param dev Devices
+        @param mes Measurements
+        @param pos Position index (0-N)
+        @param macs Dictionary of MAC address per position index
+
+        """
+        mes["ble_mac"].sensor.position = pos + 1
+        dev["fixture"].connect(pos + 1)
+        dev["dcs_vin"].output(0.0, delay=0.5)
+        dev["rvswt101"].port.reset_input_buffer()
+        dev["dcs_vin"].output(3.3, delay=0.1)
+        mac = dev["rvswt101"].get_mac()
+        mes["ble_mac"].sensor.store(mac)
+        mes["ble_mac"]()
+        macs[pos] = mac
+
+    def _stage_bluetooth(self, dev, mes, pos, macs):
+        """Save the MAC and test the bluetooth of a position.
+
+        @param dev Devices
+        @param mes Measurements
+        @param pos Position index (0-N)
+        @param macs Dictionary of MAC address per position index
+
+        """
+        # Save SerialNumber & MAC on a remote server.
+        dev["BLE"].uut = self.uuts[pos]
+        dev["BLE"].mac = macs[pos]
+        # Press Button2 to broadcast on bluetooth
+        mes["rssi"].sensor.position = pos + 1
+        try:
+            dev["fixture"].press(pos + 1)
+            mes["rssi"]()
+        finally:
+            # A failed press may leave the Fixture in program mode
+            if dev["fixture"].state == FixtureState.button:
+                dev["fixture"].release()
 
 
 class Devices(share.Devices):
@@ -2,14 +2,36 @@
 # Copyright 2013 SETEC Pty Ltd
 """Selfchecker Test Program."""
 
+import sqlite3
+
 import libtester
+from pydispatch import dispatcher
 import tester
 
 import share
+from . import matrix
 
 
 class Main(share.TestSequence):
-    """Selfchecker Test Program."""
+    """Selfchecker Test Program.
+
+    The DC Sources, DC Loads and Relay Drivers are run as a matrix of
+    stimulus and measurement points. All points are measured, and then
+    judged together.
+    Parameter "FAST" is a short check for the start of a shift, using
+    only the end points of the DC Source & DC Load ranges, without the
+    DSO.
+    When the trend database is enabled, the passing readings of the
+    DC Source, DC Load & Relay Driver matrix are added to it, with a
+    channel for each instrument and point (eg: "dcs1.5V", "rla3.on").
+    drift() is called for channels that are out of statistical control,
+    before they fail a limit.
+
+    """
+
+    # DC Source voltages & DC Load currents of the fast self-test
+    fast_dcs = (5.0, 35.0)
+    fast_dcl = (5.0, 30.0)
 
     limitdata = (
         libtester.LimitDelta("12V", 12.0, 0.5),
@@ -40,17 +62,68 @@ class Main(share.TestSequence):
         """Create the test program as a linear sequence."""
         is_ate2 = (self.tester_type.type == "ATE2")
         Devices.is_ate2 = is_ate2
+        self.fast = self.parameter == "FAST"
         self.configure(self.limitdata, Devices, Sensors, Measurements)
         super().open()
         self.steps = (
             tester.TestStep("ACSource", self._step_acsource),
             tester.TestStep("Checker", self._step_checker),
-            tester.TestStep("DSO", self._step_dso, not is_ate2),
+            tester.TestStep("DSO", self._step_dso, not (is_ate2 or self.fast)),
             tester.TestStep("DCSource", self._step_dcsource),
             tester.TestStep("DCLoad", self._step_dcload),
             tester.TestStep("RelayDriver", self._step_relaydriver),
             tester.TestStep("Discharge", self._step_discharge),
         )
+        self.trend = share.trend.TrendStore.create()
+        self._trend_readings = []  # Tuple(channel name, reading) of a run
+        if self.trend:
+            dispatcher.connect(
+                self._signal_result,
+                sender=tester.signals.Thread.tester,
+                signal=tester.signals.TestRun.result,
+            )
+
+    def run(self):
+        """Run the test sequence."""
+        self._trend_readings = []
+        super().run()
+
+    def close(self):
+        """Finished testing."""
+        if self.trend:
+            dispatcher.disconnect(
+                self._signal_result,
+                sender=tester.signals.Thread.tester,
+                signal=tester.signals.TestRun.result,
+            )
+        super().close()
+
+    def drift(self, channel, violations):
+        """A channel is drifting.
+
+        @param channel Trend channel name
+        @param violations List of control rule violation descriptions
+
+        """
+        self._logger.warning('Drift of "%s": %s', channel, "; ".join(violations))
+
+    def _signal_result(self, **kwargs):
+        """Signal receiver for TestResult signals - Trend the readings."""
+        readings = [
+            (channel, rdg.value)
+            for channel, rdg in self._trend_readings
+            if rdg.is_pass
+            and isinstance(rdg.value, (int, float))
+            and not isinstance(rdg.value, bool)
+        ]
+        try:
+            self.trend.append(readings)
+            for channel, _ in readings:
+                violations = self.trend.violations(channel)
+                if violations:
+                    self.drift(channel, violations)
+        except sqlite3.Error as exc:
+            self._logger.error("Trend not saved: %s", exc)
 
     @share.teststep
     def _step_acsource(self, dev, mes):
@@ -101,27 +174,50 @@ class Main(share.TestSequence):
         After each step measure voltages on all DC Sources.
 
         """
-        for step, group in mes["dmm_dcs"]:
-            for src in dev["dcs"]:
-                src.output(voltage=step, output=True)
-                src.opc()
-            tester.MeasureGroup(group)
+        points = matrix.Matrix()
+        for voltage, group in self._levels(mes["dmm_dcs"], self.fast_dcs):
+            stage = []
+            for name in dev.dcs:
+                stage.append((name, "output", {"voltage": voltage, "output": True}))
+                stage.append((name, "opc"))
+            point = "{0:g}V".format(voltage)
+            points.add(
+                point,
+                (stage,),
+                group,
+                ["{0}.{1}".format(name, point) for name in dev.dcs],
+            )
+        self._trend_readings.extend(points.run(dev))
 
     @share.teststep
     def _step_dcload(self, dev, mes):
         """Test DC Loads.
 
         All DC Loads are connected via a 1mR shunt to the Fixture 5V/50A PSU.
-        Set each DC Load in turn to 5A, 10A, 20A, 40A and measure the
+        Set each DC Load in turn to 5A, 10A, 20A, 30A and measure the
         actual current through the shunt for the DC Load.
+        The shunt is shared, so a DC Load is turned off in a stage of its
+        own before the next one is turned on.
 
         """
-        for load in dev["dcl"]:
-            for current, meas in mes["dmm_Shunt"]:
-                load.output(current=current, output=True)
-                load.opc()
-                meas(timeout=5.0)
-            load.output(current=0.0, output=False)
+        points = matrix.Matrix()
+        off = ()
+        for name in dev.dcl:
+            for current, meas in self._levels(mes["dmm_Shunt"], self.fast_dcl):
+                on = (
+                    (name, "output", {"current": current, "output": True}),
+                    (name, "opc"),
+                )
+                points.add(
+                    name.upper(),
+                    (off, on),
+                    (meas,),
+                    ("{0}.{1:g}A".format(name, current),),
+                )
+                off = ()
+            off = ((name, "output", {"current": 0.0, "output": False}),)
+        points.add("Off", (off,))
+        self._trend_readings.extend(points.run(dev))
 
     @share.teststep
     def _step_relaydriver(self, dev, mes):
@@ -132,10 +228,21 @@ class Main(share.TestSequence):
 
         """
         mes["dmm_Rla12V"](timeout=1.0)
-        for rly in dev["relays"]:
-            with rly:
-                mes["dmm_RlaOn"](timeout=5.0)
-            mes["dmm_RlaOff"](timeout=5.0)
+        points = matrix.Matrix()
+        for name in dev.relays:
+            points.add(
+                name.upper(),
+                (((name, "set_on"),),),
+                (mes["dmm_RlaOn"],),
+                (name + ".on",),
+            )
+            points.add(
+                name.upper(),
+                (((name, "set_off"),),),
+                (mes["dmm_RlaOff"],),
+                (name + ".off",),
+            )
+        self._trend_readings.extend(points.run(dev))
 
     @share.teststep
     def _step_discharge(self, dev, mes):
@@ -166,12 +273,26 @@ class Main(share.TestSequence):
             timeout=5,
         )
 
+    def _levels(self, levels, fast):
+        """Select the stimulus levels to use.
+
+        @param levels Iterable of Tuple(level, measurement)
+        @param fast Levels used by the fast self-test
+        @return List of Tuple(level, measurement)
+
+        """
+        return [item for item in levels if not self.fast or item[0] in fast]
+
 
 class Devices(share.Devices):
     """Devices."""
 
     # True if the tester uses a ATE2 hardware
     is_ate2 = False
+    # Names of the DC Sources, DC Loads & Relay Drivers
+    dcs = ()
+    dcl = ()
+    relays = ()
 
     def open(self):
         """Create all Instruments."""
@@ -183,52 +304,34 @@ class Devices(share.Devices):
             ("discharger", tester.Discharge, "DIS"),
         ):
             self[name] = devtype(self.physical_devices[phydevname])
-        # DC Sources
-        self["dcs"] = [
-            tester.DCSource(self.physical_devices["DCS1"]),
-            tester.DCSource(self.physical_devices["DCS2"]),
-            tester.DCSource(self.physical_devices["DCS3"]),
-            tester.DCSource(self.physical_devices["DCS4"]),
-        ]
-        if not self.is_ate2:  # ATE2a: #5 faulty, #6,#7 not wired
-            self["dcs"].extend(
-                [
-                    tester.DCSource(self.physical_devices["DCS5"]),
-                    tester.DCSource(self.physical_devices["DCS6"]),
-                    tester.DCSource(self.physical_devices["DCS7"]),
-                ]
-            )
-        # DC Loads
-        self["dcl"] = [
-            tester.DCLoad(self.physical_devices["DCL1"]),
-            tester.DCLoad(self.physical_devices["DCL2"]),
-            tester.DCLoad(self.physical_devices["DCL3"]),
-            tester.DCLoad(self.physical_devices["DCL4"]),
-            tester.DCLoad(self.physical_devices["DCL5"]),
-            tester.DCLoad(self.physical_devices["DCL6"]),
-        ]
-        if not self.is_ate2:
-            self["dcl"].extend(
-                [
-                    tester.DCLoad(self.physical_devices["DCL7"]),
-                ]
-            )
-        # Relay Drivers
-        self["relays"] = []
-        for num in range(1, 23):
-            self["relays"].append(
-                tester.Relay(self.physical_devices["RLA{0}".format(num)])
-            )
+        # ATE2a: DC Source #5 faulty, #6,#7 not wired. DC Load #7 not fitted.
+        dcs_count, dcl_count = (4, 6) if self.is_ate2 else (7, 7)
+        self.dcs = self._add(tester.DCSource, "DCS", dcs_count)
+        self.dcl = self._add(tester.DCLoad, "DCL", dcl_count)
+        self.relays = self._add(tester.Relay, "RLA", 22)
+        # AC off, then loads off, sources off & relays off
+        self.safe_state = (
+            (("acsource", "reset"),),
+            tuple((name, "output", 0.0, False) for name in self.dcl),
+            tuple((name, "output", 0.0, False) for name in self.dcs),
+            tuple((name, "set_off") for name in self.relays),
+        )
+
+    def _add(self, devtype, phydevname, count):
+        """Add a set of numbered devices.
 
-    def reset(self):
-        """Reset instruments."""
-        self["acsource"].reset()
-        for ld in self["dcl"]:
-            ld.output(0.0, False)
-        for dcs in self["dcs"]:
-            dcs.output(0.0, False)
-        for rla in self["relays"]:
-            rla.set_off()
+        @param devtype Device class
+        @param phydevname Physical device name prefix
+        @param count Number of devices
+        @return Tuple of device names
+
+        """
+        names = []
+        for num in range(1, count + 1):
+            name = "{0}{1}".format(phydevname.lower(), num)
+            self[name] = devtype(self.physical_devices[phydevname + str(num)])
+            names.append(name)
+        return tuple(names)
 
 
 class Sensors(share.Sensors):
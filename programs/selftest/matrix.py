@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Stimulus x Measurement matrix of the Selfchecker."""
+
+from typing import List
+
+from attrs import define, field
+import tester
+
+import share
+
+
+@define
+class Point:
+    """A point of the matrix.
+
+    The stimulus is a Tuple of stages of device actions, in the format of
+    share.Devices.safe_state. The stages are applied in order, then the
+    measurements are made in order.
+
+    """
+
+    name: str = field()
+    stimulus: tuple = field(converter=tuple, factory=tuple)
+    measurements: tuple = field(converter=tuple, factory=tuple)
+    # Trend channel name of each measurement
+    channels: tuple = field(converter=tuple, factory=tuple)
+
+    @channels.validator
+    def _channels_check(self, attribute, value):
+        if len(value) != len(self.measurements):
+            raise ValueError("One channel is required per measurement")
+
+
+@define
+class Matrix:
+    """Points that are run in order, and checked as one batch.
+
+    Every point is measured even if an earlier one fails, and the overall
+    result is judged once all the points have been run.
+
+    """
+
+    timeout: float = field(default=5.0)  # Timeout of each measurement
+    points: List[Point] = field(init=False, factory=list)
+
+    def add(self, name, stimulus=(), measurements=(), channels=()):
+        """Add a point.
+
+        @param name Name of the point
+        @param stimulus Iterable of stages, each an Iterable of
+            Tuple(device name, method name, *args)
+        @param measurements Iterable of Measurement instances
+        @param channels Trend channel name of each measurement
+
+        """
+        self.points.append(Point(name, stimulus, measurements, channels))
+
+    def run(self, devices):
+        """Run all points.
+
+        @param devices share.Devices instance
+        @return List of Tuple(channel name, reading), in measurement order
+
+        """
+        readings = []
+        with share.MultiMeasurementSummary(default_timeout=self.timeout) as checker:
+            for point in self.points:
+                with tester.PathName(point.name):
+                    for stage in point.stimulus:
+                        devices.apply_stage(stage)
+                    for channel, measurement in zip(point.channels, point.measurements):
+                        done = len(checker.result.readings)
+                        checker.measure(measurement)
+                        readings.extend(
+                            (channel, rdg)
+                            for rdg in list(checker.result.readings)[done:]
+                        )
+        return readings
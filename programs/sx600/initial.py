@@ -268,6 +268,25 @@ class Devices(share.Devices):
     """Devices."""
 
     is_renesas = None
+    safe_state = (
+        (("arm", "close"), ("ard", "close"), ("acsource", "reset")),
+        # Discharge the unit
+        (
+            ("dcl_5V", "output", 1.0),
+            ("dcl_12V", "output", 5.0),
+            ("dcl_24V", "output", 5.0, {"delay": 1}),
+        ),
+        (("discharge", "pulse"),),
+        (
+            ("dcl_5V", "output", 0.0),
+            ("dcl_12V", "output", 0.0),
+            ("dcl_24V", "output", 0.0),
+            ("dcs_PriCtl", "output", 0.0, False),
+            ("dcs_5V", "output", 0.0, False),
+            ("rla_pson", "set_off"),
+            ("rla_sw", "set_off"),
+        ),
+    )
 
     def open(self):
         """Create all Instruments."""
@@ -290,7 +309,9 @@ class Devices(share.Devices):
         # Switch on power to fixture circuits
         for dcs in ("dcs_Arduino", "dcs_Vcom"):
             self[dcs].output(12.0, output=True)
-            self.add_closer(lambda: self[dcs].output(0.0, output=False))
+            self.add_closer(
+                lambda dcs=dcs: self[dcs].output(0.0, output=False), parallel=True
+            )
         time.sleep(5)  # Allow OS to detect the new ports
         # Serial connection to the ARM console
         arm_ser = serial.Serial(baudrate=115200, timeout=5.0)
@@ -304,22 +325,6 @@ class Devices(share.Devices):
         ard_ser.port = self.port("ARDUINO")
         self["ard"] = arduino.Arduino(ard_ser)
 
-    def reset(self):
-        """Reset instruments."""
-        self["arm"].close()
-        self["ard"].close()
-        self["acsource"].reset()
-        self["dcl_5V"].output(1.0)
-        self["dcl_12V"].output(5.0)
-        self["dcl_24V"].output(5.0, delay=1)
-        self["discharge"].pulse()
-        for ld in ("dcl_5V", "dcl_12V", "dcl_24V"):
-            self[ld].output(0.0)
-        for dcs in ("dcs_PriCtl", "dcs_5V"):
-            self[dcs].output(0.0, False)
-        for rla in ("rla_pson", "rla_sw"):
-            self[rla].set_off()
-
 
 class Sensors(share.Sensors):
     """Sensors."""
@@ -378,7 +378,9 @@ class Devices(share.Devices):
         # Switch on power to fixture circuits
         for dcs in ("dcs_Arduino", "dcs_Vcom", "dcs_DigPot"):
             self[dcs].output(12.0, output=True)
-            self.add_closer(lambda: self[dcs].output(0.0, output=False))
+            self.add_closer(
+                lambda dcs=dcs: self[dcs].output(0.0, output=False), parallel=True
+            )
         time.sleep(5)  # Allow OS to detect the new ports
 
     def reset(self):
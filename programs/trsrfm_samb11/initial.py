@@ -120,9 +120,13 @@ class Devices(share.Devices):
         self["trsrfm"] = console.Console(trsrfm_ser)
         # Apply power to fixture circuits.
         self["dcs_vfix"].output(9.0, output=True, delay=5)
-        self.add_closer(lambda: self["dcs_vfix"].output(0.0, output=False))
+        self.add_closer(
+            lambda: self["dcs_vfix"].output(0.0, output=False), parallel=True
+        )
         self["dcs_cover"].output(9.0, output=True)
-        self.add_closer(lambda: self["dcs_cover"].output(0.0, output=False))
+        self.add_closer(
+            lambda: self["dcs_cover"].output(0.0, output=False), parallel=True
+        )
 
     def reset(self):
         """Reset instruments."""
@@ -6,7 +6,11 @@ from . import bluetooth
 from . import can
 from . import console
 from . import config
+from . import profiler
 from . import programmer
+from . import statecache
+from . import telemetry
+from . import trend
 from .mac import MAC
 from .testsequence import Devices, Sensors, Measurements, TestSequence
 from .testsequence import teststep  # a decorator
@@ -19,7 +23,11 @@ __all__ = [
     "can",
     "console",
     "config",
+    "profiler",
     "programmer",
+    "statecache",
+    "telemetry",
+    "trend",
     "MAC",
     "Devices",
     "Sensors",
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Base class of the device proxies."""
+
+
+class Proxy:
+    """Proxy that stands in for a device.
+
+    Attribute access is passed through to the target, and isinstance()
+    sees the class of the target.
+    Python looks up special methods on the type, not the instance, so
+    those that devices implement (eg: 'with relay:', console['name'])
+    are passed through to the target by _special().
+
+    """
+
+    __slots__ = ("_target",)
+
+    def __init__(self, target):
+        """Create instance.
+
+        @param target Device instance
+
+        """
+        object.__setattr__(self, "_target", target)
+
+    @property
+    def __class__(self):
+        """Class of the target."""
+        return type(self._target)
+
+    def __getattr__(self, name):
+        """Get an attribute of the target."""
+        return getattr(self._target, name)
+
+    def __setattr__(self, name, value):
+        """Set an attribute of the target."""
+        setattr(self._target, name, value)
+
+    def _special(self, name, *args):
+        """Call a special method of the target.
+
+        @param name Method name
+        @param args Arguments
+        @return Return value of the method
+        @raises TypeError if the target doesn't have the method
+
+        """
+        try:
+            method = getattr(type(self._target), name)
+        except AttributeError:
+            raise TypeError(
+                "'{0}' object does not support {1}".format(
+                    type(self._target).__name__, name
+                )
+            ) from None
+        return method(self._target, *args)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self._special("__enter__")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context manager exit."""
+        return self._special("__exit__", exc_type, exc_value, traceback)
+
+    def __getitem__(self, key):
+        """Indexed read."""
+        return self._special("__getitem__", key)
+
+    def __setitem__(self, key, value):
+        """Indexed write."""
+        return self._special("__setitem__", key, value)
+
+    def __delitem__(self, key):
+        """Indexed delete."""
+        return self._special("__delitem__", key)
+
+    def __contains__(self, item):
+        """Membership test."""
+        return self._special("__contains__", item)
+
+    def __iter__(self):
+        """Iterator."""
+        return iter(self._target)
+
+    def __len__(self):
+        """Length."""
+        return len(self._target)
+
+    def __bool__(self):
+        """Truth value."""
+        return bool(self._target)
+
+    def __repr__(self):
+        """Representation of the target."""
+        return repr(self._target)
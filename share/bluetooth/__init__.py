@@ -2,10 +2,13 @@
 # Copyright 2014 SETEC Pty Ltd.
 """Bluetooth Drivers."""
 
+from .journal import JournalLockedError, RegistrationQueue
 from .mac import SerialToMAC
 from .rssi import RSSI
 
 __all__ = [
+    "JournalLockedError",
+    "RegistrationQueue",
     "RSSI",
     "SerialToMAC",
 ]
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Write-behind queue for Bluetooth SerialNumber to MAC registration."""
+
+import collections
+import json
+import logging
+import os
+import pathlib
+import threading
+
+from attrs import define, field, validators
+
+from .mac import SerialToMAC
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class JournalLockedError(Exception):
+    """The journal is already used by another RegistrationQueue."""
+
+
+@define
+class RegistrationQueue:
+    """Save Serial Number to MAC registrations off the test critical path.
+
+    A registration is appended (and fsync'd) to a local journal file, then
+    a background worker saves it on the server, retrying upon errors.
+    Registrations still in the journal are sent again upon start().
+
+    Journal records are JSON lines:
+        {"op": "set", "serial": SERIAL, "mac": MAC}
+        {"op": "ack", "serial": SERIAL, "mac": MAC}
+
+    A journal can only be used by one started queue at a time, in any
+    process. This is enforced by an exclusive lock on 'journal.lock'.
+
+    The client can be any object with a blemac_set(serial, blemac) method,
+    such as the "MAC" physical device of a tester. A blemac_set_many(pairs)
+    method is used in preference, to send a batch in one request.
+
+    """
+
+    journal: pathlib.Path = field(converter=pathlib.Path)
+    client = field(factory=SerialToMAC)
+    # Delay before a retry, doubling upon every failure up to retry_max
+    retry_delay = field(default=1.0, converter=float, validator=validators.gt(0.0))
+    retry_max = field(default=60.0, converter=float, validator=validators.gt(0.0))
+    _pending = field(init=False, factory=collections.deque)
+    _busy = field(init=False, default=0)  # Number of records being sent
+    _cond = field(init=False, factory=threading.Condition)
+    _worker = field(init=False, default=None)
+    _running = field(init=False, default=False)
+    _lockfile = field(init=False, default=None)
+    _logger = field(init=False)
+
+    @_logger.default
+    def _logger_default(self):
+        return logging.getLogger(".".join((__name__, self.__class__.__name__)))
+
+    def start(self):
+        """Lock & replay the journal, and start the worker.
+
+        @raises JournalLockedError if the journal is already in use
+
+        """
+        self._lock()
+        with self._cond:
+            self._pending.extend(self._replay())
+            self._running = True
+        if self._pending:
+            self._logger.info(
+                "%s registrations replayed from journal", len(self._pending)
+            )
+        self._worker = threading.Thread(
+            target=self._run, name="BleMacQueue", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self, timeout=10.0):
+        """Send any pending registrations, then stop the worker.
+
+        Registrations not sent stay in the journal for the next start().
+
+        @param timeout Maximum time to wait for pending registrations,
+            and then for the worker to stop
+
+        """
+        self.barrier(timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._worker:
+            self._worker.join(timeout)
+            if self._worker.is_alive():  # Stuck in a call to the server
+                self._logger.warning("Worker did not stop")
+            self._worker = None
+        with self._cond:
+            left = self._replay() if (self._pending or self._busy) else []
+        if left:
+            self._logger.warning(
+                "%s registrations left in the journal: %s",
+                len(left),
+                ", ".join(serial for serial, _ in left),
+            )
+        if self._lockfile:
+            self._lockfile.close()  # Releases the lock
+            self._lockfile = None
+
+    def _lock(self):
+        """Take an exclusive lock on the journal.
+
+        @raises JournalLockedError if the journal is already in use
+
+        """
+        path = self.journal.with_name(self.journal.name + ".lock")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lockfile = path.open("a+b")
+        try:
+            if fcntl:
+                fcntl.flock(lockfile.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lockfile.seek(0)
+                msvcrt.locking(lockfile.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lockfile.close()
+            raise JournalLockedError(
+                "Journal '{0}' is in use".format(self.journal)
+            ) from None
+        self._lockfile = lockfile
+
+    def put(self, serial, blemac):
+        """Register a Bluetooth MAC for a Serial Number.
+
+        Returns as soon as the registration is saved in the journal.
+
+        @param serial Unit serial number ('AYYWWLLNNNN')
+        @param blemac Bluetooth MAC address (12 hex digits)
+
+        """
+        record = (serial, blemac)
+        with self._cond:
+            self._append("set", [record], sync=True)
+            self._pending.append(record)
+            self._cond.notify_all()
+
+    def barrier(self, timeout=None):
+        """Wait for all registrations to be saved on the server.
+
+        @param timeout Maximum time to wait, or None to wait forever
+        @return True if everything has been saved
+
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not (self._pending or self._busy), timeout
+            )
+
+    def _run(self):
+        """Worker thread to send registrations to the server."""
+        delay = self.retry_delay
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or not self._running)
+                if not self._running:
+                    return
+                batch = list(self._pending)
+                self._pending.clear()
+                self._busy = len(batch)
+            try:
+                self._send(batch)
+            except Exception as exc:  # pylint: disable=broad-except
+                self._logger.warning("Registration failed, will retry: %s", exc)
+                with self._cond:
+                    self._pending.extendleft(reversed(batch))
+                    self._busy = 0
+                    self._cond.notify_all()
+                    self._cond.wait_for(lambda: not self._running, delay)
+                delay = min(delay * 2, self.retry_max)
+                continue
+            delay = self.retry_delay
+            with self._cond:
+                self._append("ack", batch, sync=False)
+                self._busy = 0
+                if not self._pending:  # Everything is saved
+                    self.journal.write_text("")
+                self._cond.notify_all()
+
+    def _send(self, batch):
+        """Save a batch of registrations on the server.
+
+        @param batch List of Tuple(serial, blemac)
+
+        """
+        send_many = getattr(self.client, "blemac_set_many", None)
+        if send_many:
+            send_many(batch)
+        else:
+            for serial, blemac in batch:
+                self.client.blemac_set(serial, blemac)
+
+    def _append(self, operation, records, sync):
+        """Append records to the journal.
+
+        @param operation "set" or "ack"
+        @param records Iterable of Tuple(serial, blemac)
+        @param sync True to fsync the journal
+
+        """
+        with self.journal.open("a", encoding="utf-8") as fout:
+            for serial, blemac in records:
+                fout.write(
+                    json.dumps({"op": operation, "serial": serial, "mac": blemac})
+                    + "\n"
+                )
+            if sync:
+                fout.flush()
+                os.fsync(fout.fileno())
+
+    def _replay(self):
+        """Read the registrations not yet saved on the server.
+
+        @return List of Tuple(serial, blemac)
+
+        """
+        pending = collections.Counter()
+        order = []
+        if self.journal.is_file():
+            with self.journal.open(encoding="utf-8") as fin:
+                for line in fin:
+                    try:
+                        data = json.loads(line)
+                        record = (data["serial"], data["mac"])
+                    except (ValueError, KeyError):  # A partly written record
+                        continue
+                    if data.get("op") == "set":
+                        pending[record] += 1
+                        order.append(record)
+                    elif pending[record]:
+                        pending[record] -= 1
+        result = []
+        for record in order:
+            if pending[record]:
+                pending[record] -= 1
+                result.append(record)
+        return result
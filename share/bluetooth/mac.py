@@ -2,20 +2,60 @@
 # Copyright 2019 SETEC Pty Ltd.
 """Bluetooth SerialNumber to MAC Storage."""
 
-from attrs import define, field
+import contextlib
+import http.client
+import ssl
+import threading
+import time
+
+from attrs import define, field, validators
 import jsonrpclib
+import jsonrpclib.config
+import jsonrpclib.jsonrpc
+
+
+class _TimeoutMixIn:
+    """Transport with a timeout on its connection."""
+
+    timeout = None
+
+    def make_connection(self, host):
+        """Connection to a host, with a timeout."""
+        conn = super().make_connection(host)
+        conn.timeout = self.timeout
+        return conn
+
+
+class _Transport(_TimeoutMixIn, jsonrpclib.jsonrpc.Transport):
+    """HTTP Transport with a timeout."""
+
+
+class _SafeTransport(_TimeoutMixIn, jsonrpclib.jsonrpc.SafeTransport):
+    """HTTPS Transport with a timeout."""
 
 
 @define
 class SerialToMAC:
-    """Save/Read the bluetooth MAC address for a Serial Number."""
+    """Save/Read the bluetooth MAC address for a Serial Number.
 
-    server_url = field(default="https://webapp.mel.setec.com.au/ate/rpc/")
+    Server connections are kept in a pool and reused.
 
-    # FIXME: We should be able to reuse the ServerProxy
-    # Python 3.10 with OpenSSL 3 and gets an "unexpected EOF" SSL
-    # error about 30 sec after the first RPC call.
-    # Use a new ServerProxy for every RPC call as a work around.
+    Python 3.10 with OpenSSL 3 gets an "unexpected EOF" SSL error when a
+    connection has been idle for about 30 sec, as the server drops it.
+    Idle connections are discarded before that happens, and a call that
+    still fails that way is retried once on a new connection.
+
+    """
+
+    server_url = field(default="https://webapp.mel.setec.com.au/ate/rpc/")
+    # Timeout of each server call (sec)
+    timeout = field(default=10.0, converter=float, validator=validators.gt(0.0))
+    # Discard connections idle for longer than this (sec)
+    idle_timeout = field(default=20.0, converter=float, validator=validators.gt(0.0))
+    # Errors from a connection the server has dropped
+    reconnect_errors = (ssl.SSLEOFError, ConnectionError, http.client.HTTPException)
+    _pool = field(init=False, factory=list)  # List of (last used time, proxy)
+    _lock = field(init=False, factory=threading.Lock)
 
     def _server(self):
         """Create a new connection.
@@ -23,7 +63,86 @@ class SerialToMAC:
         @return jsonrpclib.ServerProxy instance
 
         """
-        return jsonrpclib.ServerProxy(self.server_url)
+        config = jsonrpclib.config.DEFAULT
+        if self.server_url.startswith("https"):
+            transport = _SafeTransport(config, None)
+        else:
+            transport = _Transport(config)
+        transport.timeout = self.timeout
+        return jsonrpclib.ServerProxy(self.server_url, transport=transport)
+
+    @staticmethod
+    def _close(svr):
+        """Close a connection.
+
+        @param svr jsonrpclib.ServerProxy instance
+
+        """
+        with contextlib.suppress(Exception):
+            svr("close")
+
+    def _acquire(self):
+        """Get a connection from the pool, or a new one.
+
+        @return Tuple(jsonrpclib.ServerProxy instance, True if reused)
+
+        """
+        expired = []
+        svr = None
+        with self._lock:
+            while self._pool and svr is None:
+                last_used, candidate = self._pool.pop()
+                if time.monotonic() - last_used < self.idle_timeout:
+                    svr = candidate
+                else:
+                    expired.append(candidate)
+        for candidate in expired:
+            self._close(candidate)
+        if svr is None:
+            return self._server(), False
+        return svr, True
+
+    def _release(self, svr):
+        """Return a connection to the pool.
+
+        @param svr jsonrpclib.ServerProxy instance
+
+        """
+        with self._lock:
+            self._pool.append((time.monotonic(), svr))
+
+    def _call(self, function):
+        """Call the server using a pooled connection.
+
+        @param function Callable(jsonrpclib.ServerProxy) to make the RPC call
+        @return Result of function
+
+        """
+        svr, reused = self._acquire()
+        try:
+            result = function(svr)
+        except self.reconnect_errors:
+            self._close(svr)
+            if not reused:
+                raise
+            svr = self._server()  # The server dropped it, so try once more
+            try:
+                result = function(svr)
+            except Exception:
+                self._close(svr)
+                raise
+        except Exception:
+            self._close(svr)
+            raise
+        self._release(svr)
+        return result
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._lock:
+            pool, self._pool = self._pool, []
+        for _, svr in pool:
+            self._close(svr)
 
     def blemac_get(self, serial):
         """Retrieve a Bluetooth MAC for a Serial Number.
@@ -33,10 +152,7 @@ class SerialToMAC:
 
         """
         try:
-            svr = self._server()
-            mac = svr.blemac_get(serial)
-            svr("close")
-            del svr
+            mac = self._call(lambda svr: svr.blemac_get(serial))
         except Exception as exc:  # pylint: disable=broad-except
             mac = str(exc)
         return mac
@@ -48,7 +164,25 @@ class SerialToMAC:
         @param blemac Bluetooth MAC address (12 hex digits)
 
         """
-        svr = self._server()
-        svr.blemac_set(serial, blemac)
-        svr("close")
-        del svr
+        self._call(lambda svr: svr.blemac_set(serial, blemac))
+
+    def blemac_set_many(self, pairs):
+        """Save Bluetooth MACs for many Serial Numbers in one request.
+
+        Uses a JSON-RPC batch request.
+
+        @param pairs Iterable of Tuple(serial, blemac)
+
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return
+
+        def batch(svr):
+            multicall = jsonrpclib.MultiCall(svr)
+            for serial, blemac in pairs:
+                multicall.blemac_set(serial, blemac)
+            for _ in multicall():  # Raises the first error response
+                pass
+
+        self._call(batch)
@@ -2,12 +2,15 @@
 # Copyright 2020 SETEC Pty Ltd
 """CAN Bus Shared modules for Tester programs."""
 
-import contextlib
+import logging
+import threading
+import time
 
-from attrs import define, field
+from attrs import define, field, validators
 import tester
 
 from . import _base
+from .capture import PacketCapture, PacketRateReader
 from .setec_can import (
     # Packet builders
     Trek2PreConditionsBuilder,
@@ -46,6 +49,12 @@ __all__ = [
     # Sensors
     "PacketPropertyReader",
     "PacketDetector",
+    "PacketIndex",
+    "PacketIndexError",
+    "IndexedPropertyReader",
+    # Packet history
+    "PacketCapture",
+    "PacketRateReader",
     # Packet generators
     "Trek2PreConditionsBuilder",
     "RvviewTestModeBuilder",
@@ -94,12 +103,29 @@ class PacketPropertyReader:
 
 @define
 class PacketDetector:
-    """Custom logical instrument to detect CAN packet traffic."""
+    """Custom logical instrument to detect CAN packet traffic.
+
+    Traffic is sampled until 'min_frames' packets are seen, or the 'window'
+    time has passed. At least one packet read is always made.
+    Reading key None gives True if 'min_frames' packets were seen.
+    Other keys give traffic statistics of the sample:
+        "frames": Number of packets
+        "rate": Packets per second
+        "ids": Number of distinct packet headers
+        "timeouts": Number of reads that timed out with no traffic
+    (The CANReader does not report bus error frames.)
+
+    """
 
     canreader = field()  # tester.CANReader instance
+    min_frames = field(default=1, validator=validators.gt(0))
+    window = field(default=0.0, converter=float)  # Maximum sample time (sec)
+    stats = field(init=False, factory=dict)  # Statistics of the last sample
+    _read_key = field(init=False, default=None)
 
-    def configure(self, key):  # pylint: disable=unused-argument
+    def configure(self, key):
         """Sensor: Configure for next reading."""
+        self._read_key = key
 
     def opc(self):
         """Sensor: OPC."""
@@ -108,11 +134,252 @@ class PacketDetector:
         """Sensor: Read presence of CAN traffic.
 
         @param callerid Identity of caller
-        @return True if CAN traffic is seen
+        @return True if CAN traffic is seen, or a statistic value
+
+        """
+        frames = timeouts = 0
+        headers = set()
+        start = time.monotonic()
+        deadline = start + self.window
+        while True:
+            try:
+                packet = self.canreader.read()
+                frames += 1
+                headers.add(packet.header.uint)
+            except tester.CANReaderError:  # A timeout due to no traffic
+                timeouts += 1
+            now = time.monotonic()
+            if frames >= self.min_frames or now >= deadline:
+                break
+        elapsed = now - start
+        self.stats = {
+            "frames": frames,
+            "rate": frames / elapsed if elapsed > 0 else 0.0,
+            "ids": len(headers),
+            "timeouts": timeouts,
+        }
+        if self._read_key is None:
+            return frames >= self.min_frames
+        return self.stats.get(self._read_key)
+
+
+class PacketIndexError(Exception):
+    """PacketIndex worker thread has stopped due to an error."""
+
+
+@define
+class PacketIndex:
+    """Demultiplex the packet stream of a CANReader.
+
+    A worker thread is the only consumer of the CANReader.
+    Every RV-C packet is routed into 'latest packet' slots, keyed by
+    (DGN, SA, Command byte), so a reader can get the newest matching packet
+    without wading through all the other traffic.
+    Slots are also kept with SA and/or Command as None, to match any value.
+    Packets are also added to the optional PacketCapture history, which
+    is cleared upon start().
+    Packets without an RV-C header are not indexed.
+    If the CANReader fails, the worker stops and readers get a
+    PacketIndexError.
+
+    """
+
+    canreader = field()  # tester.CANReader instance
+    capture = field(
+        default=None,
+        validator=validators.optional(validators.instance_of(PacketCapture)),
+    )
+    _slots = field(init=False, factory=dict)  # {key: (time, packet)}
+    _cond = field(init=False, factory=threading.Condition)
+    _worker = field(init=False, default=None)
+    _running = field(init=False, default=False)
+    _error = field(init=False, default=None)  # Exception that stopped the worker
+    _logger = field(init=False)
+
+    @_logger.default
+    def _logger_default(self):
+        return logging.getLogger(".".join((__name__, self.__class__.__name__)))
+
+    def __enter__(self):
+        """Context Manager entry handler - Start.
+
+        @return self
+
+        """
+        self.start()
+        return self
+
+    def __exit__(self, exct_type, exce_value, trace_back):
+        """Context Manager exit handler - Stop."""
+        self.stop()
+
+    def start(self):
+        """Start reading packets."""
+        self.stop()
+        if self.capture is not None:
+            self.capture.clear()
+        with self._cond:
+            self._slots.clear()
+            self._error = None
+            self._running = True
+        self._worker = threading.Thread(
+            target=self._run, name="PacketIndex", daemon=True
+        )
+        self._worker.start()
+
+    def stop(self):
+        """Stop reading packets."""
+        if self._worker:
+            with self._cond:
+                self._running = False
+            self._worker.join()
+            self._worker = None
+
+    def _run(self):
+        """Worker thread to read packets."""
+        while self._running:
+            try:
+                packet = self.canreader.read()
+            except tester.CANReaderError:  # A timeout due to no traffic
+                continue
+            except Exception as exc:  # pylint: disable=broad-except
+                self._logger.exception("CANReader failed")
+                with self._cond:
+                    self._error = exc
+                    self._running = False
+                    self._cond.notify_all()
+                break
+            try:
+                self.put(packet)
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception("Packet not indexed: %r", packet)
+
+    def put(self, packet):
+        """Index a packet.
+
+        @param packet CANPacket instance
+
+        """
+        now = time.monotonic()
+        if self.capture is not None:
+            self.capture.put(packet, now)
+        msg = packet.header.message
+        try:
+            dgn, sa = msg.DGN, msg.SA
+        except AttributeError:  # Not a RV-C packet
+            return
+        command = packet.data[0] if packet.data else None
+        entry = (now, packet)
+        with self._cond:
+            slots = self._slots
+            slots[(dgn, sa, command)] = entry
+            slots[(dgn, sa, None)] = entry
+            slots[(dgn, None, command)] = entry
+            slots[(dgn, None, None)] = entry
+            self._cond.notify_all()
+
+    def latest(self, dgn, sa=None, command=None, max_age=None):
+        """Get the newest matching packet.
+
+        @param dgn DGN value
+        @param sa Source Address value, or None for any
+        @param command Command byte value, or None for any
+        @param max_age Maximum age of the packet (sec), or None for any age
+        @return CANPacket instance, or None
+        @raises PacketIndexError if the worker has stopped due to an error
+
+        """
+        with self._cond:
+            self._check()
+            return self._fresh((dgn, sa, command), max_age)
+
+    def wait(self, dgn, sa=None, command=None, max_age=None, timeout=1.0):
+        """Wait for a matching packet.
+
+        @param dgn DGN value
+        @param sa Source Address value, or None for any
+        @param command Command byte value, or None for any
+        @param max_age Maximum age of the packet (sec), or None for any age
+        @param timeout Maximum time to wait (sec)
+        @return CANPacket instance, or None
+        @raises PacketIndexError if the worker has stopped due to an error
+
+        """
+        key = (dgn, sa, command)
+        with self._cond:
+            packet = None
+
+            def found():
+                nonlocal packet
+                packet = self._fresh(key, max_age)
+                return packet is not None or self._error is not None
+
+            self._cond.wait_for(found, timeout)
+            self._check()
+            return packet
+
+    def _check(self):
+        """Check that the worker has not stopped due to an error.
+
+        @raises PacketIndexError if it has
+
+        """
+        if self._error is not None:
+            raise PacketIndexError(
+                "CANReader failed: {0!r}".format(self._error)
+            ) from self._error
+
+    def _fresh(self, key, max_age):
+        """Get the packet of a slot, if it is fresh enough.
+
+        @param key Slot key
+        @param max_age Maximum age of the packet (sec), or None for any age
+        @return CANPacket instance, or None
+
+        """
+        entry = self._slots.get(key)
+        if entry is None:
+            return None
+        stamp, packet = entry
+        if max_age is not None and time.monotonic() - stamp > max_age:
+            return None
+        return packet
+
+
+@define
+class IndexedPropertyReader:
+    """Custom logical instrument to read CAN packet properties from a PacketIndex."""
+
+    index = field(validator=validators.instance_of(PacketIndex))
+    decoder = field()  # CAN packet data decoder instance
+    dgn = field()  # DGN of the packets to decode
+    sa = field(default=None)  # Source Address, or None for any
+    command = field(default=None)  # Command byte, or None for any
+    max_age = field(default=None)  # Maximum packet age (sec), or None for any
+    timeout = field(default=1.0)  # Maximum wait for a packet (sec)
+    _read_key = field(init=False, default=None)
+
+    def configure(self, key):
+        """Sensor: Configure for next reading."""
+        self._read_key = key
+
+    def opc(self):
+        """Sensor: OPC."""
+
+    def read(self, callerid):  # pylint: disable=unused-argument
+        """Sensor: Read payload data using the last configured key.
+
+        @param callerid Identity of caller
+        @return Packet property value, or None
 
         """
-        result = False
-        with contextlib.suppress(tester.CANReaderError):
-            self.canreader.read()
-            result = True
-        return result
+        packet = self.index.wait(
+            self.dgn, self.sa, self.command, self.max_age, self.timeout
+        )
+        if packet is None:
+            return None
+        try:
+            self.decoder.decode(packet)
+        except tester.sensor.KeyedDataDecodeError:
+            return None
+        return self.decoder.get(self._read_key)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Fixed size capture of recent CAN packets."""
+
+import array
+import statistics
+import threading
+import time
+
+from attrs import define, field, validators
+
+
+@define
+class PacketCapture:
+    """Ring buffer of recent RV-C CAN packets.
+
+    Packets are stored as (timestamp, header, 8 data bytes) in preallocated
+    arrays, so memory use is fixed however long the capture runs.
+    The oldest packets are overwritten when the buffer is full.
+
+    """
+
+    size: int = field(default=4096, validator=validators.gt(1))
+    _stamps = field(init=False)  # array('d') of time.monotonic() values
+    _headers = field(init=False)  # array('L') of 29-bit CAN headers
+    _data = field(init=False)  # bytearray of 8 bytes per packet
+    _next = field(init=False, default=0)  # Index of the next write
+    _count = field(init=False, default=0)  # Number of packets held
+    _lock = field(init=False, factory=threading.Lock)
+
+    @_stamps.default
+    def _stamps_default(self):
+        return array.array("d", [0.0]) * self.size
+
+    @_headers.default
+    def _headers_default(self):
+        return array.array("L", [0]) * self.size
+
+    @_data.default
+    def _data_default(self):
+        return bytearray(8 * self.size)
+
+    def __len__(self):
+        """Number of packets held."""
+        return self._count
+
+    def clear(self):
+        """Forget all packets."""
+        with self._lock:
+            self._next = self._count = 0
+
+    def put(self, packet, stamp=None):
+        """Add a packet.
+
+        @param packet CANPacket instance
+        @param stamp Packet time (time.monotonic()), or None for now
+
+        """
+        data = bytes(packet.data[:8]).ljust(8, b"\xff")
+        with self._lock:
+            index = self._next
+            self._stamps[index] = time.monotonic() if stamp is None else stamp
+            self._headers[index] = packet.header.uint
+            self._data[index * 8 : index * 8 + 8] = data
+            self._next = (index + 1) % self.size
+            if self._count < self.size:
+                self._count += 1
+
+    def _indexes(self, dgn=None, since=None):
+        """Buffer indexes of matching packets, oldest first.
+
+        @param dgn DGN value, or None for all packets
+        @param since Oldest packet time to include, or None for all
+        @return List of indexes
+
+        """
+        start = (self._next - self._count) % self.size
+        indexes = [(start + offset) % self.size for offset in range(self._count)]
+        if dgn is not None:
+            headers = self._headers
+            indexes = [i for i in indexes if (headers[i] >> 8) & 0x1FFFF == dgn]
+        if since is not None:
+            stamps = self._stamps
+            indexes = [i for i in indexes if stamps[i] >= since]
+        return indexes
+
+    def times(self, dgn=None, window=None):
+        """Arrival times of packets.
+
+        @param dgn DGN value, or None for all packets
+        @param window Only include packets from the last 'window' seconds
+        @return List of times (time.monotonic()), oldest first
+
+        """
+        since = None if window is None else time.monotonic() - window
+        with self._lock:
+            stamps = self._stamps
+            return [stamps[i] for i in self._indexes(dgn, since)]
+
+    def rate(self, dgn=None, window=None):
+        """Message rate.
+
+        @param dgn DGN value, or None for all packets
+        @param window Only include packets from the last 'window' seconds
+        @return Packets per second, or 0.0 if less than 2 packets
+
+        """
+        stamps = self.times(dgn, window)
+        if len(stamps) < 2 or stamps[-1] <= stamps[0]:
+            return 0.0
+        return (len(stamps) - 1) / (stamps[-1] - stamps[0])
+
+    def intervals(self, dgn=None, window=None):
+        """Inter-arrival times of packets.
+
+        @param dgn DGN value, or None for all packets
+        @param window Only include packets from the last 'window' seconds
+        @return List of intervals (sec)
+
+        """
+        stamps = self.times(dgn, window)
+        return [later - earlier for earlier, later in zip(stamps, stamps[1:])]
+
+    def jitter(self, dgn=None, window=None):
+        """Inter-arrival time statistics.
+
+        @param dgn DGN value, or None for all packets
+        @param window Only include packets from the last 'window' seconds
+        @return Dictionary of mean, stdev, min & max intervals (sec),
+            or None if less than 3 packets
+
+        """
+        intervals = self.intervals(dgn, window)
+        if len(intervals) < 2:
+            return None
+        return {
+            "mean": statistics.fmean(intervals),
+            "stdev": statistics.stdev(intervals),
+            "min": min(intervals),
+            "max": max(intervals),
+        }
+
+    def values(self, dgn, shift, bits, count=None):
+        """Last values of a bit-field of packet data.
+
+        The data is read as a little-endian integer, as the packet decoders do.
+
+        @param dgn DGN value
+        @param shift Bit position of the field
+        @param bits Bit width of the field
+        @param count Maximum number of values, or None for all
+        @return List of values, oldest first
+
+        """
+        mask = (1 << bits) - 1
+        with self._lock:
+            indexes = self._indexes(dgn)
+            if count is not None:
+                indexes = indexes[-count:] if count else []
+            data = self._data
+            return [
+                (int.from_bytes(data[i * 8 : i * 8 + 8], "little") >> shift) & mask
+                for i in indexes
+            ]
+
+
+@define
+class PacketRateReader:
+    """Custom logical instrument to read packet timing from a PacketCapture.
+
+    Reading keys:
+        "rate": Packets per second
+        "mean", "stdev", "min", "max": Inter-arrival time statistics (sec)
+
+    """
+
+    capture = field(validator=validators.instance_of(PacketCapture))
+    dgn = field(default=None)  # DGN value, or None for all packets
+    window = field(default=None)  # Only use packets from the last 'window' sec
+    _read_key = field(init=False, default=None)
+
+    def configure(self, key):
+        """Sensor: Configure for next reading."""
+        self._read_key = key
+
+    def opc(self):
+        """Sensor: OPC."""
+
+    def read(self, callerid):  # pylint: disable=unused-argument
+        """Sensor: Read packet timing using the last configured key.
+
+        @param callerid Identity of caller
+        @return Packet timing value, or None if there are too few packets
+
+        """
+        if self._read_key == "rate":
+            rate = self.capture.rate(self.dgn, self.window)
+            return rate if rate else None
+        jitter = self.capture.jitter(self.dgn, self.window)
+        return jitter[self._read_key] if jitter else None
@@ -10,6 +10,8 @@ Reference:
 
 import ctypes
 import enum
+import sys
+import time
 
 from attrs import define, field
 import tester
@@ -102,6 +104,25 @@ class MessageID(enum.IntEnum):
     GENERAL_CONFIG = 34
 
 
+def _compile(structure):
+    """Compile a ctypes bit-field table into shift & mask operations.
+
+    The fields are packed from the LSB of a little-endian integer of the
+    packet data, so 'int.from_bytes(data, "little")' gives every field.
+
+    @param structure ctypes.Structure subclass with a _fields_ table
+    @return List of Tuple(name, shift, mask, bits)
+
+    """
+    operations = []
+    shift = 0
+    # pylint: disable=protected-access
+    for name, _, bits in structure._fields_:
+        operations.append((sys.intern(name), shift, (1 << bits) - 1, bits))
+        shift += bits
+    return operations
+
+
 class _SwitchStatus(ctypes.Structure):  # pylint: disable=too-few-public-methods
     """RVMC switch field definition.
 
@@ -142,6 +163,12 @@ class _SwitchStatus(ctypes.Structure):  # pylint: disable=too-few-public-methods
 class SwitchStatusDecoder(tester.sensor.KeyedDataDecoderMixin):
     """A RVMC Switch Status decoder."""
 
+    # (name, shift, mask, kind) kind: 0=int, 1=bool, 2=bool or None if > 1
+    _operations = tuple(
+        (name, shift, mask, 0 if bits > 2 else 1 if bits == 1 else 2)
+        for name, shift, mask, bits in _compile(_SwitchStatus)
+    )
+
     def worker(self, fields, packet):
         """Decode packet.
 
@@ -155,11 +182,12 @@ class SwitchStatusDecoder(tester.sensor.KeyedDataDecoderMixin):
             or data[SetecRVC.COMMAND_ID_INDEX.value] != CommandID.SWITCH_STATUS.value
         ):
             raise tester.sensor.KeyedDataDecodeError()
-        ss_fields = _SwitchStatus.from_buffer_copy(data)
-        # pylint: disable=protected-access
-        for name, _, bits in _SwitchStatus._fields_:
-            value = getattr(ss_fields, name)
-            if bits < 3:
+        raw = int.from_bytes(data, "little")
+        for name, shift, mask, kind in self._operations:
+            value = (raw >> shift) & mask
+            if kind == 1:
+                value = bool(value)
+            elif kind == 2:
                 value = bool(value) if value < 2 else None
             fields[name] = value
 
@@ -193,6 +221,12 @@ class _DeviceStatus(ctypes.Structure):  # pylint: disable=too-few-public-methods
 class DeviceStatusDecoder(tester.sensor.KeyedDataDecoderMixin):
     """RVMD50 Device Status decoder."""
 
+    # (name, shift, mask, is_bool)
+    _operations = tuple(
+        (name, shift, mask, bits == 1)
+        for name, shift, mask, bits in _compile(_DeviceStatus)
+    )
+
     def worker(self, fields, packet):
         """Decode packet.
 
@@ -206,13 +240,10 @@ class DeviceStatusDecoder(tester.sensor.KeyedDataDecoderMixin):
             or data[SetecRVC.COMMAND_ID_INDEX.value] != CommandID.DEVICE_STATUS.value
         ):
             raise tester.sensor.KeyedDataDecodeError()
-        ds_fields = _DeviceStatus.from_buffer_copy(data)
-        # pylint: disable=protected-access
-        for name, _, bits in _DeviceStatus._fields_:
-            value = getattr(ds_fields, name)
-            if bits == 1:
-                value = bool(value)
-            fields[name] = value
+        raw = int.from_bytes(data, "little")
+        for name, shift, mask, is_bool in self._operations:
+            value = (raw >> shift) & mask
+            fields[name] = bool(value) if is_bool else value
 
 
 class _ACStatus1(ctypes.Structure):  # pylint: disable=too-few-public-methods
@@ -259,6 +290,28 @@ class _ACStatus3(ctypes.Structure):  # pylint: disable=too-few-public-methods
     ]
 
 
+def _compile_acmon(structure, prefix):
+    """Compile an ACMON field table for one group.
+
+    @param structure ctypes.Structure subclass with a _fields_ table
+    @param prefix Field name prefix of the group
+    @return Tuple of Tuple(key, shift, mask, scale, offset)
+        scale is None for unscaled integer values
+
+    """
+    scaling = {  # name: (scale, offset)
+        # Current: -1600A to +1612.5A, res 0.05A, offset 1600A
+        "current": (0.05, -1600.0),
+        # Frequency: 0Hz to 500Hz, res 1/128Hz
+        "frequency": (1.0 / 128.0, 0.0),
+    }
+    return tuple(
+        (sys.intern("{0}_{1}".format(prefix, name)), shift, mask)
+        + scaling.get(name, (None, 0.0))
+        for name, shift, mask, _ in _compile(structure)
+    )
+
+
 @define(slots=False)
 class ACMONStatusDecoder(tester.sensor.KeyedDataDecoderMixin):
     """ACMON Status decoder.
@@ -269,10 +322,21 @@ class ACMONStatusDecoder(tester.sensor.KeyedDataDecoderMixin):
 
     """
 
-    ats1l1 = field(init=False, factory=dict)
-    ats1l2 = field(init=False, factory=dict)
-    ats3l1 = field(init=False, factory=dict)
-    ats3l2 = field(init=False, factory=dict)
+    # {DGN: (Leg1 operations, Leg2 operations)}
+    _operations = {
+        DGN.ACSTATUS1.value: (
+            _compile_acmon(_ACStatus1, "S1L1"),
+            _compile_acmon(_ACStatus1, "S1L2"),
+        ),
+        DGN.ACSTATUS3.value: (
+            _compile_acmon(_ACStatus3, "S3L1"),
+            _compile_acmon(_ACStatus3, "S3L2"),
+        ),
+    }
+    # Bit position of the 'leg' field (common to all packets)
+    _leg_shift = 7
+
+    merged = field(init=False, factory=dict)  # Latest values of all 4 packets
 
     def worker(self, fields, packet):
         """Decode packet.
@@ -282,57 +346,53 @@ class ACMONStatusDecoder(tester.sensor.KeyedDataDecoderMixin):
 
         """
         data = packet.data
-        dgn = packet.header.message.DGN
         if len(data) != SetecRVC.DATA_LEN.value:
             raise tester.sensor.KeyedDataDecodeError()
-        field_groups = [  # (Dictionary, Prefix)
-            (
-                self.ats1l1,
-                "S1L1",
-            ),
-            (
-                self.ats1l2,
-                "S1L2",
-            ),
-            (
-                self.ats3l1,
-                "S3L1",
-            ),
-            (
-                self.ats3l2,
-                "S3L2",
-            ),
-        ]
-        # pylint: disable=protected-access
-        if dgn == DGN.ACSTATUS1:
-            ats_fields = _ACStatus1.from_buffer_copy(data)
-            ats_names = _ACStatus1._fields_
-            index = 0
-        elif dgn == DGN.ACSTATUS3:
-            ats_fields = _ACStatus3.from_buffer_copy(data)
-            ats_names = _ACStatus3._fields_
-            index = 2
-        else:
+        try:
+            legs = self._operations[packet.header.message.DGN]
+        except KeyError:
             raise tester.sensor.KeyedDataDecodeError()
-        index += getattr(ats_fields, "leg")  # 0-3
-        group, _ = field_groups[index]  # Choose 1 of 4 field dictionaries
-        group.clear()
-        for name, _, _ in ats_names:
-            group[name] = getattr(ats_fields, name)
-        # Merge the 4 field dictionaries into fields
-        for group, prefix in field_groups:
-            for key, value in group.items():
-                # Current: -1600A to +1612.5A, res 0.05A, offset 1600A
-                if key == "current":
-                    value = float(value) * 0.05 - 1600.0
-                # Frequency: 0Hz to 500Hz, res 1/128Hz
-                if key == "frequency":
-                    value = float(value) / 128.0
-                fields["{0}_{1}".format(prefix, key)] = value
+        raw = int.from_bytes(data, "little")
+        merged = self.merged
+        for key, shift, mask, scale, offset in legs[(raw >> self._leg_shift) & 1]:
+            value = (raw >> shift) & mask
+            merged[key] = value if scale is None else value * scale + offset
+        fields.update(merged)
+
+
+class _PatternBurstMixin:  # pylint: disable=too-few-public-methods
+    """Send a sequence of patterns from a builder with a 'pattern' property."""
+
+    def burst(self, candev, patterns, interval, stop=None):
+        """Send a packet for each pattern, at a fixed interval.
+
+        Packets are paced from the start time, so the delays of sending do
+        not accumulate along the sequence.
+
+        @param candev CAN device with a 'send(packet)' method
+        @param patterns Iterable of pattern values
+        @param interval Time between packets (sec)
+        @param stop threading.Event to stop sending early, or None
+        @return List of send times relative to the first packet (sec)
+
+        """
+        sent = []
+        start = time.monotonic()
+        for count, pattern in enumerate(patterns):
+            delay = start + count * interval - time.monotonic()
+            if stop is not None:
+                if stop.wait(max(delay, 0)):
+                    break
+            elif delay > 0:
+                time.sleep(delay)
+            self.pattern = pattern
+            sent.append(time.monotonic() - start)
+            candev.send(self.packet)
+        return sent
 
 
 @define
-class RVMC101ControlLEDBuilder:  # pylint: disable=too-few-public-methods
+class RVMC101ControlLEDBuilder(_PatternBurstMixin):
     """A RVMC101 Control LED packet builder.
 
     [0]: LED Display = 0x01
@@ -345,8 +405,14 @@ class RVMC101ControlLEDBuilder:  # pylint: disable=too-few-public-methods
     [6]: Sequence number
     [7]: Checksum
 
+    The packet is built once, then updated in place.
+
     """
 
+    _template = bytes([MessageID.LED_DISPLAY.value]) + b"\x00\x00\xff\xff\xff\x00\x00"
+    # Checksum of the bytes that never change
+    _fixed_sum = sum(_template)
+
     packet = field(init=False)
 
     @packet.default
@@ -356,9 +422,7 @@ class RVMC101ControlLEDBuilder:  # pylint: disable=too-few-public-methods
         msg = header.message
         msg.DGN = DGN.RVMC101.value  #  to the RVMC101
         msg.SA = DeviceID.RVMN101.value  #  from a RVMN101
-        data = bytearray([MessageID.LED_DISPLAY.value])
-        data.extend(b"\x00\x00\xff\xff\xff\x00\x00")
-        return _base.CANPacket(header, data, rvc_mode=True)
+        return _base.CANPacket(header, bytearray(self._template), rvc_mode=True)
 
     @property
     def pattern(self):
@@ -376,9 +440,10 @@ class RVMC101ControlLEDBuilder:  # pylint: disable=too-few-public-methods
         @param value Test pattern
 
         """
-        self.packet.data[1] = self.packet.data[2] = value
-        self.packet.data[6] = (self.packet.data[6] + 1) & 0xFF  # Sequence number
-        self.packet.data[7] = sum(self.packet.data[:7]) & 0xFF  # Checksum
+        data = self.packet.data
+        data[1] = data[2] = value
+        sequence = data[6] = (data[6] + 1) & 0xFF
+        data[7] = (self._fixed_sum + 2 * value + sequence) & 0xFF  # Checksum
 
 
 class _RVMD50Message:  # pylint: disable=too-few-public-methods
@@ -408,7 +473,7 @@ class _RVMD50Message:  # pylint: disable=too-few-public-methods
 
 
 @define
-class RVMD50ControlLCDBuilder:  # pylint: disable=too-few-public-methods
+class RVMD50ControlLCDBuilder:
     """A RVMD50 Control LCD packet builder."""
 
     _pattern_index = 2  # Index of test pattern value
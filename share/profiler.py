@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Statistical profiler of test runs."""
+
+import collections
+import datetime
+import logging
+import pathlib
+import re
+import sys
+import threading
+from typing import ClassVar, Optional
+
+from attrs import define, field
+import tester
+from pydispatch import dispatcher
+
+
+@define
+class Profiler:
+    """Sample the stack of the thread running a test, when enabled.
+
+    Samples are tagged with the current TestStep name, and written as a
+    collapsed stack file for each step, ready for flame graph tools:
+        Step;module.function;module.function... count
+
+    Samples are taken by a daemon thread, using sys._current_frames(), so
+    the test thread is never interrupted.
+    Samples are wall clock based, so time spent waiting on I/O shows up
+    as well as the Python time.
+
+    """
+
+    # Directory for collapsed stack files, None when disabled
+    directory: ClassVar[Optional[pathlib.Path]] = None
+    # Sampling interval (sec)
+    interval: ClassVar[float] = 0.01
+
+    thread = field(init=False, factory=threading.get_ident)  # Thread to sample
+    stacks = field(init=False, factory=dict)  # Counter of stacks per step name
+    _step = field(init=False, default="Start")
+    _stop = field(init=False, factory=threading.Event)
+    _worker = field(init=False, default=None)
+    _logger = field(init=False)
+
+    @_logger.default
+    def _logger_default(self):
+        return logging.getLogger(".".join((__name__, self.__class__.__name__)))
+
+    @classmethod
+    def enable(cls, directory, interval=0.01):
+        """Enable or disable profiling.
+
+        @param directory Directory for collapsed stack files, or None to disable
+        @param interval Sampling interval (sec)
+
+        """
+        if directory is not None:
+            directory = pathlib.Path(directory)
+            directory.mkdir(parents=True, exist_ok=True)
+        cls.directory = directory
+        cls.interval = interval
+
+    @classmethod
+    def create(cls):
+        """Profiler for a test run.
+
+        @return Profiler instance, or None if disabled
+
+        """
+        return cls() if cls.directory else None
+
+    def start(self):
+        """A test run is starting."""
+        dispatcher.connect(
+            self._signal_step,
+            sender=tester.signals.Thread.tester,
+            signal=tester.signals.TestRun.step,
+        )
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name="Profiler", daemon=True)
+        self._worker.start()
+
+    def stop(self):
+        """The test run has finished, so write the collapsed stack files."""
+        self._stop.set()
+        self._worker.join()
+        self._worker = None
+        dispatcher.disconnect(
+            self._signal_step,
+            sender=tester.signals.Thread.tester,
+            signal=tester.signals.TestRun.step,
+        )
+        try:
+            self.write()
+        except OSError as exc:
+            self._logger.error("Profile not saved: %s", exc)
+
+    def _run(self):
+        """Sampling thread."""
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Sample the stack of the test thread."""
+        frame = sys._current_frames().get(  # pylint: disable=protected-access
+            self.thread
+        )
+        names = []
+        while frame:
+            code = frame.f_code
+            if code.co_filename != __file__:
+                names.append(
+                    "{0}.{1}".format(frame.f_globals.get("__name__"), code.co_name)
+                )
+            frame = frame.f_back
+        step = self._step
+        names.append(step)
+        names.reverse()
+        counter = self.stacks.get(step)
+        if counter is None:
+            counter = self.stacks[step] = collections.Counter()
+        counter[";".join(names)] += 1
+
+    def write(self):
+        """Write a collapsed stack file for each step."""
+        stamp = "{0:%Y%m%d_%H%M%S}".format(datetime.datetime.now())
+        for step, counter in self.stacks.items():
+            name = re.sub(r"[^\w.-]", "_", step)
+            path = self.directory / "{0}_{1}.folded".format(stamp, name)
+            with path.open("w", encoding="utf-8") as fout:
+                for stack, count in sorted(counter.items()):
+                    fout.write("{0} {1}\n".format(stack, count))
+
+    def _signal_step(self, **kwargs):
+        """Signal receiver for TestStep signals."""
+        self._step = str(kwargs["name"]).replace(";", "_")
@@ -9,11 +9,17 @@ from attrs import define
 from ._base import VerificationError
 from .arm import ARM
 from .avr import AVR
+from . import image
+from .image import Image, ImageCache, preload
 
 __all__ = [
     "VerificationError",
     "ARM",
     "AVR",
+    "image",
+    "Image",
+    "ImageCache",
+    "preload",
 ]
 
 
@@ -2,17 +2,117 @@
 # Copyright 2016 SETEC Pty Ltd
 """Programmer for NXP ARM devices."""
 
+import concurrent.futures
+import contextlib
+import logging
 import threading
 import time
 
+from attrs import define, field
 import isplpc
 import serial
 
-from . import _base
+from . import _base, image
+
+
+@define
+class Progress:
+    """Programming progress.
+
+    'written' counts every byte sent to the port, including the ISP protocol
+    overhead, so it can end up a little larger than 'total'.
+
+    """
+
+    total: int = field(default=0)  # Image size in bytes
+    written: int = field(default=0)  # Bytes written to the port
+    started: float = field(factory=time.monotonic)
+    finished: float = field(default=0.0)
+
+    @property
+    def elapsed(self):
+        """Programming time.
+
+        @return Elapsed time in seconds
+
+        """
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rate(self):
+        """Programming throughput.
+
+        @return Bytes per second written to the port
+
+        """
+        elapsed = self.elapsed
+        return self.written / elapsed if elapsed > 0 else 0.0
+
+
+class _CountingPort:  # pylint: disable=too-few-public-methods
+    """Serial port wrapper that counts the bytes written."""
+
+    def __init__(self, port, progress):
+        """Create instance.
+
+        @param port serial.Serial instance
+        @param progress Progress instance to update
+
+        """
+        object.__setattr__(self, "_port", port)
+        object.__setattr__(self, "_progress", progress)
+
+    def write(self, data):
+        """Write to the port, counting the bytes."""
+        count = self._port.write(data)
+        self._progress.written += len(data) if count is None else count
+        return count
+
+    def __getattr__(self, name):
+        """Everything else goes to the real port."""
+        return getattr(self._port, name)
+
+    def __setattr__(self, name, value):
+        """Settings (eg: baudrate, timeout) go to the real port."""
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._port, name, value)
 
 
 class ARM(_base._Base):
-    """ARM programmer using the isplpc package."""
+    """ARM programmer using the isplpc package.
+
+    The ISP bootloader auto-bauds. When the device can be reset into ISP
+    mode (by relay or BDA4 signals), the baud rate is negotiated by
+    program_begin(): a sync character is sent at each rate, fastest first,
+    until the bootloader answers. The device is then reset into ISP mode
+    again for programming.
+    A device that cannot be reset is always programmed at the slowest rate,
+    as once it has auto-bauded a retry at another rate cannot recover.
+    Programming is only retried at a slower rate upon a communication
+    error or an isplpc protocol error (eg: sync or checksum failure).
+    The fastest working rate of each port is remembered for later devices.
+
+    """
+
+    # Baud rates to try, fastest first
+    baudrates = (460800, 230400, 115200)
+    # Errors that are worth a retry at a slower baud rate
+    #   (as well as the exceptions of the isplpc package)
+    comm_errors = (serial.SerialException, OSError)
+    # Time to wait for the answer to a sync character
+    sync_timeout = 0.2
+    # Fastest working baud rate of each serial port {port: baudrate}
+    port_baudrate = {}
+    # Programming times {(image filename, baudrate): [seconds, ...]}
+    times = {}
+    # Port is ready once no input has been seen for this time
+    settle_quiet = 0.02
+    # Maximum time to wait for the port to become ready
+    settle_timeout = 0.5
+    # Minimum assertion time of the BOOT & RESET signals
+    signal_hold = 0.01
 
     def __init__(
         self,
@@ -40,11 +140,18 @@ class ARM(_base._Base):
         self.boot_relay = boot_relay
         self.reset_relay = reset_relay
         self.bda4_signals = bda4_signals
-        self.baudrate = 115200
+        self.baudrate = self.baudrates[0]
         self.crpmode = crpmode
+        self.progress = Progress()
         self._bindata = None
         self._ser = None
-        self._worker = None
+        self._future = None
+        self._error = None  # Exception raised by the last programming run
+        self._logger = logging.getLogger(".".join((__name__, self.__class__.__name__)))
+        # Warm-up the image cache when the program is opened.
+        # A missing file is reported when programming starts.
+        with contextlib.suppress(OSError):
+            image.preload((file,))
 
     def program_begin(self):
         """Begin programming a device.
@@ -53,21 +160,64 @@ class ARM(_base._Base):
         into bootloader mode (Assert BOOT, pulse RESET).
         BDA4 serial signals: RTS = BOOT, DTR = RESET.
 
+        @return concurrent.futures.Future of the programming result
+
+        """
+        if self.resettable:
+            self.baudrate = self.port_baudrate.get(self.port, self.baudrates[0])
+        else:
+            self.baudrate = self.baudrates[-1]
+        return self._begin()
+
+    @property
+    def resettable(self):
+        """Device can be reset into ISP mode.
+
+        @return True if there is a means to RESET the device
+
+        """
+        return bool(self.bda4_signals or self.reset_relay)
+
+    def _begin(self):
+        """Enter ISP mode and start the programming worker.
+
+        @return concurrent.futures.Future of the programming result
+
         """
-        # Read the image & open serial port on main thread
+        # Get the image & open serial port on main thread
+        # isplpc may patch the vector checksum & CRP word, so it gets a
+        # private copy of the cached image, made once per programmer
         if not self._bindata:
-            with self.file.open("rb") as infile:
-                self._bindata = bytearray(infile.read())
+            self._bindata = bytearray(image.load(self.file).data)
         self._ser = serial.Serial(port=self.port, baudrate=self.baudrate)
-        # We need to wait just a little before flushing the port
-        time.sleep(0.5)
-        self._ser.reset_input_buffer()
         # Device I/O activity is only done on main thread
+        if self.resettable:
+            self._negotiate()
+        self._enter_isp()
+        # Target device is now running in ISP mode, ready for auto-baud sync
+        self.progress = Progress(total=len(self._bindata))
+        pgm = isplpc.Programmer(
+            _CountingPort(self._ser, self.progress),
+            self._bindata,
+            erase_only=False,
+            verify=False,
+            crpmode=self.crpmode,
+        )
+        self._future = concurrent.futures.Future()
+        self._future.set_running_or_notify_cancel()
+        threading.Thread(
+            target=self.worker, name="ARMthread", args=(pgm,), daemon=True
+        ).start()
+        return self._future
+
+    def _enter_isp(self):
+        """Reset the device into ISP mode (Assert BOOT, pulse RESET)."""
+        self._port_settle()
         if self.bda4_signals:
             self._ser.rts = self._ser.dtr = True  # Assert BOOT & RESET
-            time.sleep(0.01)
+            time.sleep(self.signal_hold)
             self._ser.dtr = False  # Release RESET
-            time.sleep(0.01)
+            time.sleep(self.signal_hold)
             self._ser.rts = False  # Release BOOT
         else:
             if self.boot_relay:
@@ -76,18 +226,51 @@ class ARM(_base._Base):
                 self.reset_relay.pulse(0.1)  # Pulse RESET
             if self.boot_relay:
                 self.boot_relay.set_off()  # Release BOOT
-        # Target device is now running in ISP mode
-        pgm = isplpc.Programmer(
-            self._ser,
-            self._bindata,
-            erase_only=False,
-            verify=False,
-            crpmode=self.crpmode,
-        )
-        self._worker = threading.Thread(
-            target=self.worker, name="ARMthread", args=(pgm,)
-        )
-        self._worker.start()
+
+    def _negotiate(self):
+        """Find the fastest baud rate that the bootloader syncs at.
+
+        Rates are tried from the current one down. If none of them work,
+        the slowest is used, so that isplpc reports the error.
+
+        """
+        rates = [rate for rate in self.baudrates if rate <= self.baudrate]
+        for rate in rates:
+            self._ser.baudrate = self.baudrate = rate
+            self._enter_isp()
+            if self._sync():
+                return
+            self._logger.warning("No ISP sync at %s baud", rate)
+
+    def _sync(self):
+        """Send a sync character to the bootloader.
+
+        @return True if the bootloader answered
+
+        """
+        answer = b"Synchronized\r\n"
+        timeout = self._ser.timeout
+        self._ser.timeout = self.sync_timeout
+        try:
+            self._ser.write(b"?")
+            return self._ser.read_until(answer).endswith(answer)
+        finally:
+            self._ser.timeout = timeout
+
+    def _port_settle(self):
+        """Wait until the port is quiet, then flush any input."""
+        now = time.monotonic()
+        deadline = now + self.settle_timeout
+        quiet_from = now
+        while now < deadline:
+            if self._ser.in_waiting:
+                self._ser.reset_input_buffer()
+                quiet_from = now
+            elif now - quiet_from >= self.settle_quiet:
+                break
+            time.sleep(0.002)
+            now = time.monotonic()
+        self._ser.reset_input_buffer()
 
     def worker(self, pgm):
         """Worker thread to do the programming.
@@ -95,20 +278,103 @@ class ARM(_base._Base):
         @param pgm islpc.Programmer instance
 
         """
-        result = self.pass_result
+        self._error = None
         try:
-            pgm.program()
-        except Exception as exc:  # pylint: disable=broad-except
-            result = str(exc)
-        self.result = result
+            try:
+                pgm.program()
+                result = self.pass_result
+            except Exception as exc:  # pylint: disable=broad-except
+                self._error = exc
+                result = str(exc)
+        except BaseException as exc:  # Never leave program_wait() blocked
+            self.progress.finished = time.monotonic()
+            self._future.set_exception(exc)
+            raise
+        self.progress.finished = time.monotonic()
+        self._future.set_result(result)
+
+    @property
+    def future(self):
+        """Future of the current programming run.
+
+        @return concurrent.futures.Future instance, or None
+
+        """
+        return self._future
 
     def program_wait(self):
-        """Wait for device programming to finish."""
-        self._worker.join()
-        if self.bda4_signals:
-            self._ser.dtr = True  # Pulse RESET
-            time.sleep(0.01)
-            self._ser.dtr = False
-        self._ser.close()
-        self._ser = None
+        """Wait for device programming to finish.
+
+        Programming is retried at the next slower baud rate upon a
+        communication error. The device is reset into ISP mode again.
+
+        """
+        result = self._finish()
+        while (
+            result != self.pass_result
+            and self._retryable(self._error)
+            and self._fallback()
+        ):
+            self._begin()
+            result = self._finish()
+        if result == self.pass_result:
+            self.port_baudrate[self.port] = self.baudrate
+        self.result = result
         self.result_check()
+
+    def _finish(self):
+        """Wait for the worker, then release the port.
+
+        @return Programming result
+
+        """
+        try:
+            result = self._future.result()
+            if self.bda4_signals:
+                self._ser.dtr = True  # Pulse RESET
+                time.sleep(self.signal_hold)
+                self._ser.dtr = False
+        finally:
+            self._ser.close()
+            self._ser = None
+        elapsed = self.progress.elapsed
+        self.times.setdefault((self.file.name, self.baudrate), []).append(elapsed)
+        self._logger.info(
+            "%s @ %s baud: %.2fs, %.0f byte/s, %s",
+            self.file.name,
+            self.baudrate,
+            elapsed,
+            self.progress.rate,
+            result,
+        )
+        return result
+
+    def _retryable(self, exc):
+        """Check if a programming error is worth a retry at a slower rate.
+
+        @param exc Exception raised by the last programming run, or None
+        @return True for a communication or isplpc protocol error
+
+        """
+        if not self.resettable or exc is None:
+            return False
+        return isinstance(exc, self.comm_errors) or (
+            type(exc).__module__.split(".")[0] == isplpc.__name__
+        )
+
+    def _fallback(self):
+        """Select the next slower baud rate.
+
+        @return True if there is a slower baud rate to try
+
+        """
+        slower = [rate for rate in self.baudrates if rate < self.baudrate]
+        if not slower:
+            return False
+        self._logger.warning(
+            "Programming failed at %s baud, retry at %s baud",
+            self.baudrate,
+            slower[0],
+        )
+        self.baudrate = slower[0]
+        return True
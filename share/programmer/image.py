@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Firmware image cache for Programmers.
+
+Binary images (.bin) are loaded once per process and shared by all
+programmers. They are read into immutable bytes, so no file is held open
+and the file can be replaced while the tester is running.
+Each image carries a SHA-256 digest of its data.
+
+"""
+
+import hashlib
+import pathlib
+import threading
+from typing import Dict, Iterable, Tuple, Union
+
+from attrs import define, field, validators
+
+
+@define
+class Image:
+    """A loaded firmware image.
+
+    Programmers borrow the read-only data view, they must not modify it.
+
+    """
+
+    path: pathlib.Path = field(validator=validators.instance_of(pathlib.Path))
+    data: memoryview = field()  # Read-only view of the data
+    _stamp: Tuple[int, int] = field(default=(0, 0))  # (mtime_ns, size) of file
+    sha256: str = field(init=False)
+
+    @sha256.default
+    def _sha256_default(self):
+        return hashlib.sha256(self.data).hexdigest()
+
+    def __len__(self):
+        """Length of the image data."""
+        return len(self.data)
+
+
+@define
+class ImageCache:
+    """Process-wide store of loaded firmware images.
+
+    An image is reloaded if the file modification time or size changes.
+
+    """
+
+    _images: Dict[pathlib.Path, Image] = field(init=False, factory=dict)
+    _lock = field(init=False, factory=threading.Lock)
+
+    def get(self, path: Union[str, pathlib.Path]) -> Image:
+        """Get an image, loading it if required.
+
+        @param path Path to the image file
+        @return Image instance
+
+        """
+        path = pathlib.Path(path).resolve()
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            image = self._images.get(path)
+            if image is None or image._stamp != stamp:
+                data = memoryview(path.read_bytes())
+                # A stale image is dropped, but may still be borrowed
+                image = self._images[path] = Image(path, data, stamp)
+        return image
+
+    def preload(self, paths: Iterable[Union[str, pathlib.Path]]) -> Dict[str, str]:
+        """Load a group of images ahead of use.
+
+        @param paths Iterable of image file paths
+        @return Dictionary of {filename: SHA-256}
+
+        """
+        return {image.path.name: image.sha256 for image in map(self.get, paths)}
+
+    def clear(self):
+        """Forget all cached images."""
+        with self._lock:
+            self._images.clear()
+
+
+# The single cache used by all programmers
+CACHE = ImageCache()
+
+
+def load(path: Union[str, pathlib.Path]) -> Image:
+    """Get an image from the process-wide cache.
+
+    @param path Path to the image file
+    @return Image instance
+
+    """
+    return CACHE.get(path)
+
+
+def preload(paths: Iterable[Union[str, pathlib.Path]]) -> Dict[str, str]:
+    """Warm-up the process-wide cache with the images of a program.
+
+    @param paths Iterable of image file paths
+    @return Dictionary of {filename: SHA-256}
+
+    """
+    return CACHE.preload(paths)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Write-through cache of instrument settings."""
+
+import collections
+import functools
+import inspect
+import logging
+import threading
+import time
+
+from attrs import define, field
+import tester
+
+from . import _proxy
+
+
+class _CachedDevice(_proxy.Proxy):
+    """Proxy that drops a setting when the instrument already has it."""
+
+    __slots__ = ("_name", "_cache", "_methods")
+
+    def __init__(self, target, name, cache, methods):
+        """Create instance.
+
+        @param target Device instance
+        @param name Device name
+        @param cache StateCache instance
+        @param methods Names of the setting methods to cache
+
+        """
+        super().__init__(target)
+        for attr, value in (
+            ("_name", name),
+            ("_cache", cache),
+            ("_methods", methods),
+        ):
+            object.__setattr__(self, attr, value)
+
+    def __getattr__(self, name):
+        """Get an attribute of the target, caching setting methods."""
+        value = getattr(self._target, name)
+        if not callable(value) or name.startswith("_"):
+            return value
+        if name in self._methods:
+            return lambda *args, **kwargs: self._cache.set(
+                self._name, name, value, args, kwargs
+            )
+        if name in self._cache.passive:
+            return value
+        return lambda *args, **kwargs: self._cache.call(self._name, value, args, kwargs)
+
+    def __setattr__(self, name, value):
+        """Set an attribute of the target."""
+        self._cache.invalidate(self._name)
+        super().__setattr__(name, value)
+
+    def _special(self, name, *args):
+        """Call a special method of the target (eg: 'with relay:').
+
+        The state of the instrument is forgotten.
+
+        """
+        return self._cache.call(
+            self._name, functools.partial(super()._special, name), args, {}
+        )
+
+
+@define
+class StateCache:
+    """Shadow copy of the settings of instruments.
+
+    A setting is sent to the instrument only if it differs from the last
+    one sent, but the delay argument of a dropped setting is still done.
+    The state of an instrument is forgotten upon an error, or when any
+    other method is called (eg: reset(), linear()) except for the
+    'passive' ones.
+
+    """
+
+    # Setting methods to cache for each device class
+    methods = (
+        (tester.ACSource, ("output",)),
+        (tester.DCSource, ("output",)),
+        (tester.DCLoad, ("output",)),
+        (tester.Relay, ("set_on", "set_off")),
+    )
+    # Methods that don't change the state of an instrument
+    passive = ("opc",)
+
+    suppressed = field(init=False, factory=collections.Counter)  # Per device name
+    _states = field(init=False, factory=dict)  # {Device name: {method: key}}
+    _signatures = field(init=False, factory=dict)  # inspect.Signature cache
+    _lock = field(init=False, factory=threading.Lock)
+    _logger = field(init=False)
+
+    @_logger.default
+    def _logger_default(self):
+        return logging.getLogger(".".join((__name__, self.__class__.__name__)))
+
+    def wrap(self, name, device):
+        """Cache the settings of a device, if it is a supported type.
+
+        @param name Device name
+        @param device Device instance
+        @return Proxy for the device, or the device itself
+
+        """
+        for cls, methods in self.methods:
+            if isinstance(device, cls):
+                return _CachedDevice(device, name, self, methods)
+        return device
+
+    def invalidate(self, name=None):
+        """Forget the state of instruments.
+
+        @param name Device name, or None for all devices
+
+        """
+        with self._lock:
+            if name is None:
+                self._states.clear()
+            else:
+                self._states.pop(name, None)
+
+    def clear(self):
+        """Forget everything, logging the number of suppressed settings."""
+        total = sum(self.suppressed.values())
+        if total:
+            self._logger.info(
+                "%s settings suppressed: %s", total, dict(self.suppressed)
+            )
+        self.invalidate()
+        self.suppressed.clear()
+
+    def set(self, name, method, function, args, kwargs):
+        """Make a setting, unless the instrument already has it.
+
+        @param name Device name
+        @param method Method name
+        @param function Bound method of the device
+        @param args Positional arguments
+        @param kwargs Keyword arguments
+        @return Return value of the function, or None if suppressed
+
+        """
+        try:
+            bound = self._signature(function).bind(*args, **kwargs)
+        except (TypeError, ValueError):  # Not something we understand
+            return self.call(name, function, args, kwargs)
+        bound.apply_defaults()
+        delay = bound.arguments.pop("delay", 0)
+        # The two relay methods share one state
+        group = "relay" if method in ("set_on", "set_off") else method
+        key = (method, tuple(bound.arguments.items()))
+        with self._lock:
+            state = self._states.setdefault(name, {})
+            if state.get(group) == key:
+                self.suppressed[name] += 1
+                hit = True
+            else:
+                state.pop(group, None)
+                hit = False
+        if hit:
+            if delay:
+                time.sleep(delay)
+            return None
+        try:
+            result = function(*args, **kwargs)
+        except Exception:
+            self.invalidate(name)
+            raise
+        with self._lock:
+            self._states.setdefault(name, {})[group] = key
+        return result
+
+    def call(self, name, function, args, kwargs):
+        """Call any other method, forgetting the state of the instrument.
+
+        @param name Device name
+        @param function Bound method of the device
+        @param args Positional arguments
+        @param kwargs Keyword arguments
+        @return Return value of the function
+
+        """
+        self.invalidate(name)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.invalidate(name)
+
+    def _signature(self, function):
+        """Signature of a method, cached by function.
+
+        @param function Bound method
+        @return inspect.Signature
+
+        """
+        key = getattr(function, "__func__", function)
+        signature = self._signatures.get(key)
+        if signature is None:
+            signature = self._signatures[key] = inspect.signature(function)
+        return signature
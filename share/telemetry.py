@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Timing telemetry of test runs."""
+
+import csv
+import datetime
+import functools
+import logging
+import pathlib
+import time
+from typing import ClassVar, Optional
+
+from attrs import define, field
+import tester
+from pydispatch import dispatcher
+
+from . import _proxy
+
+
+class _Traced(_proxy.Proxy):
+    """Proxy that times the method calls of a device or measurement."""
+
+    __slots__ = ("_kind", "_name", "_trace", "_methods")
+
+    def __init__(self, target, kind, name, trace, methods=None):
+        """Create instance.
+
+        @param target Device or Measurement instance
+        @param kind Kind of event to record
+        @param name Name of the target in its store
+        @param trace Trace instance
+        @param methods Names of methods to time, or None for all public
+            ones and the special methods
+
+        """
+        super().__init__(target)
+        for attr, value in (
+            ("_kind", kind),
+            ("_name", name),
+            ("_trace", trace),
+            ("_methods", methods),
+        ):
+            object.__setattr__(self, attr, value)
+
+    def __getattr__(self, name):
+        """Get an attribute of the target, timing calls of methods."""
+        value = getattr(self._target, name)
+        if (
+            callable(value)
+            and not name.startswith("_")
+            and (self._methods is None or name in self._methods)
+        ):
+            return functools.partial(
+                self._trace.call,
+                self._kind,
+                "{0}.{1}".format(self._name, name),
+                value,
+            )
+        return value
+
+    def _special(self, name, *args):
+        """Call a special method of the target, timing it."""
+        if self._methods is not None:
+            return super()._special(name, *args)
+        return self._trace.call(
+            self._kind,
+            "{0}.{1}".format(self._name, name),
+            super()._special,
+            name,
+            *args,
+        )
+
+    def __call__(self, *args, **kwargs):
+        """Call the target."""
+        return self._trace.call(self._kind, self._name, self._target, *args, **kwargs)
+
+
+@define
+class Trace:
+    """Start and end times of the steps, measurements & device calls of a run.
+
+    Times are time.perf_counter() values (monotonic, with a better
+    resolution than time.monotonic() on Windows), relative to the start
+    of the run.
+
+    """
+
+    kind_step = "step"
+    kind_measure = "measure"
+    kind_device = "device"
+
+    started = field(init=False, factory=time.perf_counter)
+    events = field(init=False, factory=list)  # List of (kind, name, start, end)
+    _step = field(init=False, default=None)  # (name, start) of current step
+
+    def device(self, name, device):
+        """Time the method calls of a device.
+
+        @param name Device name
+        @param device Device instance
+        @return Proxy for the device
+
+        """
+        return _Traced(device, self.kind_device, name, self)
+
+    def measurement(self, name, measurement):
+        """Time the measure() calls of a measurement.
+
+        @param name Measurement name
+        @param measurement tester.Measurement instance
+        @return Proxy for the measurement
+
+        """
+        return _Traced(measurement, self.kind_measure, name, self, ("measure",))
+
+    def call(self, kind, name, function, *args, **kwargs):
+        """Call a function, recording its start and end time.
+
+        @param kind Kind of event
+        @param name Event name
+        @param function Function to call
+        @return Return value of the function
+
+        """
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            self.events.append(
+                (kind, name, start - self.started, time.perf_counter() - self.started)
+            )
+
+    def step(self, name=None):
+        """A TestStep is starting.
+
+        @param name Name of the step, or None at the end of the run
+
+        """
+        now = time.perf_counter() - self.started
+        if self._step is not None:
+            step_name, start = self._step
+            self.events.append((self.kind_step, step_name, start, now))
+        self._step = None if name is None else (name, now)
+
+    def write(self, path):
+        """Write the trace as CSV.
+
+        @param path File name
+
+        """
+        with open(path, "w", newline="", encoding="utf-8") as fout:
+            writer = csv.writer(fout)
+            writer.writerow(("kind", "name", "start", "end"))
+            for kind, name, start, end in sorted(self.events, key=lambda e: e[2]):
+                writer.writerow(
+                    (kind, name, "{0:.6f}".format(start), "{0:.6f}".format(end))
+                )
+
+
+@define
+class Telemetry:
+    """Record a timing Trace of each test run, when enabled.
+
+    Traces are written as CSV files into 'directory', named with the
+    serial number of the (first) UUT and the time of the run.
+
+    """
+
+    # Directory for trace files, None when disabled
+    directory: ClassVar[Optional[pathlib.Path]] = None
+
+    trace: Trace = field(init=False, factory=Trace)
+    _logger = field(init=False)
+
+    @_logger.default
+    def _logger_default(self):
+        return logging.getLogger(".".join((__name__, self.__class__.__name__)))
+
+    @classmethod
+    def enable(cls, directory):
+        """Enable or disable telemetry.
+
+        @param directory Directory for trace files, or None to disable
+
+        """
+        if directory is not None:
+            directory = pathlib.Path(directory)
+            directory.mkdir(parents=True, exist_ok=True)
+        cls.directory = directory
+
+    @classmethod
+    def create(cls):
+        """Telemetry for a test run.
+
+        @return Telemetry instance, or None if disabled
+
+        """
+        return cls() if cls.directory else None
+
+    def start(self):
+        """A test run is starting."""
+        dispatcher.connect(
+            self._signal_step,
+            sender=tester.signals.Thread.tester,
+            signal=tester.signals.TestRun.step,
+        )
+
+    def stop(self, uuts):
+        """The test run has finished, so write the trace.
+
+        @param uuts List of libtester.UUT
+
+        """
+        self.trace.step(None)
+        dispatcher.disconnect(
+            self._signal_step,
+            sender=tester.signals.Thread.tester,
+            signal=tester.signals.TestRun.step,
+        )
+        sernum = str(uuts[0].sernum) if uuts else "NoUUT"
+        path = self.directory / "{0}_{1:%Y%m%d_%H%M%S}.csv".format(
+            sernum, datetime.datetime.now()
+        )
+        try:
+            self.trace.write(path)
+        except OSError as exc:
+            self._logger.error("Telemetry not saved: %s", exc)
+
+    def _signal_step(self, **kwargs):
+        """Signal receiver for TestStep signals."""
+        self.trace.step(kwargs["name"])
@@ -2,6 +2,7 @@
 # Copyright 2016 SETEC Pty Ltd
 """Shared modules for Tester programs."""
 
+import concurrent.futures
 import contextlib
 import functools
 import time
@@ -13,6 +14,9 @@ import tester
 
 from . import bluetooth
 from . import config
+from . import profiler
+from . import statecache
+from . import telemetry
 
 
 class DuplicateNameError(Exception):
@@ -38,7 +42,36 @@ def teststep(func: Callable) -> Callable:
 
 @define
 class Devices:
-    """Devices abstract base class."""
+    """Devices abstract base class.
+
+    reset() puts the instruments into the state described by 'safe_state',
+    a Tuple of stages that are applied in order. The actions of a stage
+    on different instruments may run concurrently, but the actions on an
+    instrument always run in order. Each action is a
+    Tuple(device name, method name, *arguments),
+    with an optional Dictionary of keyword arguments last. eg:
+        safe_state = (
+            (("acsource", "reset"), ("dcs_vin", "output", 0.0, False)),
+            (("dcl_out", "output", 2.0, {"delay": 1}),),
+            (("discharge", "pulse"),),
+            (("dcl_out", "output", 0.0, False), ("rla_boot", "set_off")),
+        )
+
+    """
+
+    # Safe state of the instruments, applied by reset()
+    safe_state = ()
+    # Maximum number of instruments to reset or close at the same time
+    #   (1 to do everything in order)
+    #   The tester instrument drivers are not known to be thread-safe, so
+    #   only raise this when the instruments use independent links.
+    reset_workers = 1
+    # Physical instrument of devices {device name: instrument name}
+    #   Devices not listed are grouped by class, so that all channels of
+    #   one type of instrument (eg: DC Loads, Relays) are used in order.
+    instruments = {}
+    # True to drop repeated settings of AC & DC Sources, DC Loads & Relays
+    cache_state = False
 
     tester_type = field(validator=validators.instance_of(str))
     physical_devices = field(validator=validators.instance_of(tester.PhysicalDevices))
@@ -48,6 +81,9 @@ class Devices:
     parameter = field(validator=validators.optional(validators.instance_of(str)))
     _close_callables = field(init=False, factory=list)
     _store = field(init=False, factory=dict)
+    state_cache = field(init=False, factory=statecache.StateCache)
+    # telemetry.Trace to time device calls, or None
+    trace: Optional[telemetry.Trace] = field(init=False, default=None)
 
     def __setitem__(self, name, value):
         """Add a Device, rejecting duplicate names.
@@ -58,6 +94,8 @@ class Devices:
         """
         if name in self._store:
             raise DuplicateNameError('Device name "{0}"'.format(name))
+        if self.cache_state:
+            value = self.state_cache.wrap(name, value)
         self._store[name] = value
 
     def __getitem__(self, name):
@@ -67,7 +105,9 @@ class Devices:
         @return Device instance
 
         """
-        return self._store[name]
+        if self.trace is None:
+            return self._store[name]
+        return self.trace.device(name, self._store[name])
 
     def open(self):
         """Create all devices."""
@@ -76,19 +116,95 @@ class Devices:
         """Test run is starting."""
 
     def reset(self):
-        """Test run has stopped - Reset instruments."""
+        """Test run has stopped - Reset instruments to the safe state."""
+        self.state_cache.invalidate()
+        for stage in self.safe_state:
+            self.apply_stage(stage)
+
+    def apply_stage(self, stage):
+        """Apply a stage of actions, in the format of 'safe_state'.
+
+        @param stage Iterable of Tuple(device name, method name, *args)
+
+        """
+        by_instrument = {}
+        for action in stage:
+            by_instrument.setdefault(self._instrument(action[0]), []).append(action)
+        self._concurrently(
+            [
+                functools.partial(self._apply, actions)
+                for actions in by_instrument.values()
+            ]
+        )
+
+    def _instrument(self, name):
+        """Physical instrument of a device.
+
+        @param name Device name
+        @return Instrument name, or the class of the device
+
+        """
+        if name in self.instruments:
+            return self.instruments[name]
+        return self._store[name].__class__
+
+    def _apply(self, actions):
+        """Apply safe state actions in order.
+
+        @param actions Iterable of Tuple(device name, method name, *args)
+
+        """
+        for name, method, *args in actions:
+            kwargs = args.pop() if args and isinstance(args[-1], dict) else {}
+            getattr(self[name], method)(*args, **kwargs)
+
+    def _concurrently(self, targets):
+        """Call functions at the same time, and wait for them all.
+
+        @param targets List of callables
+        @raises The first exception raised by a callable
 
-    def add_closer(self, target):
-        """Add a callable to be called upon close()."""
-        self._close_callables.append(target)
+        """
+        if len(targets) < 2 or self.reset_workers < 2:
+            for target in targets:
+                target()
+            return
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.reset_workers, thread_name_prefix="DeviceReset"
+        ) as executor:
+            futures = [executor.submit(target) for target in targets]
+        for future in futures:
+            future.result()
+
+    def add_closer(self, target, parallel=False):
+        """Add a callable to be called upon close().
+
+        @param target Callable
+        @param parallel True if it can be called at the same time as
+            adjacent parallel closers
+
+        """
+        self._close_callables.append((target, parallel))
 
     def close(self):
-        """Close devices."""
-        self._close_callables.reverse()  # Close in LIFO order
-        for target in self._close_callables:
+        """Close devices.
+
+        Closers are called in LIFO order, except that adjacent parallel
+        closers are called at the same time.
+
+        """
+        batch = []
+        for target, parallel in reversed(self._close_callables):
+            if parallel:
+                batch.append(target)
+                continue
+            self._concurrently(batch)
+            batch = []
             target()
+        self._concurrently(batch)
         self._close_callables.clear()
         self._store.clear()
+        self.state_cache.clear()
 
     def port(self, name: str) -> str:
         """Find the device name of a serial port."""
@@ -186,6 +302,8 @@ class Measurements:
     limits = field(validator=validators.instance_of(TestLimits))
     parameter = field()
     _store = field(init=False, factory=dict)
+    # telemetry.Trace to time measurements, or None
+    trace: Optional[telemetry.Trace] = field(init=False, default=None)
 
     def __setitem__(self, name, value):
         """Add a Measurement, rejecting duplicate names.
@@ -205,7 +323,9 @@ class Measurements:
         @return Measurement instance
 
         """
-        return self._store[name]
+        if self.trace is None:
+            return self._store[name]
+        return self.trace.measurement(name, self._store[name])
 
     def open(self):
         """Create all measurements."""
@@ -398,7 +518,24 @@ class TestSequence(tester.TestSequenceEngine, TestSequenceMixin):
     def run(self) -> None:
         """Run the test sequence."""
         self.devices.run()
-        super().run()
+        recorder = telemetry.Telemetry.create()
+        sampler = profiler.Profiler.create()
+        if recorder is None and sampler is None:
+            super().run()
+            return
+        if recorder:
+            self.devices.trace = self.measurements.trace = recorder.trace
+            recorder.start()
+        if sampler:
+            sampler.start()
+        try:
+            super().run()
+        finally:
+            if sampler:
+                sampler.stop()
+            if recorder:
+                self.devices.trace = self.measurements.trace = None
+                recorder.stop(self.uuts)
 
     def safety(self) -> None:
         """Reset everything ready for another test."""
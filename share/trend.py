@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Trend database of test readings."""
+
+import contextlib
+import logging
+import math
+import pathlib
+import sqlite3
+import time
+from typing import ClassVar, Optional
+
+from attrs import define, field
+
+_SCHEMA = (
+    "PRAGMA auto_vacuum = INCREMENTAL",
+    "CREATE TABLE IF NOT EXISTS channel ("
+    " id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS reading ("
+    " channel INTEGER NOT NULL, time REAL NOT NULL, value REAL NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS reading_channel ON reading (channel, time)",
+    "CREATE TABLE IF NOT EXISTS summary ("
+    " channel INTEGER NOT NULL, day INTEGER NOT NULL, count INTEGER NOT NULL,"
+    " total REAL NOT NULL, squares REAL NOT NULL, PRIMARY KEY (channel, day))",
+)
+_DAY = 86400  # Seconds in a day
+
+
+def _moments(count, total, squares):
+    """Mean and standard deviation from sums.
+
+    @param count Number of values
+    @param total Sum of the values
+    @param squares Sum of the squares of the values
+    @return Tuple(mean, standard deviation)
+
+    """
+    mean = total / count
+    if count < 2:
+        return mean, 0.0
+    variance = (squares - count * mean * mean) / (count - 1)
+    return mean, math.sqrt(max(variance, 0.0))
+
+
+@define
+class TrendStore:
+    """SQLite store of readings per channel, to find drift, when enabled.
+
+    Readings are only ever appended. Once a channel has more than
+    'max_readings', compaction folds the oldest ones into a daily summary
+    (count, sum, sum of squares). Summaries older than 'keep_days' are
+    deleted, so the size of the file is bounded.
+
+    Drift is judged against control limits (mean +/- 3 sigma) of the
+    'baseline' readings that came before the most recent 'window'.
+    Readings appended together have the same time, so they are kept in
+    the order they were appended (by rowid).
+
+    """
+
+    # Database file, None when disabled
+    path: ClassVar[Optional[pathlib.Path]] = None
+
+    filename = field(converter=pathlib.Path)
+    # Readings kept per channel, before compaction
+    max_readings = field(default=1000)
+    # Days of daily summaries kept
+    keep_days = field(default=730)
+    # Recent readings checked against the control limits
+    window = field(default=8)
+    # Readings before the window used for the control limits
+    baseline = field(default=100)
+    # Minimum number of baseline readings to judge drift
+    min_baseline = field(default=20)
+    _ready = field(init=False, default=False)
+    _logger = field(init=False)
+
+    @_logger.default
+    def _logger_default(self):
+        return logging.getLogger(".".join((__name__, self.__class__.__name__)))
+
+    @classmethod
+    def enable(cls, path):
+        """Enable or disable the trend database.
+
+        @param path Database file, or None to disable
+
+        """
+        cls.path = None if path is None else pathlib.Path(path)
+
+    @classmethod
+    def create(cls, **kwargs):
+        """TrendStore for a test program.
+
+        @param kwargs Arguments for the instance
+        @return TrendStore instance, or None if disabled
+
+        """
+        return cls(cls.path, **kwargs) if cls.path else None
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Connection to the database, as a transaction.
+
+        A new connection is used each time, so any thread can use the store.
+
+        @return sqlite3.Connection
+
+        """
+        if not self._ready:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.filename), timeout=10)
+        try:
+            if not self._ready:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                self._ready = True
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _channel_id(conn, name):
+        """Database id of a channel, adding it if required.
+
+        @param conn sqlite3.Connection
+        @param name Channel name
+        @return Channel id
+
+        """
+        conn.execute("INSERT OR IGNORE INTO channel (name) VALUES (?)", (name,))
+        return conn.execute(
+            "SELECT id FROM channel WHERE name = ?", (name,)
+        ).fetchone()[0]
+
+    def append(self, readings, when=None):
+        """Append readings, compacting channels that have become too long.
+
+        @param readings Iterable of Tuple(channel name, value)
+        @param when Time of the readings (default now)
+
+        """
+        when = time.time() if when is None else when
+        with self._connect() as conn:
+            ids = set()
+            for name, value in readings:
+                ident = self._channel_id(conn, name)
+                ids.add(ident)
+                conn.execute(
+                    "INSERT INTO reading (channel, time, value) VALUES (?, ?, ?)",
+                    (ident, when, float(value)),
+                )
+            long_ids = [
+                ident
+                for ident in ids
+                if conn.execute(
+                    "SELECT COUNT(*) FROM reading WHERE channel = ?", (ident,)
+                ).fetchone()[0]
+                > self.max_readings
+            ]
+        if long_ids:
+            self.compact(long_ids)
+
+    def compact(self, ids=None):
+        """Fold the oldest readings into daily summaries.
+
+        @param ids Iterable of channel ids, or None for all channels
+
+        """
+        with self._connect() as conn:
+            if ids is None:
+                ids = [row[0] for row in conn.execute("SELECT id FROM channel")]
+            folded = 0
+            for ident in ids:
+                row = conn.execute(
+                    "SELECT time FROM reading WHERE channel = ?"
+                    " ORDER BY time DESC, rowid DESC LIMIT 1 OFFSET ?",
+                    (ident, self.max_readings - 1),
+                ).fetchone()
+                if row is None:
+                    continue
+                conn.execute(
+                    "INSERT INTO summary (channel, day, count, total, squares)"
+                    " SELECT channel, CAST(time / ? AS INTEGER), COUNT(*),"
+                    " SUM(value), SUM(value * value)"
+                    " FROM reading WHERE channel = ? AND time < ?"
+                    " GROUP BY 2 ORDER BY 2"
+                    " ON CONFLICT (channel, day) DO UPDATE SET"
+                    " count = count + excluded.count,"
+                    " total = total + excluded.total,"
+                    " squares = squares + excluded.squares",
+                    (_DAY, ident, row[0]),
+                )
+                folded += conn.execute(
+                    "DELETE FROM reading WHERE channel = ? AND time < ?",
+                    (ident, row[0]),
+                ).rowcount
+            conn.execute(
+                "DELETE FROM summary WHERE day < ?",
+                (int(time.time() / _DAY) - self.keep_days,),
+            )
+        with self._connect() as conn:
+            conn.execute("PRAGMA incremental_vacuum")
+        self._logger.debug("Compacted %s readings", folded)
+
+    def channels(self):
+        """Names of the channels.
+
+        @return List of channel names, in name order
+
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT name FROM channel ORDER BY name").fetchall()
+        return [row[0] for row in rows]
+
+    def statistics(self, name, count=None):
+        """Rolling statistics of the latest readings of a channel.
+
+        @param name Channel name
+        @param count Number of readings (default 'window')
+        @return Tuple(count, mean, standard deviation), or None if no data
+
+        """
+        return self._statistics(name, self.window if count is None else count, 0)
+
+    def _statistics(self, name, count, offset):
+        """Statistics of the latest readings of a channel.
+
+        @param name Channel name
+        @param count Number of readings
+        @param offset Number of the latest readings to skip
+        @return Tuple(count, mean, standard deviation), or None if no data
+
+        """
+        with self._connect() as conn:
+            number, total, squares = conn.execute(
+                "SELECT COUNT(*), SUM(value), SUM(value * value) FROM ("
+                " SELECT value FROM reading JOIN channel ON channel.id = channel"
+                " WHERE name = ? ORDER BY time DESC, reading.rowid DESC"
+                " LIMIT ? OFFSET ?)",
+                (name, count, offset),
+            ).fetchone()
+        if not number:
+            return None
+        return (number,) + _moments(number, total, squares)
+
+    def control_limits(self, name):
+        """Control limits of a channel, from the baseline readings.
+
+        @param name Channel name
+        @return Tuple(lower limit, mean, upper limit), or None if there
+            are too few baseline readings
+
+        """
+        stats = self._statistics(name, self.baseline, self.window)
+        if stats is None or stats[0] < self.min_baseline:
+            return None
+        _, mean, sigma = stats
+        return mean - 3 * sigma, mean, mean + 3 * sigma
+
+    def latest(self, name, count=None):
+        """Latest readings of a channel.
+
+        @param name Channel name
+        @param count Number of readings (default 'window')
+        @return List of values, oldest first
+
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT value FROM reading JOIN channel ON channel.id = channel"
+                " WHERE name = ? ORDER BY time DESC, reading.rowid DESC LIMIT ?",
+                (name, self.window if count is None else count),
+            ).fetchall()
+        return [row[0] for row in reversed(rows)]
+
+    def violations(self, name):
+        """Check the latest readings of a channel against its control limits.
+
+        Rules (Western Electric):
+            The latest reading is outside the control limits.
+            All of the 'window' latest readings are on one side of the mean.
+            The 6 latest readings are all increasing, or all decreasing.
+
+        @param name Channel name
+        @return List of violation descriptions
+
+        """
+        limits = self.control_limits(name)
+        if limits is None:
+            return []
+        low, mean, high = limits
+        values = self.latest(name)
+        result = []
+        if values and not low <= values[-1] <= high:
+            result.append(
+                "{0:g} outside control limits {1:g} to {2:g}".format(
+                    values[-1], low, high
+                )
+            )
+        if len(values) >= self.window and (
+            all(value > mean for value in values)
+            or all(value < mean for value in values)
+        ):
+            result.append(
+                "{0} readings on one side of mean {1:g}".format(len(values), mean)
+            )
+        steps = [later - earlier for earlier, later in zip(values[-6:], values[-5:])]
+        if len(steps) == 5 and (
+            all(step > 0 for step in steps) or all(step < 0 for step in steps)
+        ):
+            result.append("6 readings trending")
+        return result
+
+    def daily(self, name):
+        """Daily statistics of a channel, for long term trends.
+
+        @param name Channel name
+        @return List of Tuple(day start time, count, mean, standard deviation)
+
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT day, SUM(count), SUM(total), SUM(squares) FROM ("
+                " SELECT day, count, total, squares FROM summary"
+                "  JOIN channel ON channel.id = channel WHERE name = ?"
+                " UNION ALL"
+                " SELECT CAST(time / ? AS INTEGER), 1, value, value * value"
+                "  FROM reading JOIN channel ON channel.id = channel"
+                "  WHERE name = ?)"
+                " GROUP BY day ORDER BY day",
+                (name, _DAY, name),
+            ).fetchall()
+        return [
+            (day * _DAY, count) + _moments(count, total, squares)
+            for day, count, total, squares in rows
+        ]
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Cycle time benchmark of the Test programs, using the data feed tests.
+
+The data feed tests run every program with time.sleep patched out.
+Here the patched time.sleep adds the delays to a virtual clock instead,
+along with modelled latencies of console commands, measurements and
+instrument settings, to project the cycle time of each TestStep.
+
+Run from the command line:
+    python -m tests.benchmark -o cycletime.json [--compare old.json]
+
+Consoles replaced by a Mock in a test are not seen, so their commands
+are not counted.
+
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import pathlib
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+from unittest.mock import patch
+
+from attrs import asdict, define, field, validators
+import tester
+from pydispatch import dispatcher
+
+import programs
+import share
+from . import data_feed
+from . import programs as program_tests
+
+
+@define
+class LatencyModel:
+    """Time taken by operations that are simulated in the data feed (sec)."""
+
+    console = field(default=0.05, converter=float, validator=validators.ge(0.0))
+    measure = field(default=0.15, converter=float, validator=validators.ge(0.0))
+    move = field(default=0.03, converter=float, validator=validators.ge(0.0))
+
+    def hooks(self):
+        """Methods that are charged with a latency.
+
+        @return Iterable of Tuple(class, method name, latency name)
+
+        """
+        return (
+            (share.console.Base, "action", "console"),
+            (tester.Measurement, "measure", "measure"),
+            (tester.ACSource, "output", "move"),
+            (tester.DCSource, "output", "move"),
+            (tester.DCLoad, "output", "move"),
+            (tester.Relay, "set_on", "move"),
+            (tester.Relay, "set_off", "move"),
+        )
+
+
+def _step_record():
+    """A new TestStep record.
+
+    @return Dictionary
+
+    """
+    return {
+        "total": 0.0,
+        "python": 0.0,
+        "sleep": 0.0,
+        "console": 0.0,
+        "measure": 0.0,
+        "move": 0.0,
+        "counts": {"sleep": 0, "console": 0, "measure": 0, "move": 0},
+        "lines": {},  # Sleep time of each source line
+        "sleepers": {},  # Sleep time of each line that called time.sleep
+    }
+
+
+# Top directory of the repository
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def _relative(filename):
+    """Path of a source file relative to the repository.
+
+    @param filename Source file name
+    @return pathlib.PurePath, or None if outside the repository
+
+    """
+    try:
+        return pathlib.Path(filename).resolve().relative_to(ROOT)
+    except ValueError:
+        return None
+
+
+def _caller():
+    """Source lines of the code that called time.sleep.
+
+    Delays made by share (eg: the delay arguments of TestSequenceMixin
+    methods) or by the tester package are charged to the program line
+    that called them, noting the function that actually slept.
+    The innermost line of the repository is also returned, so literal
+    delays in share can be matched to the sleeps they made.
+
+    @return Tuple(charged line, innermost line)
+        charged line: "path:line" string, with " (via module.function)"
+            if needed
+        innermost line: "path:line" string, or None if outside the repository
+
+    """
+    via = location = inner = None
+    frame = sys._getframe(1)  # pylint: disable=protected-access
+    while frame:
+        filename = frame.f_code.co_filename
+        path = _relative(filename)
+        if filename == mock.__file__ or (path and path.parts[0] == "tests"):
+            frame = frame.f_back
+            continue
+        if via is None:
+            via = frame
+        if path:
+            location = frame
+            if inner is None:
+                inner = "{0}:{1}".format(path.as_posix(), frame.f_lineno)
+            if path.parts[0] == "programs":
+                break
+        frame = frame.f_back
+    location = location or via
+    if location is None:
+        return "?", None
+    path = _relative(location.f_code.co_filename) or location.f_code.co_filename
+    result = "{0}:{1}".format(pathlib.PurePath(path).as_posix(), location.f_lineno)
+    if via is not location:
+        result += " (via {0}.{1})".format(
+            via.f_globals.get("__name__"), via.f_code.co_name
+        )
+    return result, inner
+
+
+@define
+class VirtualClock:
+    """Accumulate the projected time of each TestStep of program runs.
+
+    Only the thread running the test program is charged, so background
+    threads (serial port readers etc) don't inflate the step times.
+    The real time of the step is added as "python".
+    Sleep time is also recorded against the source line that caused it.
+
+    """
+
+    model: LatencyModel = field(factory=LatencyModel)
+    # Completed runs: Dictionary of program, parameter, test, result, steps
+    runs = field(init=False, factory=list)
+    _test = field(init=False, default=None)  # (program, parameter, test id)
+    _run = field(init=False, default=None)  # Dictionary of step records
+    _step = field(init=False, default=None)  # Current step record
+    _started = field(init=False, default=0.0)  # Real time at step start
+    _thread = field(init=False, default=None)  # Thread running the program
+    _lock = field(init=False, factory=threading.Lock)
+
+    def begin(self, program, parameter, test_id):
+        """A test is starting.
+
+        @param program Program name, or None if not in programs.PROGRAMS
+        @param parameter Program parameter
+        @param test_id Test name
+
+        """
+        with self._lock:
+            self._test = None if program is None else (program, parameter, test_id)
+            self._run = self._step = self._thread = None
+
+    def sleep(self, seconds):
+        """Replacement for time.sleep.
+
+        @param seconds Delay time
+
+        """
+        self._charge("sleep", seconds, *_caller())
+
+    def charge(self, name):
+        """Charge the latency of an operation.
+
+        @param name Latency name in the model
+
+        """
+        self._charge(name, getattr(self.model, name))
+
+    def _charge(self, name, seconds, line=None, inner=None):
+        """Charge time to the current TestStep.
+
+        @param name Operation name
+        @param seconds Time
+        @param line Source line to charge, or None
+        @param inner Source line that actually slept, or None
+
+        """
+        with self._lock:
+            if self._step is None or threading.get_ident() != self._thread:
+                return
+            self._step[name] += seconds
+            self._step["total"] += seconds
+            self._step["counts"][name] += 1
+            if line:
+                lines = self._step["lines"]
+                lines[line] = lines.get(line, 0.0) + seconds
+            if inner:
+                sleepers = self._step["sleepers"]
+                sleepers[inner] = sleepers.get(inner, 0.0) + seconds
+
+    def _close_step(self):
+        """Finish the current TestStep (lock must be held)."""
+        if self._step is not None:
+            real = time.perf_counter() - self._started
+            self._step["python"] += real
+            self._step["total"] += real
+            self._step = None
+
+    def _signal_step(self, **kwargs):
+        """Signal receiver for TestStep signals."""
+        with self._lock:
+            if self._test is None:
+                return
+            self._close_step()
+            if self._run is None:
+                self._run = {}
+                self._thread = threading.get_ident()
+            self._step = self._run.setdefault(kwargs["name"], _step_record())
+            self._started = time.perf_counter()
+
+    def _signal_result(self, **kwargs):
+        """Signal receiver for TestResult signals."""
+        with self._lock:
+            self._close_step()
+            if self._run is not None:
+                program, parameter, test_id = self._test
+                self.runs.append(
+                    {
+                        "program": program,
+                        "parameter": parameter,
+                        "test": test_id,
+                        "result": kwargs["result"].letter,
+                        "steps": self._run,
+                    }
+                )
+            self._run = self._thread = None
+
+    @contextlib.contextmanager
+    def installed(self):
+        """Context manager to install the clock into the data feed tests."""
+        with contextlib.ExitStack() as stack:
+            for target, method, name in self.model.hooks():
+                stack.enter_context(
+                    patch.object(
+                        target, method, new=self._wrap(getattr(target, method), name)
+                    )
+                )
+            stack.enter_context(patch.object(data_feed, "SLEEP_HOOK", new=self.sleep))
+            for receiver, signal in (
+                (self._signal_step, tester.signals.TestRun.step),
+                (self._signal_result, tester.signals.TestRun.result),
+            ):
+                dispatcher.connect(
+                    receiver, sender=tester.signals.Thread.tester, signal=signal
+                )
+                stack.callback(
+                    dispatcher.disconnect,
+                    receiver,
+                    sender=tester.signals.Thread.tester,
+                    signal=signal,
+                )
+            yield self
+
+    def _wrap(self, method, name):
+        """Wrap a method to charge a latency when called.
+
+        Measurements of a Mirror sensor are not charged, as no instrument
+        is read.
+
+        @param method Method to wrap
+        @param name Latency name
+        @return Wrapped method
+
+        """
+
+        @functools.wraps(method)
+        def wrapper(instance, *args, **kwargs):
+            if name != "measure" or not isinstance(
+                instance.sensor, tester.sensor.Mirror
+            ):
+                self.charge(name)
+            return method(instance, *args, **kwargs)
+
+        return wrapper
+
+    def report(self):
+        """Projected cycle times of every program.
+
+        The slowest passing run of each program and parameter is reported,
+        or the slowest run if none passed. Programs without a data feed
+        test have an empty entry.
+
+        @return Dictionary
+
+        """
+        best = {}
+        for run in self.runs:
+            run = dict(run, total=sum(step["total"] for step in run["steps"].values()))
+            key = (run["program"], run["parameter"])
+            rank = (run["result"] == "P", run["total"])
+            if key not in best or rank > best[key][0]:
+                best[key] = (rank, run)
+        result = {name: {} for name in programs.PROGRAMS}
+        for (program, parameter), (_, run) in sorted(best.items()):
+            result[program][parameter] = {
+                "test": run["test"],
+                "result": run["result"],
+                "total": round(run["total"], 2),
+                "steps": {name: _rounded(step) for name, step in run["steps"].items()},
+            }
+        return {"model": asdict(self.model), "programs": result}
+
+
+def _rounded(step):
+    """Round the times of a TestStep record for the report.
+
+    @param step TestStep record
+    @return TestStep record
+
+    """
+    result = {}
+    for key, value in step.items():
+        if key in ("lines", "sleepers"):
+            value = {
+                line: round(seconds, 3)
+                for line, seconds in sorted(value.items(), key=lambda i: -i[1])
+            }
+        elif key != "counts":
+            value = round(value, 2)
+        result[key] = value
+    return result
+
+
+class _BenchmarkResult(unittest.TestResult):
+    """TestResult that tells the clock which program is being tested."""
+
+    def __init__(self, clock):
+        """Create instance.
+
+        @param clock VirtualClock instance
+
+        """
+        super().__init__()
+        self.clock = clock
+        self.names = {cls: name for name, cls in reversed(programs.PROGRAMS.items())}
+
+    def startTest(self, test):
+        """A test is starting."""
+        super().startTest(test)
+        prog_class = getattr(type(test), "prog_class", None)
+        self.clock.begin(
+            self.names.get(prog_class), getattr(test, "parameter", ""), test.id()
+        )
+
+
+def run(names=None, model=None):
+    """Run data feed tests to project program cycle times.
+
+    @param names Dotted test module names, or None for all program tests
+    @param model LatencyModel instance, or None for the default
+    @return Tuple(report dictionary, unittest.TestResult)
+
+    """
+    if names is None:
+        names = ["tests.programs." + name for name in program_tests.__all__]
+    clock = VirtualClock(model or LatencyModel())
+    result = _BenchmarkResult(clock)
+    try:
+        with clock.installed():
+            unittest.defaultTestLoader.loadTestsFromNames(names).run(result)
+    finally:
+        data_feed.POOL.stop()
+    return clock.report(), result
+
+
+def compare(old, new, threshold=0.1):
+    """Changes in projected cycle time between two reports.
+
+    @param old Report dictionary
+    @param new Report dictionary
+    @param threshold Minimum change to report (sec)
+    @return List of Tuple(program, parameter, old total, new total)
+
+    """
+    changes = []
+    for program, parameters in new["programs"].items():
+        previous = old["programs"].get(program, {})
+        for parameter in sorted(set(parameters) | set(previous)):
+            was = previous.get(parameter, {}).get("total")
+            now = parameters.get(parameter, {}).get("total")
+            if was is None or now is None or abs(now - was) >= threshold:
+                changes.append((program, parameter, was, now))
+    return changes
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Project program cycle times.")
+    parser.add_argument(
+        "-o", "--output", default="cycletime.json", help="JSON report file"
+    )
+    parser.add_argument("--compare", help="JSON report of a previous release")
+    for name, value in asdict(LatencyModel()).items():
+        parser.add_argument(
+            "--" + name,
+            type=float,
+            default=value,
+            help="{0} latency (default: %(default)s sec)".format(name),
+        )
+    parser.add_argument("names", nargs="*", help="dotted test module names")
+    args = parser.parse_args()
+    model = LatencyModel(args.console, args.measure, args.move)
+    report, result = run(args.names or None, model)
+    with open(args.output, "w", encoding="utf-8") as fout:
+        json.dump(report, fout, indent=1)
+        fout.write("\n")
+    print(
+        "Ran {0} tests ({1} failures, {2} errors), report in {3}".format(
+            result.testsRun, len(result.failures), len(result.errors), args.output
+        ),
+        file=sys.stderr,
+    )
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fin:
+            old = json.load(fin)
+        for program, parameter, was, now in compare(old, report):
+            print(
+                "{0:<40} {1:<8} {2:>8} -> {3:>8}".format(
+                    program, parameter, str(was), str(now)
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,15 +8,18 @@ Record the test result.
 
 """
 
+import atexit
 import datetime
 import logging
 import queue
+import threading
 import unittest
 from unittest.mock import Mock, patch
+import weakref
 
 import libtester
 import tester
-from pydispatch import dispatcher
+from pydispatch import dispatcher, saferef
 
 from . import logging_setup
 
@@ -60,6 +63,13 @@ class UnitTester(tester.Tester):
         )
         super().stop()
 
+    def ut_reset(self):
+        """Forget the data and results of a previous test program."""
+        self.ut_data = None
+        self.ut_sensor_storer = None
+        self.ut_steps.clear()
+        self.ut_result.clear()
+
     def ut_load(self, data, sensor_storer):
         """Per-Test data load.
 
@@ -101,6 +111,129 @@ class UnitTester(tester.Tester):
         self.ut_result.append(kwargs["result"])
 
 
+class TesterPool:
+    """A UnitTester shared by all the ProgramTestCase classes of a process.
+
+    The tester is started upon first use, and programs are added to the
+    programs dictionary it was started with as they are needed.
+    Signal receivers left connected by a test class are removed upon
+    release, so they can't see the signals of the next class.
+    The tester is stopped by stop(), which the test runners call at the end
+    of the testsuite, and which is also called at process exit.
+
+    """
+
+    def __init__(self):
+        """Create instance."""
+        self.programs = {}  # The dictionary given to UnitTester.start()
+        self._tester = None
+        self._receivers = None  # Signal receivers after the tester start
+        self._lock = threading.Lock()
+        self.removed = 0  # Number of leaked signal receivers removed
+
+    @property
+    def receivers(self):
+        """Number of signal receivers connected by the running tester."""
+        if not self._receivers:
+            return 0
+        return sum(len(receivers) for receivers in self._receivers.values())
+
+    def acquire(self, prog_class):
+        """Get the tester, ready to run a test program.
+
+        @param prog_class Test program class
+        @return UnitTester instance
+
+        """
+        with self._lock:
+            self.programs[repr(prog_class)] = prog_class
+            if not self._tester:
+                self._tester = UnitTester()
+                self._tester.start(
+                    libtester.Tester("MockATE", "MockATEa"), self.programs
+                )
+                self._receivers = self._connections()
+            self._tester.ut_reset()
+            return self._tester
+
+    def release(self):
+        """Finished with the tester, for now."""
+        with self._lock:
+            self._tester.ut_reset()
+            self._reset_receivers()
+
+    def stop(self):
+        """Stop the tester."""
+        with self._lock:
+            if self._tester:
+                self._tester.stop()
+                self._tester = None
+                self._receivers = None
+
+    @staticmethod
+    def _connections():
+        """Signal receivers connected now.
+
+        @return Dictionary of {(sender key, signal): List of receivers}
+
+        """
+        return {
+            (senderkey, signal): list(receivers)
+            for senderkey, signals in dispatcher.connections.items()
+            for signal, receivers in signals.items()
+        }
+
+    @staticmethod
+    def _sender(senderkey):
+        """Sender of a signal connection.
+
+        @param senderkey Sender key of dispatcher.connections
+        @return Sender, or None if it no longer exists
+
+        """
+        for sender in (dispatcher.Any, dispatcher.Anonymous):
+            if senderkey == id(sender):
+                return sender
+        ref = dispatcher.senders.get(senderkey)
+        return ref() if ref else None
+
+    def _reset_receivers(self):
+        """Disconnect signal receivers connected since the tester started."""
+        removed = 0
+        for senderkey, signals in list(dispatcher.connections.items()):
+            sender = self._sender(senderkey)
+            if sender is None:  # dispatcher cleans up dead senders itself
+                continue
+            for signal, receivers in list(signals.items()):
+                keep = self._receivers.get((senderkey, signal), [])
+                for receiver in [item for item in receivers if item not in keep]:
+                    weak = isinstance(
+                        receiver, (weakref.ReferenceType, saferef.BoundMethodWeakref)
+                    )
+                    if weak:
+                        receiver = receiver()
+                        if receiver is None:  # Already gone
+                            continue
+                    dispatcher.disconnect(
+                        receiver, signal=signal, sender=sender, weak=weak
+                    )
+                    removed += 1
+        self.removed += removed
+        if removed:
+            logging.getLogger(__name__).warning(
+                "Removed %s leaked signal receivers", removed
+            )
+
+
+# The TesterPool of this process
+POOL = TesterPool()
+atexit.register(POOL.stop)
+
+# Called with the delay by the patched time.sleep (None to do nothing)
+#   (Set by tests.benchmark to project cycle times)
+SLEEP_HOOK = None
+
+
 class ProgramTestCase(unittest.TestCase):
     """Product test program wrapper."""
 
@@ -123,17 +256,13 @@ class ProgramTestCase(unittest.TestCase):
             log = logging.getLogger(name)
             log.setLevel(logging.DEBUG if cls.debug else logging.INFO)
         # Patch time.sleep to remove delays
-        cls.patcher = patch("time.sleep")
+        cls.patcher = patch("time.sleep", side_effect=SLEEP_HOOK)
         cls.patcher.start()
         # Create the tester instance
         cls.ut_program = tester.TestProgram(
             repr(cls.prog_class), cls.per_panel, cls.parameter
         )
-        cls.tester = UnitTester()
-        cls.tester.start(
-            libtester.Tester("MockATE", "MockATEa"),
-            {repr(cls.prog_class): cls.prog_class},
-        )
+        cls.tester = POOL.acquire(cls.prog_class)
         cls.uuts = list(
             libtester.UUT.from_sernum("A000000000{0}".format(uut))
             for uut in range(1, cls.per_panel + 1)
@@ -164,7 +293,7 @@ class ProgramTestCase(unittest.TestCase):
             log = logging.getLogger(name)
             log.setLevel(logging.INFO)
         cls.patcher.stop()
-        cls.tester.stop()
+        POOL.release()
         elapsed = datetime.datetime.now() - cls.start_time
         elapsed = round(float(elapsed.seconds) + float(elapsed.microseconds) / 1000)
         logging.getLogger(__name__).info(
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""Audit of the fixed time delays of the Test programs.
+
+Two views of where cycle time goes in time.sleep:
+    Static: Every time.sleep() call and delay= argument with a literal
+        value in the programs and share packages.
+    Dynamic: The sleep time of each source line, per program and TestStep,
+        from a tests.benchmark run of the data feed tests.
+        A static delay is reached if the line that slept, or the program
+        line it was charged to, is in the run.
+
+Source lines are ranked by the sleep time they add to a program cycle,
+summed over all programs, to show where event driven waits would save
+the most time.
+
+Run from the command line:
+    python -m tests.delayaudit [--report cycletime.json] [--top 30]
+
+"""
+
+import argparse
+import ast
+import collections
+import json
+import pathlib
+
+from . import benchmark
+
+
+def static_delays(roots=("programs", "share")):
+    """Find the literal time delays in source code.
+
+    @param roots Package directory names, relative to the repository
+    @return List of Tuple("path:line", call name, seconds)
+
+    """
+    delays = []
+    for root in roots:
+        for path in sorted((benchmark.ROOT / root).rglob("*.py")):
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+            name = path.relative_to(benchmark.ROOT).as_posix()
+            for node in ast.walk(tree):
+                if not isinstance(node, ast.Call):
+                    continue
+                func = node.func
+                call = getattr(func, "attr", getattr(func, "id", "?"))
+                value = None
+                if call == "sleep" and node.args:
+                    value = node.args[0]
+                for keyword in node.keywords:
+                    if keyword.arg == "delay":
+                        value = keyword.value
+                seconds = _literal(value)
+                if seconds:
+                    delays.append(("{0}:{1}".format(name, node.lineno), call, seconds))
+    return delays
+
+
+def _literal(node):
+    """Value of a numeric literal.
+
+    @param node ast node, or None
+    @return Value, or None if not a numeric literal
+
+    """
+    try:
+        value = ast.literal_eval(node) if node is not None else None
+    except ValueError:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return value
+
+
+def rank(report):
+    """Rank source lines by the sleep time they add to program cycles.
+
+    @param report tests.benchmark report dictionary
+    @return List of Tuple(line, total seconds, List of (program, step, seconds))
+        largest total first
+
+    """
+    lines = collections.defaultdict(list)
+    for program, parameters in report["programs"].items():
+        for parameter, run in parameters.items():
+            label = "{0} [{1}]".format(program, parameter) if parameter else program
+            for step, record in run["steps"].items():
+                for line, seconds in record["lines"].items():
+                    lines[line].append((label, step, seconds))
+    result = [
+        (line, sum(seconds for _, _, seconds in uses), uses)
+        for line, uses in lines.items()
+    ]
+    result.sort(key=lambda item: (-item[1], item[0]))
+    return result
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Audit fixed time delays.")
+    parser.add_argument(
+        "--report", help="tests.benchmark JSON report (default: run the tests)"
+    )
+    parser.add_argument(
+        "--top", type=int, default=30, help="number of source lines to list"
+    )
+    args = parser.parse_args()
+    if args.report:
+        report = json.loads(pathlib.Path(args.report).read_text(encoding="utf-8"))
+    else:
+        report, _ = benchmark.run()
+    ranked = rank(report)
+    slept = sum(total for _, total, _ in ranked)
+    cycle = sum(
+        run["total"]
+        for parameters in report["programs"].values()
+        for run in parameters.values()
+    )
+    print(
+        "Sleep time {0:.1f}s of {1:.1f}s projected cycle time (all programs)".format(
+            slept, cycle
+        )
+    )
+    print("{0:>8} {1:>6} {2:>5}  {3}".format("Sleep", "Share", "Progs", "Source"))
+    for line, total, uses in ranked[: args.top]:
+        label, step, seconds = max(uses, key=lambda use: use[2])
+        print(
+            "{0:>7.2f}s {1:>5.1%} {2:>5}  {3}".format(
+                total, total / slept if slept else 0.0, len(uses), line
+            )
+        )
+        print("{0:>22}worst: {1} / {2} {3:.2f}s".format("", label, step, seconds))
+    seen = {line.split(" ")[0] for line, _, _ in ranked}
+    seen.update(
+        line
+        for parameters in report["programs"].values()
+        for run in parameters.values()
+        for record in run["steps"].values()
+        for line in record.get("sleepers", {})
+    )
+    unseen = [delay for delay in static_delays() if delay[0] not in seen]
+    unseen.sort(key=lambda delay: (-delay[2], delay[0]))
+    print()
+    print("Literal delays not reached by the data feed tests:")
+    for line, call, seconds in unseen[: args.top]:
+        print("{0:>7.2f}s {1:<10} {2}".format(seconds, call, line))
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,7 @@ class ACMONInitial(ProgramTestCase):
                     (sen["frequency2"], 50),
                     (sen["phase1"], 2),
                     (sen["phase2"], 2),
+                    (sen["status1_rate"], 20.0),
                 ),
             },
         }
@@ -39,5 +40,16 @@ class ACMONInitial(ProgramTestCase):
         self.tester.test(self.uuts)
         result = self.tester.ut_result[0]
         self.assertEqual("P", result.letter)
-        self.assertEqual(12, len(result.readings))
+        self.assertEqual(13, len(result.readings))
         self.assertEqual(["PowerUp", "Program", "Run"], self.tester.ut_steps)
+
+    def test_can_index(self):
+        """Status packets are read from the CAN packet index."""
+        dev = self.test_sequence.devices
+        for name, dgn in (("status1", 0x1FFAD), ("status3", 0x1FFAB)):
+            with self.subTest(name=name):
+                self.assertIs(dev["canindex"], dev[name].index)
+                self.assertEqual(dgn, dev[name].dgn)
+        self.assertIs(dev["status1"].decoder, dev["status3"].decoder)
+        self.assertIs(dev["cancapture"], dev["canindex"].capture)
+        self.assertIs(dev["cancapture"], dev["status1_timing"].capture)
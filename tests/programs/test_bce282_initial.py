@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """UnitTest for BCE282-12/24 Initial Test program."""
 
+import pathlib
+import unittest
 from unittest.mock import MagicMock, patch
 from ..data_feed import UnitTester, ProgramTestCase
 from programs import bce282
@@ -16,13 +18,11 @@ class _BCE282Initial(ProgramTestCase):
         patcher = patch("programs.bce282.console.Console")
         self.addCleanup(patcher.stop)
         patcher.start()
-        self.mybsl = MagicMock(name="tosbsl")
-        patcher = patch("programs.bce282.tosbsl.main", new=self.mybsl)
+        self.mybsl = MagicMock(name="BSL")
+        patcher = patch("programs.bce282.bsl.BSL", new=self.mybsl)
         self.addCleanup(patcher.stop)
         patcher.start()
         super().setUp()
-        self.test_sequence.msp_password = MagicMock(name="msp_password")
-        self.test_sequence.msp_savefile = MagicMock(name="msp_savefile")
 
     def _pass_run(self):
         """PASS run of the program."""
@@ -74,8 +74,8 @@ class _BCE282Initial(ProgramTestCase):
             ["Prepare", "Program", "PowerUp", "Calibration", "OCP"],
             self.tester.ut_steps,
         )
-        # Calls to tosbsl.main
-        self.assertEqual(3, self.mybsl.call_count)
+        # One BSL session to program
+        self.mybsl.return_value.program.assert_called_once_with()
 
 
 class BCE282_12_Initial(_BCE282Initial):
@@ -102,3 +102,41 @@ class BCE282_24_Initial(_BCE282Initial):
     def test_pass_run(self):
         """PASS run of the 24 program."""
         super()._pass_run()
+
+
+class BCE282BSL(unittest.TestCase):
+    """BCE282 MSP430 BSL session test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        patcher = patch("programs.bce282.tosbsl.BootStrapLoader")
+        self.addCleanup(patcher.stop)
+        self.loader = patcher.start().return_value
+        self.image = pathlib.Path(bce282.__file__).parent / "bce282_4a.txt"
+
+    def test_program(self):
+        """Calibration is kept across the mass erase."""
+        firmware = bce282.tosbsl.Memory()
+        with self.image.open("rb") as fin:
+            firmware.loadTIText(fin)
+        calibration = bytes(range(64))
+        readback = [calibration] + [
+            bce282.tosbsl.asBinary(seg.data) for seg in firmware.segments
+        ]
+        self.loader.uploadData.side_effect = [calibration] + readback
+        session = bce282.bsl.BSL("COM1", self.image, "@ffe0\n" + "ff " * 32 + "\nq\n")
+        self.assertEqual(calibration, session.program())
+        self.assertEqual(240, self.loader.MAXDATA)
+        self.loader.actionMassErase.assert_called_once_with()
+        self.assertEqual(2, self.loader.actionStartBSL.call_count)
+        segments = self.loader.programData.call_args[0][0]
+        self.assertEqual(0x10C0, segments[0].startaddress)
+        self.loader.comDone.assert_called_once_with()
+
+    def test_verify_fail(self):
+        """Verify failure."""
+        self.loader.uploadData.return_value = bytes(64)
+        session = bce282.bsl.BSL("COM1", self.image)
+        with self.assertRaises(bce282.tosbsl.BSLException):
+            session.program()
+        self.loader.comDone.assert_called_once_with()
@@ -3,6 +3,7 @@
 
 import datetime
 import copy
+import itertools
 import unittest
 from unittest.mock import Mock, patch
 from ..data_feed import UnitTester, ProgramTestCase
@@ -264,12 +265,6 @@ class CMRDataMonitor(unittest.TestCase):
         ("SERIAL NUMBER", "949"),
     )
 
-    def setUp(self):
-        """Per-Test setup."""
-        patcher = patch("share.timed.RepeatTimer")
-        self.addCleanup(patcher.stop)
-        patcher.start()
-
     def test_read(self):
         """Read CMR data."""
         myser = Mock(name="SerialPort")
@@ -288,3 +283,170 @@ class CMRDataMonitor(unittest.TestCase):
         result = cmr.read()
         cmr.close()
         self.assertEqual(myresult, result)
+
+    def test_read_split(self):
+        """Read CMR data split across serial reads."""
+        response = bytearray(b"#VOLTAGE,garbage\r\n")
+        for entry in self._data_template:
+            response += "#{0[0]},{0[1]}\r\n".format(entry).encode()
+        chunks = [response[pos : pos + 7] for pos in range(0, len(response), 7)]
+        myser = Mock(name="SerialPort")
+        myser.read.side_effect = itertools.cycle(chunks)
+        cmr = cmrsbp.cmrsbp.CmrSbp(myser)
+        result = cmr.read()
+        cmr.close()
+        self.assertEqual(13.710, result["VOLTAGE"])
+        self.assertEqual(-24416, result["PACK STATUS AND CONFIG"])
+        self.assertEqual(949, result["SERIAL NUMBER"])
+
+    def test_read_timeout(self):
+        """Read with no CMR data."""
+        myser = Mock(name="SerialPort")
+        myser.read.return_value = b""
+        cmr = cmrsbp.cmrsbp.CmrSbp(myser)
+        cmr.read_timeout = 0.05
+        result = cmr.read()
+        cmr.close()
+        self.assertEqual(0.0, result["VOLTAGE"])
+        self.assertEqual(0, result["SERIAL NUMBER"])
+
+
+class _EV2200Port:
+    """Serial port of a simulated EV2200 & BQ2060A.
+
+    Each read of the ADC result registers counts as a poll, and every
+    3rd poll gives a new ADC conversion.
+
+    """
+
+    def __init__(self):
+        """Create instance."""
+        self.ram = {
+            0x09: 12000,  # Voltage
+            0x0A: 0,  # Current
+            0x25: 0x1234,  # LightLoadEst
+            0x41: 0x0100,  # AdcOffset
+            0x43: 20000,  # AdcVoltGain
+            0x5F: 0,  # InvOffset
+        }
+        self.eeprom = bytearray(128)
+        self.slave = 0x16
+        self.writes = 0  # Number of port writes
+        self.commands = []  # All command blocks
+        self._polls = 0
+        self._response = b""
+
+    def open(self):
+        """Open port."""
+
+    def close(self):
+        """Close port."""
+
+    def reset_input_buffer(self):
+        """Flush input."""
+        self._response = b""
+
+    def write(self, data):
+        """Process command blocks."""
+        self.writes += 1
+        for pos in range(0, len(data), 5):
+            self._response += self._command(data[pos : pos + 5])
+
+    def read(self, size):
+        """Read responses."""
+        data, self._response = self._response[:size], self._response[size:]
+        return data
+
+    def _command(self, block):
+        """Process a command block."""
+        self.commands.append(bytes(block))
+        cmd, addr, val = block[1], block[2], block[3] | block[4] << 8
+        if cmd == 0x42:  # SetSMBusSlave
+            self.slave = addr
+        elif cmd in (0x60, 0x61) and self.slave == 0xA0:  # EEPROM write
+            self.eeprom[addr : addr + 2] = val.to_bytes(2, "little")
+        elif cmd in (0x60, 0x61):  # RAM write
+            self.ram[addr] = val
+        elif cmd in (0x20, 0x22) and self.slave == 0xA0:  # EEPROM read
+            val = int.from_bytes(self.eeprom[addr : addr + 2], "little")
+        elif cmd in (0x20, 0x22):  # RAM read
+            if addr == 0x09:
+                self._polls += 1
+                if not self._polls % 3:  # A new conversion
+                    self.ram[addr] ^= 1
+            val = self.ram.get(addr, 0)
+        elif cmd == 0x08:  # EchoBlock
+            addr = val = 0
+        return bytes((0xAA, cmd, addr, val & 0xFF, val >> 8))
+
+
+class EV2200(unittest.TestCase):
+    """EV2200 driver test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        self.port = _EV2200Port()
+        self.ev = cmrsbp.ev2200.EV2200(self.port)
+        self.ev.adc_poll = 0
+        self.ev.ee_powerup_delay = self.ev.ee_write_delay = 0
+        self.ev.write_ee_at_cal = False
+        patcher = patch("builtins.print")
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    def test_ram_read_many(self):
+        """Back-to-back RAM reads."""
+        self.assertEqual(
+            (0x1234, 20000),
+            self.ev._ram_read_many(("LightLoadEst[MSB]", "AdcVoltGain")),
+        )
+        self.assertEqual(1, self.port.writes)
+
+    def test_ee_dump(self):
+        """EEPROM reads are sent in chunks."""
+        self.port.eeprom[0x18:0x1A] = (1234).to_bytes(2, "little")
+        sizes = []
+        write = self.port.write
+        self.port.write = lambda data: sizes.append(len(data)) or write(data)
+        vals = self.ev._ee_dump()
+        self.assertEqual(128, len(vals))
+        self.assertEqual((0xD2, 0x04), vals[0x18:0x1A])
+        self.assertLessEqual(max(sizes), 5 * self.ev.cmd_chunk)
+
+    def test_short_response(self):
+        """A chunk with a short response is sent again one at a time."""
+        read = self.port.read
+        self.port.read = lambda size: read(size)[: min(size, 5)]
+        self.assertEqual(
+            (0x1234, 20000),
+            self.ev._ram_read_many(("LightLoadEst[MSB]", "AdcVoltGain")),
+        )
+        self.assertEqual(3, self.port.writes)
+
+    def test_cal_v(self):
+        """Voltage calibration from successive ADC conversions."""
+        readings = self.ev.cal_v(12.0)
+        self.assertEqual(20000, readings["PreFSV"])
+        self.assertAlmostEqual(20000, readings["PostFSV"], delta=2)
+        self.assertEqual(3, len(readings["AdcIntervals"]))
+        self.assertEqual(0x1234, self.port.ram[0x25])  # LLE restored
+
+    def test_sn_date(self):
+        """EEPROM writes only the words that change."""
+        writes = lambda: sum(1 for blk in self.port.commands if blk[1] == 0x60)
+        self.assertEqual({"Retries": 0}, self.ev.sn_date("2020-02-03", "1234"))
+        self.assertEqual(2, writes())
+        self.assertEqual(1234, int.from_bytes(self.port.eeprom[0x18:0x1A], "little"))
+        self.ev.sn_date("2020-02-03", "1235")
+        self.assertEqual(3, writes())
+        self.ev.close()  # A new unit is read again
+        self.port.eeprom[0x18:0x1A] = bytes(2)
+        self.ev.sn_date("2020-02-03", "1235")
+        self.assertEqual(4, writes())
+
+    def test_ee_layout(self):
+        """EEPROM data layout."""
+        fields, layout = cmrsbp.ev2200._ee_layout()
+        self.assertEqual(128, layout.size)
+        self.assertEqual((0x18, "Serial Number ", "-"), fields[14])
+        self.assertIs(layout, cmrsbp.ev2200._ee_layout()[1])
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 """UnitTest for DCX Initial Test program."""
 
+import pathlib
+import tempfile
 from unittest.mock import patch
 
+import tester
+
 from ..data_feed import UnitTester, ProgramTestCase
+import share
 from programs import dcx
 
 
@@ -79,3 +84,28 @@ class DCX(ProgramTestCase):
                 "RemoteSw",
                 "CanBus",
             ], self.tester.ut_steps)
+
+    def test_state_cache(self):
+        """PASS run with the instrument state cache."""
+        devices = self.test_sequence.devices
+        self.assertTrue(devices.cache_state)
+        self.assertIsInstance(devices["rla_loadsw"], tester.Relay)
+        with patch.object(
+            share.statecache.StateCache,
+            "invalidate",
+            autospec=True,
+            side_effect=share.statecache.StateCache.invalidate,
+        ) as invalidate:
+            self.test_pass_run()
+        # reset() forgets the state, ready for the next UUT
+        invalidate.assert_any_call(devices.state_cache)
+
+    def test_telemetry(self):
+        """PASS run with telemetry, using 'with relay:' & console[name]."""
+        with tempfile.TemporaryDirectory() as folder:
+            share.telemetry.Telemetry.enable(folder)
+            try:
+                self.test_pass_run()
+            finally:
+                share.telemetry.Telemetry.enable(None)
+            self.assertEqual(1, len(list(pathlib.Path(folder).iterdir())))
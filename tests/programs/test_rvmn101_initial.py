@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """UnitTest for RVMN101 Initial Test program."""
 
+import pathlib
+import tempfile
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from ..data_feed import UnitTester, ProgramTestCase
@@ -17,10 +19,16 @@ class RVMN101BInitial(ProgramTestCase):
 
     def setUp(self):
         """Per-Test setup."""
-        for target in ("share.bluetooth.SerialToMAC",):
-            patcher = patch(target)
-            self.addCleanup(patcher.stop)
-            patcher.start()
+        # Keep the registration journal of the tester out of the test
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        patcher = patch.object(
+            rvmn101.initial.Devices,
+            "blemac_journal",
+            pathlib.Path(tmpdir.name) / "blemac.journal",
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
         mycon = MagicMock(name="MyCon")
         type(mycon).valid_outputs = PropertyMock(return_value=self.hs_outputs)
         patcher = patch("programs.rvmn101.console.Console101B", return_value=mycon)
@@ -55,6 +55,38 @@ class RVSWT101Initial(ProgramTestCase):
         self.assertEqual(["PowerUp", "ProgramTest"], self.tester.ut_steps)
 
 
+class RVSWT101InitialPanel(RVSWT101Initial):
+    """RVSWT101 Initial program test suite, for a panel."""
+
+    per_panel = 2
+
+    def test_pass_run(self):
+        """PASS run of the program."""
+        sen = self.test_sequence.sensors
+        data = {
+            UnitTester.key_sen: {  # Tuples of sensor data
+                "PowerUp": (
+                    (sen["vin"], (3.3, 3.3)),
+                ),
+                "ProgramTest": (
+                    (sen["JLink"], 0),
+                    (sen["JLink"], 0),
+                    (sen["mirmac"], "ec70225e3dba"),
+                    (sen["mirmac"], "ec70225e3dbb"),
+                    (sen["RSSI"], -70),
+                    (sen["RSSI"], -71),
+                ),
+            },
+        }
+        self.tester.ut_load(data, self.test_sequence.sensor_store)
+        self.tester.test(self.uuts)
+        self.assertEqual(self.per_panel, len(self.tester.ut_result))
+        for res in self.tester.ut_result:
+            self.assertEqual("P", res.letter)
+            self.assertEqual(4, len(res.readings))
+        self.assertEqual(["PowerUp", "ProgramTest"], self.tester.ut_steps)
+
+
 class Fixture(unittest.TestCase):
     """RVSWT101 Initial Fixture test suite."""
 
@@ -113,6 +145,19 @@ class Fixture(unittest.TestCase):
         self.rla[mypos1].set_on.assert_called_once()
         self._reset_mocks()
 
+    def test_press_error(self):
+        """A failed button press is not hidden by the release."""
+        self.fxt.connect(1)
+        self.dcs.output.side_effect = RuntimeError("DC Source failed")
+        dev = {"fixture": self.fxt, "BLE": Mock(name="BLE")}
+        mes = {"rssi": Mock(name="rssi")}
+        with self.assertRaises(RuntimeError):
+            rvswt101.Initial._stage_bluetooth(
+                Mock(name="Initial", uuts=["A0001"]), dev, mes, 0, {0: "001ec030c2be"}
+            )
+        self.assertEqual(self.fxt.state, rvswt101.initial.FixtureState.program)
+        mes["rssi"].assert_not_called()
+
     def test_button_mode(self):
         """Button mode."""
         self.dcs.output.assert_called_once_with(0.0, output=False)
@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 """UnitTest for SelfTest program."""
 
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
 from ..data_feed import UnitTester, ProgramTestCase
 from programs import selftest
+import share
 
 
 class SelfTest(ProgramTestCase):
@@ -100,3 +106,117 @@ class SelfTest(ProgramTestCase):
             ],
             self.tester.ut_steps,
         )
+
+
+class SelfTestFast(SelfTest):
+    """SelfTest program fast self-test suite."""
+
+    parameter = "FAST"
+
+    def test_pass_run(self):
+        """PASS run of the program."""
+        sen = self.test_sequence.sensors
+        data = {
+            UnitTester.key_sen: {  # Tuples of sensor data
+                "ACSource": ((sen["oAcs"], (120, 240)),),
+                "Checker": (
+                    (sen["o12V"], 12.0),
+                    (sen["o5Va"], 5.0),
+                    (sen["o5Vb"], 5.0),
+                    (sen["o5Vc"], 5.0),
+                    (sen["o5Vd"], 5.0),
+                    (sen["o5Ve"], 5.0),
+                ),
+                "DCLoad": ((sen["oShunt"], (5e-3, 40e-3) * 7),),
+                "RelayDriver": (
+                    (sen["oRla12V"], 12.0),
+                    (sen["oRla"], (0.5, 12.0) * 22),
+                ),
+                "Discharge": (
+                    (sen["oDisch1"], (10.0, 0.0)),
+                    (sen["oDisch2"], (10.0, 0.0)),
+                    (sen["oDisch3"], (10.0, 0.0)),
+                ),
+            },
+            UnitTester.key_call: {  # Callables
+                "DCSource": (self._dcs_store, (5.0, 35.0)),
+            },
+        }
+        self.tester.ut_load(data, self.test_sequence.sensor_store)
+        self.tester.test(self.uuts)
+        result = self.tester.ut_result[0]
+        self.assertEqual("P", result.letter)
+        self.assertEqual(87, len(result.readings))
+        self.assertEqual(
+            [
+                "ACSource",
+                "Checker",
+                "DCSource",
+                "DCLoad",
+                "RelayDriver",
+                "Discharge",
+            ],
+            self.tester.ut_steps,
+        )
+
+
+class SelfTestTrend(SelfTestFast):
+    """SelfTest program trend channels test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.trend_path = pathlib.Path(tmpdir.name) / "trend.sqlite"
+        share.trend.TrendStore.enable(self.trend_path)
+        self.addCleanup(share.trend.TrendStore.enable, None)
+        super().setUp()
+
+    def test_pass_run(self):
+        """Readings are trended per instrument and point."""
+        super().test_pass_run()
+        expected = []
+        for prefix, count, points in (
+            ("dcs", 7, ("5V", "35V")),
+            ("dcl", 7, ("5A", "30A")),
+            ("rla", 22, ("on", "off")),
+        ):
+            for num in range(1, count + 1):
+                for point in points:
+                    expected.append("{0}{1}.{2}".format(prefix, num, point))
+        self.assertEqual(
+            sorted(expected), share.trend.TrendStore(self.trend_path).channels()
+        )
+
+
+class DCLoad(unittest.TestCase):
+    """SelfTest DC Load matrix test suite."""
+
+    def test_stages(self):
+        """A DC Load is turned off in its own stage before the next one is on."""
+        program = Mock(name="Main")
+        program.devices.dcl = ("dcl1", "dcl2")
+        meas = Mock(name="dmm_Shunt")
+        program.measurements = {"dmm_Shunt": ((5.0, meas),)}
+        program._levels.side_effect = lambda levels, fast: list(levels)
+        with patch.object(selftest.matrix.Matrix, "run", autospec=True) as run:
+            selftest.Main._step_dcload(program)
+        points = run.call_args[0][0].points
+
+        def on(name):
+            return (
+                (name, "output", {"current": 5.0, "output": True}),
+                (name, "opc"),
+            )
+
+        def off(name):
+            return ((name, "output", {"current": 0.0, "output": False}),)
+
+        self.assertEqual(
+            [
+                ("DCL1", ((), on("dcl1"))),
+                ("DCL2", (off("dcl1"), on("dcl2"))),
+                ("Off", (off("dcl2"),)),
+            ],
+            [(point.name, point.stimulus) for point in points],
+        )
@@ -2,16 +2,30 @@
 # Copyright 2017 SETEC Pty Ltd.
 """Unittests for Share."""
 
+from . import test_bluetooth
 from . import test_can
 from . import test_console
+from . import test_devices
 from . import test_mac
 from . import test_parameter
+from . import test_profiler
+from . import test_programmer
+from . import test_statecache
+from . import test_telemetry
 from . import test_timed
+from . import test_trend
 
 __all__ = [
+    "test_bluetooth",
     "test_can",
     "test_console",
+    "test_devices",
     "test_mac",
     "test_parameter",
+    "test_profiler",
+    "test_programmer",
+    "test_statecache",
+    "test_telemetry",
     "test_timed",
+    "test_trend",
 ]
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""UnitTest for Bluetooth SerialToMAC module."""
+
+import pathlib
+import socket
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import jsonrpclib
+from jsonrpclib.SimpleJSONRPCServer import SimpleJSONRPCServer
+
+import share
+
+
+class StandInServer:
+    """Local stand-in for the SerialToMAC JSON-RPC server."""
+
+    def __init__(self):
+        """Create instance."""
+        self.store = {}
+        self.calls = 0
+        self._server = SimpleJSONRPCServer(("127.0.0.1", 0), logRequests=False)
+        self._server.register_function(self.blemac_get)
+        self._server.register_function(self.blemac_set)
+        host, port = self._server.server_address
+        self.url = "http://{0}:{1}/".format(host, port)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.01}
+        )
+
+    def start(self):
+        """Start serving."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def blemac_get(self, serial):
+        """RPC: Read a MAC."""
+        self.calls += 1
+        return self.store[serial]
+
+    def blemac_set(self, serial, blemac):
+        """RPC: Save a MAC."""
+        self.calls += 1
+        self.store[serial] = blemac
+
+
+class SerialToMAC(unittest.TestCase):
+    """SerialToMAC test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        self.server = StandInServer()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.client = share.bluetooth.SerialToMAC(self.server.url)
+        self.addCleanup(self.client.close)
+
+    def test_set_get(self):
+        """Save and read a MAC."""
+        self.client.blemac_set("A2026010001", "001ec030bc15")
+        self.assertEqual("001ec030bc15", self.client.blemac_get("A2026010001"))
+
+    def test_reuse(self):
+        """A connection is reused between calls."""
+        with patch("jsonrpclib.ServerProxy", wraps=jsonrpclib.ServerProxy) as server:
+            for num in range(5):
+                self.client.blemac_set("A202601000{0}".format(num), "00")
+        self.assertEqual(1, server.call_count)
+
+    def test_set_many(self):
+        """Save many MACs in one request."""
+        pairs = [("A202601000{0}".format(num), "0{0}".format(num)) for num in range(5)]
+        self.client.blemac_set_many(pairs)
+        self.assertEqual(dict(pairs), self.server.store)
+
+    def test_get_error(self):
+        """A failed read returns the error message."""
+        client = share.bluetooth.SerialToMAC("http://127.0.0.1:1/")
+        self.assertIn("refused", client.blemac_get("A0000000000"))
+
+    def test_reconnect(self):
+        """A dropped connection is replaced."""
+        self.client.blemac_set("A2026010001", "01")
+        calls = []
+
+        def dropped(svr):
+            calls.append(svr)
+            if len(calls) == 1:
+                raise ConnectionResetError()
+            return svr.blemac_get("A2026010001")
+
+        self.assertEqual("01", self.client._call(dropped))
+        self.assertEqual(2, len(calls))
+        self.assertIsNot(calls[0], calls[1])
+
+    def test_timeout(self):
+        """A call to a server that does not answer times out."""
+        with socket.socket() as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            client = share.bluetooth.SerialToMAC(
+                "http://127.0.0.1:{0}/".format(listener.getsockname()[1]),
+                timeout=0.1,
+            )
+            with self.assertRaises(OSError):
+                client.blemac_set("A2026010001", "01")
+
+
+class RegistrationQueue(unittest.TestCase):
+    """RegistrationQueue test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.journal = pathlib.Path(tmpdir.name) / "journal"
+        self.client = Mock(name="SerialToMAC")
+
+    def test_put(self):
+        """Registrations are sent by the worker."""
+        queue = share.bluetooth.RegistrationQueue(self.journal, self.client)
+        queue.start()
+        queue.put("A2026010001", "01")
+        self.assertTrue(queue.barrier(5))
+        queue.stop()
+        self.client.blemac_set_many.assert_called_once_with([("A2026010001", "01")])
+        self.assertEqual("", self.journal.read_text())
+
+    def test_single(self):
+        """A client without blemac_set_many is sent one record at a time."""
+        client = Mock(name="MAC", spec=["blemac_set"])
+        queue = share.bluetooth.RegistrationQueue(self.journal, client)
+        queue.start()
+        queue.put("A2026010001", "01")
+        queue.put("A2026010002", "02")
+        self.assertTrue(queue.barrier(5))
+        queue.stop()
+        self.assertEqual(
+            [("A2026010001", "01"), ("A2026010002", "02")],
+            [call.args for call in client.blemac_set.call_args_list],
+        )
+
+    def test_stop_timeout(self):
+        """Stop does not wait forever for a server that does not answer."""
+        release = threading.Event()
+        self.client.blemac_set_many.side_effect = lambda batch: release.wait()
+        queue = share.bluetooth.RegistrationQueue(self.journal, self.client)
+        queue.start()
+        self.addCleanup(queue._worker.join)  # Before the journal is removed
+        self.addCleanup(release.set)
+        queue.put("A2026010001", "01")
+        with self.assertLogs(level="WARNING") as logs:
+            queue.stop(timeout=0.1)
+        self.assertIn("A2026010001", logs.output[-1])
+
+    def test_retry(self):
+        """A failed send is retried."""
+        self.client.blemac_set_many.side_effect = (ConnectionError(), None)
+        queue = share.bluetooth.RegistrationQueue(
+            self.journal, self.client, retry_delay=0.01
+        )
+        queue.start()
+        queue.put("A2026010001", "01")
+        self.assertTrue(queue.barrier(5))
+        queue.stop()
+        self.assertEqual(2, self.client.blemac_set_many.call_count)
+
+    def test_locked(self):
+        """A journal can only be used by one queue at a time."""
+        queue = share.bluetooth.RegistrationQueue(self.journal, self.client)
+        queue.start()
+        other = share.bluetooth.RegistrationQueue(self.journal, self.client)
+        with self.assertRaises(share.bluetooth.JournalLockedError):
+            other.start()
+        queue.stop()
+        other.start()
+        other.stop()
+
+    def test_replay(self):
+        """Registrations left in the journal are sent upon start."""
+        self.client.blemac_set_many.side_effect = ConnectionError()
+        queue = share.bluetooth.RegistrationQueue(self.journal, self.client)
+        queue.start()
+        queue.put("A2026010001", "01")
+        queue.put("A2026010002", "02")
+        queue.stop(timeout=0.1)
+        client = Mock(name="SerialToMAC")
+        queue = share.bluetooth.RegistrationQueue(self.journal, client)
+        queue.start()
+        self.assertTrue(queue.barrier(5))
+        queue.stop()
+        client.blemac_set_many.assert_called_once_with(
+            [("A2026010001", "01"), ("A2026010002", "02")]
+        )
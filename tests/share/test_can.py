@@ -1,7 +1,14 @@
 #!/usr/bin/env python3
 """UnitTest for CAN."""
 
+import itertools
+import logging
+import threading
+import time
 import unittest
+from unittest.mock import Mock
+
+import tester
 
 import share
 
@@ -75,6 +82,130 @@ class CAN(unittest.TestCase):
         self.maxDiff = None
         self.assertEqual(dec.fields, decoded)
 
+    def test_acmonstatusdecoder_stream(self):
+        """ACMONStatusDecoder decoding rate of a packet stream."""
+        dec = share.can.ACMONStatusDecoder()
+        stream = []
+        for dgn, data in (  # Captured from an ACMON under load
+            (share.can.setec_rvc.DGN.ACSTATUS1, b"\x01\xff\xff\xd0\x84\x00\x18\x00"),
+            (share.can.setec_rvc.DGN.ACSTATUS1, b"\x81\xff\xff\x08\x84\x00\x1a\x00"),
+            (share.can.setec_rvc.DGN.ACSTATUS3, b"\x01\xcb\xff\xff\xff\xff\xff\xff"),
+            (share.can.setec_rvc.DGN.ACSTATUS3, b"\x81\xcb\xff\xff\xff\xff\xff\xff"),
+        ):
+            header = share.can.RVCHeader()
+            header.message.DGN = dgn
+            stream.append(share.can.CANPacket(header, data, rvc_mode=True))
+        stream *= 2500
+        start = time.perf_counter()
+        for packet in stream:
+            dec.decode(packet)
+        elapsed = time.perf_counter() - start
+        logging.getLogger(__name__).info(
+            "ACMONStatusDecoder: %.0f frames/s", len(stream) / elapsed
+        )
+        self.assertEqual(38, len(dec.fields))
+        self.assertEqual(100.0, dec.fields["S1L1_current"])
+        self.assertEqual(52.0, dec.fields["S1L2_frequency"])
+        self.assertEqual(2, dec.fields["S3L2_phase"])
+
+    def test_packetindex(self):
+        """PacketIndex routing of packets."""
+        index = share.can.PacketIndex(Mock(name="CANReader"))
+        header = share.can.RVCHeader()
+        header.message.DGN = share.can.setec_rvc.DGN.RVMN101
+        header.message.SA = share.can.setec_rvc.DeviceID.RVMC101
+        switch = share.can.CANPacket(
+            header, b"\x00\x00\x40\x00\x00\x00\x00\xa5", rvc_mode=True
+        )
+        index.put(switch)
+        device = share.can.CANPacket(header, b"\x0a" + bytes(7), rvc_mode=True)
+        index.put(device)
+        dgn = share.can.setec_rvc.DGN.RVMN101.value
+        self.assertIs(device, index.latest(dgn))
+        self.assertIs(switch, index.latest(dgn, command=0))
+        self.assertIs(device, index.latest(dgn, sa=0x44, command=10))
+        self.assertIsNone(index.latest(dgn, sa=0x54))
+        self.assertIsNone(index.wait(dgn, command=1, timeout=0))
+        time.sleep(0.02)
+        self.assertIsNone(index.latest(dgn, max_age=0.01))
+        # Read a decoded property of the newest Switch Status packet
+        reader = share.can.IndexedPropertyReader(
+            index, share.can.SwitchStatusDecoder(), dgn, command=0, timeout=0
+        )
+        reader.configure("zone4")
+        self.assertTrue(reader.read(None))
+
+    def test_packetindex_worker(self):
+        """PacketIndex worker skips bad packets, and reports a failed reader."""
+        dgn = share.can.setec_rvc.DGN.RVMN101.value
+        setec = Mock(name="SETECPacket")
+        setec.header.message = object()  # A SETEC header has no DGN
+        broken = Mock(name="BrokenPacket")  # Packet data cannot be indexed
+        good = Mock(name="RVCPacket", data=b"\x0a" + bytes(7))
+        good.header.message.DGN, good.header.message.SA = dgn, 0x44
+        packets = iter((setec, broken, good))
+        failed = threading.Event()
+
+        def read():
+            for packet in packets:
+                return packet
+            failed.wait(2)
+            raise OSError("CAN interface closed")
+
+        index = share.can.PacketIndex(Mock(name="CANReader", read=read))
+        with self.assertLogs("share.can.PacketIndex", level="ERROR") as logs:
+            with index:
+                self.assertIs(good, index.wait(dgn, timeout=2))
+                failed.set()
+                with self.assertRaises(share.can.PacketIndexError):
+                    index.wait(dgn, command=1, timeout=2)
+                with self.assertRaises(share.can.PacketIndexError):
+                    index.latest(dgn)
+        self.assertEqual(2, len(logs.records))  # Broken packet & failed reader
+
+    def test_packetdetector(self):
+        """PacketDetector traffic statistics."""
+        header = share.can.RVCHeader()
+        header.message.DGN = share.can.setec_rvc.DGN.RVMN101
+        packet = share.can.CANPacket(header, bytes(8), rvc_mode=True)
+        reader = Mock(name="CANReader")
+        reader.read.side_effect = [tester.CANReaderError(), packet, packet]
+        det = share.can.PacketDetector(reader, min_frames=2, window=10)
+        det.configure(None)
+        self.assertTrue(det.read(None))  # Stops early after 2 packets
+        self.assertEqual(3, reader.read.call_count)
+        det.configure("timeouts")
+        reader.read.side_effect = tester.CANReaderError()
+        det.window = 0
+        self.assertEqual(1, det.read(None))  # A single read with no traffic
+        self.assertEqual(0, det.stats["frames"])
+        self.assertEqual(0, det.stats["ids"])
+
+    def test_packetcapture(self):
+        """PacketCapture history queries."""
+        cap = share.can.PacketCapture(size=8)
+        header = share.can.RVCHeader()
+        header.message.DGN = share.can.setec_rvc.DGN.ACSTATUS1
+        for num in range(10):  # Overfill the buffer, 50ms apart
+            data = bytes([0x01 | (num & 1) << 7, 0xFF, 0xFF, num, 0x84, 0, 0x18, 0])
+            cap.put(share.can.CANPacket(header, data, rvc_mode=True), num * 0.05)
+        self.assertEqual(8, len(cap))
+        dgn = share.can.setec_rvc.DGN.ACSTATUS1.value
+        self.assertAlmostEqual(20.0, cap.rate(dgn))
+        self.assertEqual(0.0, cap.rate(share.can.setec_rvc.DGN.ACSTATUS3.value))
+        jitter = cap.jitter(dgn)
+        self.assertAlmostEqual(0.05, jitter["mean"])
+        self.assertAlmostEqual(0.0, jitter["stdev"])
+        self.assertEqual([7, 8, 9], cap.values(dgn, 24, 8, count=3))  # Byte 3
+        self.assertEqual([1, 0, 1], cap.values(dgn, 7, 1, count=3))  # Leg
+        reader = share.can.PacketRateReader(cap, dgn)
+        reader.configure("rate")
+        self.assertAlmostEqual(20.0, reader.read(None))
+        reader.configure("max")
+        self.assertAlmostEqual(0.05, reader.read(None))
+        reader.dgn = share.can.setec_rvc.DGN.ACSTATUS3.value
+        self.assertIsNone(reader.read(None))
+
     def test_devicestatuspacket(self):
         """DeviceStatusPacket decoding."""
         header = share.can.RVCHeader()
@@ -147,6 +278,27 @@ class CAN(unittest.TestCase):
         data = b"\x01\x55\x55\xff\xff\xff\x01\xa9"
         self.assertEqual(bld.packet.data, data)
 
+    def test_rvmc101controlledbuilder_burst(self):
+        """RVMC101ControlLEDBuilder burst of patterns."""
+        bld = share.can.RVMC101ControlLEDBuilder()
+        candev = Mock(name="CAN")
+        checksums = []
+        candev.send.side_effect = lambda packet: checksums.append(
+            (packet.data[7], sum(packet.data[:7]) & 0xFF)
+        )
+        patterns = [1 << (num % 7) for num in range(300)]  # Sequence wraps
+        sent = bld.burst(candev, patterns, 0)
+        self.assertEqual(300, len(sent))
+        self.assertEqual(300, candev.send.call_count)
+        for checksum, expected in checksums:
+            self.assertEqual(expected, checksum)
+        self.assertEqual(300 & 0xFF, bld.packet.data[6])
+        stop = Mock(name="Event")
+        stop.wait.side_effect = (False, False, True)
+        sent = bld.burst(candev, itertools.cycle((1, 2)), 0.5, stop=stop)
+        self.assertEqual(2, len(sent))
+        self.assertEqual(3, stop.wait.call_count)
+
     def test_rvmd50controllcdbuilder(self):
         """RVMD50ControlLCDBuilder creation."""
         data = b"\x10\x00\x00\x00\x00\x00\x00\x00"
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""UnitTest for the safe state & closers of share.Devices."""
+
+import threading
+import unittest
+from unittest.mock import Mock
+
+import libtester
+import tester
+
+import share
+
+
+class _Device:
+    """An instrument that logs its calls."""
+
+    def __init__(self, name, log, barrier):
+        """Create instance.
+
+        @param name Device name
+        @param log List of (name, method, value, thread name)
+        @param barrier threading.Barrier of the devices that meet
+
+        """
+        self.name = name
+        self.log = log
+        self.barrier = barrier
+
+    def _record(self, method, value=None):
+        """Log a call."""
+        self.log.append((self.name, method, value, threading.current_thread().name))
+
+    def output(self, value, output=True):
+        """Set output."""
+        self._record("output", (value, output))
+
+    def meet(self):
+        """Wait until the other meeting devices are called."""
+        self.barrier.wait()
+        self._record("meet")
+
+    def fail(self):
+        """Fail to do anything."""
+        raise ValueError("Instrument failed")
+
+
+class Devices(unittest.TestCase):
+    """Devices test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        self.log = []
+        self.barrier = threading.Barrier(2, timeout=2)
+        self.devices = self._devices()
+
+    def _devices(self, safe_state=(), reset_workers=8, instruments=None):
+        """Devices instance with devices 'a', 'b' & 'c'.
+
+        @param safe_state Safe state of the instruments
+        @param reset_workers Maximum number of instruments to reset at once
+        @param instruments Instrument of each device (default: one each)
+        @return share.Devices instance
+
+        """
+        if instruments is None:
+            instruments = {"a": "DCS1", "b": "DCS2", "c": "DCS3"}
+        cls = type(
+            "Devices",
+            (share.Devices,),
+            {
+                "safe_state": safe_state,
+                "reset_workers": reset_workers,
+                "instruments": instruments,
+            },
+        )
+        devices = cls(
+            "ATE4",
+            Mock(spec=tester.PhysicalDevices),
+            Mock(spec=libtester.Fixture),
+            None,
+        )
+        for name in ("a", "b", "c"):
+            devices[name] = _Device(name, self.log, self.barrier)
+        return devices
+
+    def _calls(self):
+        """Logged calls, without the thread names."""
+        return [entry[:3] for entry in self.log]
+
+    def test_stages(self):
+        """Stages are applied in order, each stage concurrently."""
+        devices = self._devices(
+            (
+                (("a", "meet"), ("b", "meet")),
+                (("c", "output", 1.0),),
+            )
+        )
+        devices.reset()
+        calls = self._calls()
+        self.assertCountEqual([("a", "meet", None), ("b", "meet", None)], calls[:2])
+        self.assertEqual([("c", "output", (1.0, True))], calls[2:])
+
+    def test_same_device(self):
+        """Actions on the same device are applied in order."""
+        devices = self._devices(
+            (
+                (
+                    ("a", "output", 5.0),
+                    ("b", "output", 1.0),
+                    ("a", "output", 0.0, {"output": False}),
+                    ("a", "output", 2.0),
+                ),
+            )
+        )
+        devices.reset()
+        self.assertEqual(
+            [(5.0, True), (0.0, False), (2.0, True)],
+            [value for name, _, value in self._calls() if name == "a"],
+        )
+
+    def test_same_instrument(self):
+        """Actions on the same instrument are applied in order."""
+        stage = (
+            ("a", "output", 1.0),
+            ("c", "output", 9.0),
+            ("b", "output", 2.0),
+            ("a", "output", 3.0),
+        )
+        for instruments in ({"a": "DCS", "b": "DCS", "c": "DCL"}, {}):
+            with self.subTest(instruments=instruments):
+                del self.log[:]
+                devices = self._devices((stage,), instruments=instruments)
+                devices.reset()
+                self.assertEqual(
+                    [(1.0, True), (2.0, True), (3.0, True)],
+                    [value for name, _, value in self._calls() if name != "c"],
+                )
+
+    def test_default(self):
+        """Devices are reset one at a time by default."""
+        self.assertEqual(1, share.Devices.reset_workers)
+
+    def test_closers(self):
+        """Adjacent parallel closers are called together, others in LIFO."""
+        self.devices.add_closer(self.devices["c"].meet)
+        self.devices.add_closer(self.devices["a"].meet, parallel=True)
+        self.devices.add_closer(self.devices["b"].meet, parallel=True)
+        self.devices.add_closer(lambda: self.devices["c"].output(0.0, False))
+        self.devices["c"].barrier = threading.Barrier(1)
+        self.devices.close()
+        calls = self._calls()
+        self.assertEqual(("c", "output", (0.0, False)), calls[0])
+        self.assertCountEqual([("a", "meet", None), ("b", "meet", None)], calls[1:3])
+        self.assertEqual([("c", "meet", None)], calls[3:])
+
+    def test_exception(self):
+        """An exception is raised after the whole stage is applied."""
+        devices = self._devices(
+            (
+                (("a", "fail"), ("b", "output", 1.0)),
+                (("c", "output", 1.0),),
+            )
+        )
+        with self.assertRaises(ValueError):
+            devices.reset()
+        self.assertEqual([("b", "output", (1.0, True))], self._calls())
+
+    def test_sequential(self):
+        """reset_workers = 1 applies everything in order on the caller thread."""
+        devices = self._devices(
+            (
+                (("a", "output", 1.0), ("b", "output", 2.0)),
+                (("c", "output", 3.0),),
+            ),
+            reset_workers=1,
+        )
+        devices.reset()
+        devices.add_closer(lambda: devices["a"].output(0.0), parallel=True)
+        devices.add_closer(lambda: devices["b"].output(0.0), parallel=True)
+        devices.close()
+        self.assertEqual(
+            [
+                ("a", "output", (1.0, True)),
+                ("b", "output", (2.0, True)),
+                ("c", "output", (3.0, True)),
+                ("b", "output", (0.0, True)),
+                ("a", "output", (0.0, True)),
+            ],
+            self._calls(),
+        )
+        caller = threading.current_thread().name
+        self.assertTrue(all(entry[3] == caller for entry in self.log))
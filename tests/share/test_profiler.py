@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""UnitTest for the profiler module."""
+
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import share
+
+
+class Profiler(unittest.TestCase):
+    """Profiler test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.directory = pathlib.Path(tmpdir.name)
+        self.addCleanup(share.profiler.Profiler.enable, None)
+        patcher = patch("share.profiler.dispatcher")
+        self.dispatcher = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_disabled(self):
+        """No profiler unless enabled."""
+        self.assertIsNone(share.profiler.Profiler.create())
+
+    def test_run(self):
+        """Samples are tagged with the step name."""
+        share.profiler.Profiler.enable(self.directory, interval=10.0)
+        prof = share.profiler.Profiler.create()
+        prof.start()
+        receiver = self.dispatcher.connect.call_args[0][0]
+        receiver(name="OCP;1")
+        prof.sample()
+        prof.stop()
+        self.dispatcher.disconnect.assert_called_once()
+        (path,) = self.directory.iterdir()
+        self.assertTrue(path.name.endswith("_OCP_1.folded"))
+        stack, count = path.read_text().splitlines()[0].rsplit(" ", 1)
+        self.assertEqual("1", count)
+        self.assertTrue(stack.startswith("OCP_1;"))
+        self.assertTrue(stack.endswith(".test_run"))
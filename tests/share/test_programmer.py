@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""UnitTest for Programmer image cache & ARM programmer."""
+
+import concurrent.futures
+import hashlib
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import share
+
+
+class ImageCache(unittest.TestCase):
+    """ImageCache test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.folder = pathlib.Path(tmpdir.name)
+        self.cache = share.programmer.ImageCache()
+
+    def test_bin(self):
+        """Binary image is loaded once."""
+        path = self.folder / "image.bin"
+        path.write_bytes(b"\x01\x02\x03")
+        image = self.cache.get(path)
+        self.assertEqual(b"\x01\x02\x03", bytes(image.data))
+        self.assertTrue(image.data.readonly)
+        self.assertEqual(hashlib.sha256(b"\x01\x02\x03").hexdigest(), image.sha256)
+        self.assertIs(image, self.cache.get(str(path)))
+
+    def test_reload(self):
+        """A changed file is reloaded, a borrowed image is unchanged."""
+        path = self.folder / "image.bin"
+        path.write_bytes(b"\x01\x02\x03")
+        first = self.cache.get(path)
+        path.write_bytes(b"")  # Truncate the file in place
+        path.unlink()
+        path.write_bytes(b"\x01\x02")
+        second = self.cache.get(path)
+        self.assertIsNot(first, second)
+        self.assertEqual(b"\x01\x02\x03", bytes(first.data))
+        self.assertEqual(b"\x01\x02", bytes(second.data))
+
+    def test_preload(self):
+        """Preload returns image digests."""
+        path = self.folder / "image.bin"
+        path.write_bytes(b"\x01")
+        self.assertEqual(
+            {"image.bin": hashlib.sha256(b"\x01").hexdigest()},
+            self.cache.preload([path]),
+        )
+
+
+class ARM(unittest.TestCase):
+    """ARM programmer test suite."""
+
+    port = "COM9"
+
+    def setUp(self):
+        """Per-Test setup."""
+        for target, name in (
+            ("share.programmer.arm.serial.Serial", "serial"),
+            ("share.programmer.arm.isplpc.Programmer", "programmer"),
+            ("share.programmer.image.load", "load"),
+            ("time.sleep", "sleep"),
+        ):
+            patcher = patch(target)
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+        self.load.return_value.data = bytes(256)
+        self.ser = self.serial.return_value
+        self.ser.in_waiting = 0
+        self.ser.read_until.return_value = b"Synchronized\r\n"
+        self.reset_relay = Mock(name="Relay")
+        self.arm = share.programmer.ARM(
+            self.port, pathlib.Path("image.bin"), reset_relay=self.reset_relay
+        )
+        self.arm.result_check = Mock(name="result_check")
+        self.addCleanup(share.programmer.ARM.port_baudrate.pop, self.port, None)
+
+    def test_negotiate(self):
+        """The baud rate is the fastest that the bootloader syncs at."""
+        self.ser.read_until.side_effect = (b"", b"Synchronized\r\n")
+        self.arm.program()
+        self.assertEqual(self.arm.pass_result, self.arm.result)
+        self.assertEqual(230400, self.ser.baudrate)
+        self.assertEqual(230400, share.programmer.ARM.port_baudrate[self.port])
+        # Reset for each sync attempt, then again to program
+        self.assertEqual(3, self.reset_relay.pulse.call_count)
+        self.programmer.assert_called_once()
+
+    def test_device_error(self):
+        """A device failure is not retried."""
+        self.programmer.return_value.program.side_effect = ValueError("Bad")
+        self.arm.program()
+        self.assertEqual("Bad", self.arm.result)
+        self.programmer.assert_called_once()
+        self.assertNotIn(self.port, share.programmer.ARM.port_baudrate)
+
+    def test_comm_error(self):
+        """A communication error is retried at a slower baud rate."""
+        self.programmer.return_value.program.side_effect = (OSError("Lost"), None)
+        self.arm.program()
+        self.assertEqual(self.arm.pass_result, self.arm.result)
+        self.assertEqual(2, self.programmer.call_count)
+        self.assertEqual(230400, share.programmer.ARM.port_baudrate[self.port])
+
+    def test_protocol_error(self):
+        """An isplpc protocol error is retried at a slower baud rate."""
+        error = type("SyncError", (Exception,), {"__module__": "isplpc.isp"})
+        self.programmer.return_value.program.side_effect = (error("Sync"), None)
+        self.arm.program()
+        self.assertEqual(self.arm.pass_result, self.arm.result)
+        self.assertEqual(2, self.programmer.call_count)
+        self.assertEqual(230400, share.programmer.ARM.port_baudrate[self.port])
+
+    def test_not_resettable(self):
+        """A device without RESET is programmed at the slowest rate."""
+        share.programmer.ARM.port_baudrate[self.port] = 460800
+        arm = share.programmer.ARM(
+            self.port, pathlib.Path("image.bin"), boot_relay=Mock(name="Relay")
+        )
+        arm.result_check = Mock(name="result_check")
+        self.programmer.return_value.program.side_effect = OSError("Lost")
+        arm.program()
+        self.assertEqual("Lost", arm.result)
+        self.serial.assert_called_once_with(port=self.port, baudrate=115200)
+        self.ser.read_until.assert_not_called()
+        self.programmer.assert_called_once()
+
+    def test_worker_error(self):
+        """Any exception from the worker is passed to the future."""
+        self.arm._future = concurrent.futures.Future()
+        pgm = Mock(name="Programmer")
+        pgm.program.side_effect = KeyboardInterrupt
+        with self.assertRaises(KeyboardInterrupt):
+            self.arm.worker(pgm)
+        self.assertIsInstance(self.arm.future.exception(0), KeyboardInterrupt)
+
+    def test_port_settings(self):
+        """Port settings go to the real port."""
+        port = Mock(name="Serial")
+        port.write.return_value = 3
+        wrapper = share.programmer.arm._CountingPort(
+            port, share.programmer.arm.Progress()
+        )
+        wrapper.baudrate = 115200
+        wrapper.timeout = 1.0
+        wrapper.write(b"abc")
+        self.assertEqual((115200, 1.0), (port.baudrate, port.timeout))
+        self.assertEqual(3, wrapper._progress.written)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""UnitTest for the statecache module."""
+
+import unittest
+from unittest.mock import patch
+
+import share
+
+
+class _Source:
+    """A DC Source like instrument."""
+
+    def __init__(self):
+        """Create instance."""
+        self.calls = []
+
+    def output(self, value, output=True, delay=0):
+        """Set output."""
+        self.calls.append(("output", value, output))
+        if value < 0:
+            raise ValueError("Negative output")
+
+    def opc(self):
+        """Wait for operation complete."""
+        self.calls.append(("opc",))
+
+    def linear(self, start, end, step):
+        """Ramp the output."""
+        self.calls.append(("linear", start, end, step))
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.calls.append(("enter",))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context manager exit."""
+        self.calls.append(("exit",))
+
+
+class _Cache(share.statecache.StateCache):
+    """StateCache of _Source instruments."""
+
+    methods = ((_Source, ("output",)),)
+
+
+class StateCache(unittest.TestCase):
+    """StateCache test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        self.cache = _Cache()
+        self.source = _Source()
+        self.dev = self.cache.wrap("dcs", self.source)
+
+    def test_wrap(self):
+        """Only supported devices are wrapped."""
+        self.assertIsInstance(self.dev, _Source)
+        other = object()
+        self.assertIs(other, self.cache.wrap("other", other))
+
+    @patch("time.sleep")
+    def test_suppress(self, sleep):
+        """Repeated settings are dropped, keeping the delay."""
+        self.dev.output(12.0)
+        self.dev.opc()
+        self.dev.output(12.0, True)
+        self.dev.output(12.0, output=True, delay=0.5)
+        self.assertEqual([("output", 12.0, True), ("opc",)], self.source.calls)
+        sleep.assert_called_once_with(0.5)
+        self.assertEqual(2, self.cache.suppressed["dcs"])
+        self.dev.output(12.0, False)
+        self.assertEqual(("output", 12.0, False), self.source.calls[-1])
+
+    def test_invalidate(self):
+        """Other methods & errors forget the state."""
+        self.dev.output(5.0)
+        self.dev.linear(5.0, 10.0, 0.1)
+        self.dev.output(5.0)
+        with self.assertRaises(ValueError):
+            self.dev.output(-1.0)
+        self.dev.output(5.0)
+        self.cache.invalidate()
+        self.dev.output(5.0)
+        self.assertEqual(
+            [
+                ("output", 5.0, True),
+                ("linear", 5.0, 10.0, 0.1),
+                ("output", 5.0, True),
+                ("output", -1.0, True),
+                ("output", 5.0, True),
+                ("output", 5.0, True),
+            ],
+            self.source.calls,
+        )
+        self.assertEqual(0, self.cache.suppressed["dcs"])
+
+    def test_clear(self):
+        """Clear forgets everything."""
+        self.dev.output(5.0)
+        self.dev.output(5.0)
+        self.cache.clear()
+        self.assertEqual(0, sum(self.cache.suppressed.values()))
+        self.dev.output(5.0)
+        self.assertEqual(2, len(self.source.calls))
+
+    def test_special(self):
+        """Special methods are passed through, and forget the state."""
+        self.dev.output(5.0)
+        with self.dev:
+            pass
+        self.dev.output(5.0)
+        self.assertEqual(
+            [("output", 5.0, True), ("enter",), ("exit",), ("output", 5.0, True)],
+            self.source.calls,
+        )
+        with self.assertRaises(TypeError):
+            self.dev["name"]
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""UnitTest for the telemetry module."""
+
+import csv
+import pathlib
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import share
+
+
+class _Console:
+    """A console like device."""
+
+    def __init__(self):
+        """Create instance."""
+        self.values = {}
+
+    def __getitem__(self, key):
+        """Read a value."""
+        return self.values[key]
+
+    def __setitem__(self, key, value):
+        """Write a value."""
+        self.values[key] = value
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.values["entered"] = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context manager exit."""
+        self.values["entered"] = False
+
+
+class Trace(unittest.TestCase):
+    """Trace test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        self.trace = share.telemetry.Trace()
+
+    def test_device(self):
+        """Device method calls are timed."""
+        device = MagicMock(name="DCSource")
+        device.output.return_value = 5
+        proxy = self.trace.device("dcs_vin", device)
+        self.assertEqual(5, proxy.output(12.0, output=True))
+        device.output.assert_called_once_with(12.0, output=True)
+        proxy.voltage = 3  # Attributes are set on the device
+        self.assertEqual(3, device.voltage)
+        self.assertIsInstance(proxy, MagicMock)
+        kind, name, start, end = self.trace.events[0]
+        self.assertEqual(("device", "dcs_vin.output"), (kind, name))
+        self.assertLessEqual(start, end)
+
+    def test_special(self):
+        """Special methods of devices are passed through, and timed."""
+        console = _Console()
+        proxy = self.trace.device("con", console)
+        proxy["CAN_PWR_EN"] = True
+        self.assertTrue(proxy["CAN_PWR_EN"])
+        with proxy:
+            self.assertTrue(console.values["entered"])
+        self.assertFalse(console.values["entered"])
+        self.assertEqual(
+            [
+                "con.__setitem__",
+                "con.__getitem__",
+                "con.__enter__",
+                "con.__exit__",
+            ],
+            [event[1] for event in self.trace.events],
+        )
+
+    def test_measurement(self):
+        """Only measurements are timed."""
+        mes = MagicMock(name="Measurement")
+        proxy = self.trace.measurement("dmm_vout", mes)
+        proxy.position_fail_disabled()
+        proxy.measure(timeout=5)
+        proxy(timeout=2)
+        self.assertEqual(
+            [("measure", "dmm_vout.measure"), ("measure", "dmm_vout")],
+            [event[:2] for event in self.trace.events],
+        )
+
+    def test_error(self):
+        """A call that raises an exception is still timed."""
+        device = MagicMock(name="Relay")
+        device.set_on.side_effect = ValueError
+        with self.assertRaises(ValueError):
+            self.trace.device("rla", device).set_on()
+        self.assertEqual(1, len(self.trace.events))
+
+    def test_steps(self):
+        """Steps end when the next one starts."""
+        self.trace.step("PowerUp")
+        self.trace.step("Program")
+        self.trace.step(None)
+        self.assertEqual(
+            ["PowerUp", "Program"], [event[1] for event in self.trace.events]
+        )
+        self.assertEqual(self.trace.events[0][3], self.trace.events[1][2])
+
+
+class Telemetry(unittest.TestCase):
+    """Telemetry test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.directory = pathlib.Path(tmpdir.name)
+        self.addCleanup(share.telemetry.Telemetry.enable, None)
+
+    def test_disabled(self):
+        """No telemetry unless enabled."""
+        self.assertIsNone(share.telemetry.Telemetry.create())
+
+    @patch("share.telemetry.dispatcher")
+    def test_write(self, dispatcher):
+        """A trace file is written for the UUT."""
+        share.telemetry.Telemetry.enable(self.directory)
+        recorder = share.telemetry.Telemetry.create()
+        recorder.start()
+        receiver = dispatcher.connect.call_args[0][0]
+        receiver(name="PowerUp")
+        recorder.trace.device("dmm", MagicMock()).configure()
+        uut = MagicMock(sernum="A2208150001")
+        recorder.stop([uut])
+        dispatcher.disconnect.assert_called_once()
+        (path,) = self.directory.iterdir()
+        self.assertTrue(path.name.startswith("A2208150001_"))
+        with path.open(newline="") as fin:
+            rows = list(csv.reader(fin))
+        self.assertEqual(["kind", "name", "start", "end"], rows[0])
+        self.assertEqual(
+            [["step", "PowerUp"], ["device", "dmm.configure"]],
+            [row[:2] for row in rows[1:]],
+        )
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Copyright 2026 SETEC Pty Ltd.
+"""UnitTest for the trend module."""
+
+import pathlib
+import tempfile
+import time
+import unittest
+
+import share
+
+
+class TrendStore(unittest.TestCase):
+    """TrendStore test suite."""
+
+    def setUp(self):
+        """Per-Test setup."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.store = share.trend.TrendStore(
+            pathlib.Path(tmpdir.name) / "trend.sqlite",
+            max_readings=10,
+            window=4,
+            min_baseline=4,
+        )
+        self.addCleanup(share.trend.TrendStore.enable, None)
+        self.start = time.time() - 3 * 86400
+
+    def _append(self, values, start=0):
+        """Append one reading per hour, over the last few days."""
+        for num, value in enumerate(values, start):
+            self.store.append((("Vout", value),), when=self.start + num * 3600)
+
+    def test_disabled(self):
+        """No store unless enabled."""
+        self.assertIsNone(share.trend.TrendStore.create())
+        share.trend.TrendStore.enable("trend.sqlite")
+        self.assertIsNotNone(share.trend.TrendStore.create())
+
+    def test_statistics(self):
+        """Rolling statistics of the latest readings."""
+        self._append((1.0, 2.0, 4.0, 6.0, 8.0))
+        count, mean, sigma = self.store.statistics("Vout")
+        self.assertEqual(4, count)
+        self.assertAlmostEqual(5.0, mean)
+        self.assertAlmostEqual(2.5819889, sigma)
+        self.assertIsNone(self.store.statistics("Other"))
+
+    def test_violations(self):
+        """Drift is found by the control rules."""
+        self._append((5.0, 5.1, 4.9, 5.0, 5.1, 4.9, 5.0, 5.0))
+        self.assertIsNotNone(self.store.control_limits("Vout"))
+        self.assertEqual([], self.store.violations("Vout"))
+        self._append((5.3,), start=8)
+        self.assertEqual(1, len(self.store.violations("Vout")))
+        self._append((5.05, 5.06, 5.07), start=9)
+        self.assertEqual(1, len(self.store.violations("Vout")))
+
+    def test_compact(self):
+        """Old readings are folded into daily summaries."""
+        self._append(range(50))
+        self.assertEqual(10, len(self.store.latest("Vout", 100)))
+        days = self.store.daily("Vout")
+        self.assertEqual(50, sum(day[1] for day in days))
+        self.assertAlmostEqual(24.5, sum(day[1] * day[2] for day in days) / 50)
+
+    def test_order(self):
+        """Readings of the same time are kept in the order appended."""
+        self.store.append(
+            (("Vout", 1.0), ("Iout", 9.0), ("Vout", 2.0), ("Vout", 3.0)),
+            when=self.start,
+        )
+        self.assertEqual([2.0, 3.0], self.store.latest("Vout", 2))
+        self.assertEqual(["Iout", "Vout"], self.store.channels())
@@ -19,12 +19,24 @@ From the Python unittest help...
 For "Rerun Failed" unittest, loadTestsFromName is called with parameters:
     name="programs.test_XXXX", module="testsuite"
 
+Run from the command line, test modules can be spread across a pool of
+worker processes:
+    python testsuite.py --jobs 8
+
 """
 
+import argparse
+import concurrent.futures
 import logging
+import multiprocessing.util
+import os
+import sys
+import time
 import unittest
 
-from tests import programs, share  # for running individual tests
+from pydispatch import dispatcher
+
+from tests import data_feed, programs, share  # for running individual tests
 
 
 def suite():
@@ -33,15 +45,95 @@ def suite():
     @return TestSuite
 
     """
-    testnames = []
-    for name in share.__all__:
-        testnames.append("tests.share." + name)
-    for name in programs.__all__:
-        testnames.append("tests.programs." + name)
-    testsuite = unittest.defaultTestLoader.loadTestsFromNames(testnames)
+    testsuite = unittest.defaultTestLoader.loadTestsFromNames(module_names())
     return testsuite
 
 
+def module_names():
+    """All test module names.
+
+    @return List of dotted module names
+
+    """
+    return ["tests.share." + name for name in share.__all__] + [
+        "tests.programs." + name for name in programs.__all__
+    ]
+
+
+class _TimingResult(unittest.TestResult):
+    """TestResult that records the run time of each test."""
+
+    def __init__(self, *args, **kwargs):
+        """Create instance."""
+        super().__init__(*args, **kwargs)
+        self.timings = []  # List of (test id, seconds)
+        self._started = 0.0
+
+    def startTest(self, test):
+        """Start timing a test."""
+        super().startTest(test)
+        self._started = time.perf_counter()
+
+    def stopTest(self, test):
+        """Finish timing a test."""
+        self.timings.append((test.id(), time.perf_counter() - self._started))
+        super().stopTest(test)
+
+
+def _dispatcher_receivers():
+    """Count the pydispatch signal receivers left connected by tests.
+
+    Receivers of the shared UnitTester are not counted, and receivers it
+    has already removed as leaks are.
+
+    @return Number of receivers
+
+    """
+    connected = sum(
+        len(receivers)
+        for signals in dispatcher.connections.values()
+        for receivers in signals.values()
+    )
+    return connected - data_feed.POOL.receivers + data_feed.POOL.removed
+
+
+def _worker_setup():
+    """Setup a worker process.
+
+    The shared UnitTester of the worker is stopped as the worker exits.
+
+    """
+    Main.setup()
+    multiprocessing.util.Finalize(data_feed.POOL, data_feed.POOL.stop, exitpriority=10)
+
+
+def _run_module(name):
+    """Run the tests of one module (in a worker process).
+
+    @param name Dotted module name
+    @return Dictionary of results
+
+    """
+    receivers = _dispatcher_receivers()
+    started = time.perf_counter()
+    result = _TimingResult()
+    try:
+        unittest.defaultTestLoader.loadTestsFromName(name).run(result)
+    except Exception as exc:  # pylint: disable=broad-except
+        result.errors.append((None, "{0}: {1}".format(type(exc).__name__, exc)))
+    return {
+        "name": name,
+        "pid": os.getpid(),
+        "elapsed": time.perf_counter() - started,
+        "run": result.testsRun,
+        "failures": [(str(test), trace) for test, trace in result.failures],
+        "errors": [(str(test), trace) for test, trace in result.errors],
+        "skipped": len(result.skipped),
+        "timings": result.timings,
+        "leaked": _dispatcher_receivers() - receivers,
+    }
+
+
 class Main:
 
     # Configuration of console logger.
@@ -75,13 +167,127 @@ class Main:
                 log.setLevel(logging.INFO)
 
     @classmethod
-    def run(cls):
-        """Run the testsuite."""
+    def run(cls, names=None):
+        """Run the testsuite.
+
+        @param names Dotted test names, or None for all test modules
+
+        """
         cls.setup()
         runner = unittest.TextTestRunner()
-        testsuite = suite()
-        runner.run(testsuite)
+        if names is None:
+            testsuite = suite()
+        else:
+            testsuite = unittest.defaultTestLoader.loadTestsFromNames(names)
+        try:
+            runner.run(testsuite)
+        finally:
+            data_feed.POOL.stop()
+
+    @classmethod
+    def run_parallel(cls, jobs, names=None, slowest=10):
+        """Run test modules in a pool of worker processes.
+
+        Each module runs entirely within one worker. Receivers left
+        connected to pydispatch signals by a module are reported as leaks,
+        as they would see the signals of later modules in that worker.
+
+        @param jobs Number of worker processes
+        @param names Dotted module names, or None for all test modules
+        @param slowest Number of slowest modules & tests to report
+        @return True if all tests passed
+
+        """
+        cls.setup()
+        names = module_names() if names is None else names
+        started = time.perf_counter()
+        results = []
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs, initializer=_worker_setup
+        ) as executor:
+            for outcome in executor.map(_run_module, names):
+                results.append(outcome)
+                status = "ok"
+                if outcome["failures"] or outcome["errors"]:
+                    status = "FAIL"
+                print(
+                    "{0:<50} {1:>4} tests {2:>7.2f}s {3}".format(
+                        outcome["name"], outcome["run"], outcome["elapsed"], status
+                    ),
+                    file=sys.stderr,
+                )
+        return cls._report(results, time.perf_counter() - started, slowest)
+
+    @staticmethod
+    def _report(results, elapsed, slowest):
+        """Print a merged report of module results.
+
+        @param results List of result dictionaries from _run_module
+        @param elapsed Wall clock time of the run
+        @param slowest Number of slowest modules & tests to report
+        @return True if all tests passed
+
+        """
+        out = sys.stderr
+        problems = []
+        for outcome in results:
+            for kind, label in (("failures", "FAIL"), ("errors", "ERROR")):
+                for test, trace in outcome[kind]:
+                    problems.append(test)
+                    print("=" * 70, file=out)
+                    print("{0}: {1}".format(label, test), file=out)
+                    print("-" * 70, file=out)
+                    print(trace, file=out)
+        leaks = [outcome for outcome in results if outcome["leaked"] > 0]
+        for outcome in leaks:
+            print(
+                "LEAK: {0} left {1} signal receivers connected".format(
+                    outcome["name"], outcome["leaked"]
+                ),
+                file=out,
+            )
+        print("-" * 70, file=out)
+        print("Slowest modules:", file=out)
+        for outcome in sorted(results, key=lambda o: o["elapsed"], reverse=True)[
+            :slowest
+        ]:
+            print(
+                "  {0:>7.2f}s {1}".format(outcome["elapsed"], outcome["name"]), file=out
+            )
+        timings = [timing for outcome in results for timing in outcome["timings"]]
+        print("Slowest tests:", file=out)
+        for test, seconds in sorted(timings, key=lambda t: t[1], reverse=True)[
+            :slowest
+        ]:
+            print("  {0:>7.2f}s {1}".format(seconds, test), file=out)
+        total = sum(outcome["run"] for outcome in results)
+        busy = sum(outcome["elapsed"] for outcome in results)
+        print(
+            "Ran {0} tests in {1:.2f}s ({2:.2f}s of work in {3} workers)".format(
+                total,
+                elapsed,
+                busy,
+                len({outcome["pid"] for outcome in results}),
+            ),
+            file=out,
+        )
+        print("FAILED ({0})".format(len(problems)) if problems else "OK", file=out)
+        return not problems
 
 
 if __name__ == "__main__":
-    Main.run()
+    parser = argparse.ArgumentParser(description="Run the unittests.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="number of worker processes (0 to run in this process)",
+    )
+    parser.add_argument(
+        "names", nargs="*", help="dotted test names (modules with --jobs)"
+    )
+    args = parser.parse_args()
+    if args.jobs:
+        sys.exit(0 if Main.run_parallel(args.jobs, args.names or None) else 1)
+    Main.run(args.names or None)